@@ -3,7 +3,13 @@ from discord.ext import commands
 import os
 from dotenv import load_dotenv
 import asyncio
+import sys
+import time
+from contextlib import contextmanager
 from database import Database
+from config import Config
+from utils.command_sync import command_tree_fingerprint, FINGERPRINT_KEY
+from utils.startup_profile import measure_imports, print_import_breakdown
 
 # Load environment variables
 load_dotenv()
@@ -18,31 +24,69 @@ intents.members = True
 
 bot = commands.Bot(command_prefix='!', intents=intents)
 
-# Initialize database
-db = Database()
+# Initialize database - one shared service for every cog and autocomplete
+# (cogs use bot.db, autocompletes use interaction.client.db).
+# Started/closed in main() around the bot's lifetime.
+db = Database(
+    Config.DATABASE_PATH,
+    pool_size=Config.DATABASE_POOL_SIZE,
+    pragma_profile=Config.DATABASE_PRAGMA_PROFILE,
+    currency_flush_interval=Config.CURRENCY_FLUSH_SECONDS,
+    roster_cache_size=Config.ROSTER_CACHE_MAX_WRESTLERS
+)
+bot.db = db
 
-@bot.event
-async def on_ready():
-    """Called when bot is ready"""
-    print(f'✅ Logged in as {bot.user.name} ({bot.user.id})')
-    print('━' * 50)
-    
-    # Initialize database
-    await db.initialize()
-    print('✅ Database initialized')
+@contextmanager
+def timed(phase: str):
+    """Print how long a startup phase took"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        print(f'⏱️ {phase}: {(time.perf_counter() - started) * 1000:.0f} ms')
+
+async def sync_commands():
+    """Sync slash commands only when the command tree changed since the last sync"""
+    fingerprint = command_tree_fingerprint(bot.tree, bot.application_id)
+    if not Config.FORCE_COMMAND_SYNC and await db.get_bot_state(FINGERPRINT_KEY) == fingerprint:
+        print('✅ Slash commands unchanged - skipping sync')
+        return
     
-    # Sync slash commands
     try:
         synced = await bot.tree.sync()
+        await db.set_bot_state(FINGERPRINT_KEY, fingerprint)
         print(f'✅ Synced {len(synced)} slash commands')
     except Exception as e:
+        # Fingerprint not stored, so the next startup tries again
         print(f'❌ Failed to sync commands: {e}')
+
+@bot.event
+async def setup_hook():
+    """Runs once after login, before connecting to the gateway"""
+    started = time.perf_counter()
+    
+    with timed('Database started'):
+        await db.start()
+    with timed('Database initialized'):
+        await db.initialize()
+    with timed('Cogs loaded'):
+        await load_cogs()
+    with timed('Slash commands checked'):
+        await sync_commands()
+    
+    print(f'⏱️ Setup finished in {(time.perf_counter() - started) * 1000:.0f} ms')
+
+@bot.event
+async def on_ready():
+    """Called when bot is ready (again after every gateway reconnect)"""
+    print(f'✅ Logged in as {bot.user.name} ({bot.user.id})')
+    print('━' * 50)
     
     # Set bot status
     await bot.change_presence(
         activity=discord.Activity(
             type=discord.ActivityType.watching,
-            name="WWE matches | /help"
+            name=Config.BOT_STATUS
         )
     )
     print('━' * 50)
@@ -58,22 +102,57 @@ async def on_guild_remove(guild):
     """Called when bot leaves a server"""
     print(f'📤 Left server: {guild.name} (ID: {guild.id})')
 
+COGS = ['cogs.admin', 'cogs.wrestler', 'cogs.currency', 'cogs.shop', 'cogs.matches', 'cogs.championships', 'cogs.events', 'cogs.level_system', 'cogs.daily_rewards','cogs.queue','cogs.inactivity','cogs.rivalries']
+
+async def load_cog(cog: str) -> float:
+    """Load one cog file and return how long it took (ms)"""
+    started = time.perf_counter()
+    try:
+        await bot.load_extension(cog)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f'✅ Loaded {cog} ({elapsed:.0f} ms)')
+    except Exception as e:
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f'❌ Failed to load {cog}: {e}')
+    return elapsed
+
 async def load_cogs():
-    """Load all cog files"""
-    cogs = ['cogs.admin', 'cogs.wrestler', 'cogs.currency', 'cogs.shop', 'cogs.matches', 'cogs.championships', 'cogs.events', 'cogs.level_system', 'cogs.daily_rewards','cogs.queue','cogs.inactivity','cogs.rivalries']
-    
-    for cog in cogs:
-        try:
-            await bot.load_extension(cog)
-            print(f'✅ Loaded {cog}')
-        except Exception as e:
-            print(f'❌ Failed to load {cog}: {e}')
+    """Load all cog files (they don't depend on each other, so all at once)"""
+    return dict(zip(COGS, await asyncio.gather(*(load_cog(cog) for cog in COGS))))
 
 async def main():
     """Main bot startup"""
     async with bot:
-        await load_cogs()
-        await bot.start(TOKEN)
+        try:
+            # Database, cogs and command sync are set up in setup_hook()
+            await bot.start(TOKEN)
+        finally:
+            await db.close()
+
+async def profile_startup():
+    """Time imports and setup without connecting to Discord (python bot.py --profile-startup)"""
+    print('━' * 50)
+    print_import_breakdown(measure_imports(COGS), COGS)
+    print('━' * 50)
+    
+    async with bot:
+        try:
+            with timed('Database started'):
+                await db.start()
+            with timed('Database initialized'):
+                await db.initialize()
+            with timed('Cogs loaded'):
+                load_times = await load_cogs()
+        finally:
+            await db.close()
+    
+    print('━' * 50)
+    print('⏱️ Slowest cogs to load (import + setup, shared imports counted once):')
+    for cog, elapsed in sorted(load_times.items(), key=lambda item: item[1], reverse=True):
+        print(f'  {cog:<28} {elapsed:>8.1f} ms')
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    if '--profile-startup' in sys.argv:
+        asyncio.run(profile_startup())
+    else:
+        asyncio.run(main())
@@ -1,23 +1,22 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from database import Database
 from typing import Optional, List
+from database import INDEXES
 
 # Autocomplete for wrestlers
 async def wrestler_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
-    db = Database()
-    wrestlers = await db.get_all_wrestlers(interaction.guild_id)
-    if not wrestlers:
+    db = interaction.client.db
+    wrestlers = await db.search_names(interaction.guild_id, "wrestlers", current)
+    if not wrestlers and not current:
         return [app_commands.Choice(name="(No wrestlers found)", value="none")]
-    filtered = [w for w in wrestlers if current.lower() in w['name'].lower()][:25]
-    return [app_commands.Choice(name=w['name'], value=w['name']) for w in filtered]
+    return [app_commands.Choice(name=w['name'], value=w['name']) for w in wrestlers]
 
 
 class Admin(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     
     # Create command group
     admin_group = app_commands.Group(name="admin", description="Admin commands for server management")
@@ -143,8 +142,7 @@ class Admin(commands.Cog):
         """Give currency bonus to a wrestler"""
         
         # Get wrestler
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        wrestler = next((w for w in all_wrestlers if w['name'].lower() == wrestler_name.lower()), None)
+        wrestler = await self.db.get_wrestler_by_name(interaction.guild_id, wrestler_name)
         
         if not wrestler:
             await interaction.response.send_message(
@@ -217,6 +215,69 @@ class Admin(commands.Cog):
                 ephemeral=True
             )
 
+    
+    @admin_group.command(name="db_indexes", description="Show database indexes and their sizes")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def db_indexes(self, interaction: discord.Interaction):
+        """Report which database indexes exist and how big they are"""
+        
+        indexes = await self.db.get_index_stats()
+        
+        lines = []
+        total = 0
+        for index in indexes:
+            if index['size_bytes'] is None:
+                size = "?"
+            else:
+                size = f"{index['size_bytes'] / 1024:,.0f} KB"
+                total += index['size_bytes']
+            
+            tags = []
+            if index['is_partial']:
+                tags.append("partial")
+            if index['is_automatic']:
+                tags.append("auto")
+            tag_text = f" *({', '.join(tags)})*" if tags else ""
+            
+            lines.append(f"`{index['name']}` on **{index['table']}** - {size}{tag_text}")
+        
+        embed = discord.Embed(
+            title="🗂️ Database Indexes",
+            description="\n".join(lines)[:4000] or "No indexes found.",
+            color=discord.Color.blue()
+        )
+        
+        missing = [name for name, table, _, _ in INDEXES if name not in {i['name'] for i in indexes}]
+        if missing:
+            embed.add_field(
+                name="⚠️ Not Created",
+                value="\n".join(f"`{name}`" for name in missing)[:1024],
+                inline=False
+            )
+        
+        embed.set_footer(text=f"{len(indexes)} indexes • {total / 1024:,.0f} KB total")
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @admin_group.command(name="db_stats", description="Show how many reads were shared between identical requests")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def db_stats(self, interaction: discord.Interaction):
+        """Report request coalescing counters since startup"""
+        
+        stats = self.db.get_singleflight_stats()
+        shared = (stats['coalesced'] / stats['calls'] * 100) if stats['calls'] else 0
+        
+        embed = discord.Embed(
+            title="📊 Database Read Coalescing",
+            color=discord.Color.blue()
+        )
+        embed.add_field(name="Read Calls", value=f"{stats['calls']:,}", inline=True)
+        embed.add_field(name="Queries Run", value=f"{stats['executed']:,}", inline=True)
+        embed.add_field(name="Shared", value=f"{stats['coalesced']:,} ({shared:.1f}%)", inline=True)
+        embed.set_footer(text=f"{stats['in_flight']} queries in flight")
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
 
 async def setup(bot):
     await bot.add_cog(Admin(bot))
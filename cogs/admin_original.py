@@ -1,14 +1,13 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from database import Database
 from utils.helpers import create_pending_upgrades_embed
 from typing import Optional
 
 class Admin(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     
     @app_commands.command(name="setup", description="Initial server setup for the Wrestling Bot")
     @app_commands.checks.has_permissions(administrator=True)
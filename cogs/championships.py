@@ -30,20 +30,15 @@ async def championship_autocomplete(
     current: str
 ) -> List[app_commands.Choice[str]]:
     """Autocomplete for championship names"""
-    db = Database()
-    championships = await db.get_all_championships(interaction.guild_id)
+    db = interaction.client.db
+    championships = await db.search_names(interaction.guild_id, "championships", current)
     
-    if not championships:
+    if not championships and not current:
         return [app_commands.Choice(name="(No championships found)", value="none")]
     
-    filtered = [
-        c for c in championships 
-        if current.lower() in c['name'].lower()
-    ][:25]
-    
     return [
         app_commands.Choice(name=c['name'], value=c['name'])
-        for c in filtered
+        for c in championships
     ]
 
 # Autocomplete for wrestlers
@@ -52,27 +47,22 @@ async def wrestler_autocomplete(
     current: str
 ) -> List[app_commands.Choice[str]]:
     """Autocomplete for wrestler names"""
-    db = Database()
-    wrestlers = await db.get_all_wrestlers(interaction.guild_id)
+    db = interaction.client.db
+    wrestlers = await db.search_names(interaction.guild_id, "wrestlers", current)
     
-    if not wrestlers:
+    if not wrestlers and not current:
         return [app_commands.Choice(name="(No wrestlers found)", value="none")]
     
-    filtered = [
-        w for w in wrestlers 
-        if current.lower() in w['name'].lower()
-    ][:25]
-    
     return [
         app_commands.Choice(name=w['name'], value=w['name'])
-        for w in filtered
+        for w in wrestlers
     ]
 
 
 class Championships(commands.Cog):  # Keep same name
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     
     # Add command group
     championship_group = app_commands.Group(name="championship", description="Championship management")
@@ -212,8 +202,8 @@ class Championships(commands.Cog):  # Keep same name
             return
         
         # Get wrestlers
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        wrestler1_obj = next((w for w in all_wrestlers if w['name'].lower() == wrestler1.lower()), None)
+        found = await self.db.get_wrestlers_by_names(interaction.guild_id, [wrestler1, wrestler2])
+        wrestler1_obj = found.get(wrestler1.lower())
         
         if not wrestler1_obj:
             await interaction.response.send_message(
@@ -235,7 +225,7 @@ class Championships(commands.Cog):  # Keep same name
         # Get second wrestler for tag teams
         wrestler2_obj = None
         if wrestler2:
-            wrestler2_obj = next((w for w in all_wrestlers if w['name'].lower() == wrestler2.lower()), None)
+            wrestler2_obj = found.get(wrestler2.lower())
             if not wrestler2_obj:
                 await interaction.response.send_message(
                     f"❌ Wrestler '{wrestler2}' not found!",
@@ -576,12 +566,8 @@ class Championships(commands.Cog):  # Keep same name
                 champ_ids = json.loads(champ['current_champion_ids']) if isinstance(champ['current_champion_ids'], str) else champ['current_champion_ids']
             
                 # Get wrestler names
-                all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-                champ_names = []
-                for c_id in champ_ids:
-                    w = next((wr for wr in all_wrestlers if wr['id'] == c_id), None)
-                    if w:
-                        champ_names.append(w['name'])
+                wrestler_names = {w.id: w.name for w in await self.db.get_wrestler_names(interaction.guild_id)}
+                champ_names = [wrestler_names[c_id] for c_id in champ_ids if c_id in wrestler_names]
             
                 if champ_names:
                     champion_text = " & ".join(champ_names) if len(champ_names) > 1 else champ_names[0]
@@ -623,12 +609,8 @@ class Championships(commands.Cog):  # Keep same name
                 # Zusätzlicher Check ob Liste nicht leer
                 if champ_ids and len(champ_ids) > 0:  # ← NEU!
                     # Get wrestler names
-                    all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-                    champ_names = []
-                    for c_id in champ_ids:
-                        w = next((wr for wr in all_wrestlers if wr['id'] == c_id), None)
-                        if w:
-                            champ_names.append(w['name'])
+                    wrestler_names = {w.id: w.name for w in await self.db.get_wrestler_names(interaction.guild_id)}
+                    champ_names = [wrestler_names[c_id] for c_id in champ_ids if c_id in wrestler_names]
                 
                     if champ_names:
                         has_champions = True
@@ -1,13 +1,11 @@
 import discord
 from discord.ext import commands
-from database import Database
-from datetime import datetime, timedelta
 import random
 
 class Currency(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
@@ -32,31 +30,17 @@ class Currency(commands.Cog):
             if message.channel.id not in currency_channels:
                 return
         
-        # Check cooldown
-        last_earned = await self.db.get_last_currency_earned(message.guild.id, message.author.id)
-        
-        if last_earned:
-            last_time = datetime.fromisoformat(last_earned)
-            cooldown_seconds = settings['currency_cooldown']
-            
-            if datetime.utcnow() - last_time < timedelta(seconds=cooldown_seconds):
-                return  # Still on cooldown
-        
-        # Award currency to all user's wrestlers
-        wrestlers = await self.db.get_wrestlers_by_user(message.guild.id, message.author.id)
-        
-        if not wrestlers:
-            return  # No wrestlers to award
-        
         # Generate random currency amount
         amount = random.randint(settings['currency_min'], settings['currency_max'])
         
-        # Award to all wrestlers
-        for wrestler in wrestlers:
-            await self.db.update_wrestler_currency(wrestler['id'], amount)
-        
-        # Update cooldown
-        await self.db.update_currency_cooldown(message.guild.id, message.author.id)
+        # Award to all user's wrestlers (buffered in memory - cooldown and
+        # balances are saved to the database every few seconds)
+        credited = await self.db.accrue_chat_currency(
+            message.guild.id, message.author.id,
+            settings['currency_cooldown'], amount
+        )
+        if not credited:
+            return  # On cooldown or no wrestlers to award
         
         # Optional: Send a subtle notification (can be disabled)
         # Uncomment below if you want currency notifications
@@ -1,13 +1,12 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from database import Database
 from datetime import datetime
 
 class DailyRewards(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     
     @app_commands.command(name="daily", description="Claim your daily reward!")
     async def daily(self, interaction: discord.Interaction):
@@ -4,7 +4,6 @@ from discord.ext import commands
 from database import Database
 from datetime import datetime
 from typing import Optional, List
-import json
 
 # Match types
 MATCH_TYPES = [
@@ -61,28 +60,24 @@ async def is_admin_or_booker(interaction: discord.Interaction, db: Database) ->
 
 # Autocompletes
 async def template_autocomplete(interaction: discord.Interaction, current: str):
-    db = Database()
-    templates = await db.get_event_templates(interaction.guild_id)
-    filtered = [t for t in templates if current.lower() in t['name'].lower()][:25]
-    return [app_commands.Choice(name=f"{t['type']}: {t['name']}", value=t['name']) for t in filtered]
+    db = interaction.client.db
+    templates = await db.search_names(interaction.guild_id, "templates", current)
+    return [app_commands.Choice(name=f"{t['type']}: {t['name']}", value=t['name']) for t in templates]
 
 async def event_autocomplete(interaction: discord.Interaction, current: str):
-    db = Database()
-    events = await db.get_event_instances(interaction.guild_id, status='planned')
-    filtered = [e for e in events if current.lower() in e['full_name'].lower()][:25]
-    return [app_commands.Choice(name=e['full_name'], value=e['full_name']) for e in filtered]
+    db = interaction.client.db
+    events = await db.search_names(interaction.guild_id, "events", current)
+    return [app_commands.Choice(name=e['name'], value=e['name']) for e in events]
 
 async def wrestler_autocomplete(interaction: discord.Interaction, current: str):
-    db = Database()
-    wrestlers = await db.get_all_wrestlers(interaction.guild_id)
-    filtered = [w for w in wrestlers if current.lower() in w['name'].lower()][:25]
-    return [app_commands.Choice(name=w['name'], value=w['name']) for w in filtered]
+    db = interaction.client.db
+    wrestlers = await db.search_names(interaction.guild_id, "wrestlers", current)
+    return [app_commands.Choice(name=w['name'], value=w['name']) for w in wrestlers]
 
 async def championship_autocomplete(interaction: discord.Interaction, current: str):
-    db = Database()
-    championships = await db.get_all_championships(interaction.guild_id)
-    filtered = [c for c in championships if current.lower() in c['name'].lower()][:25]
-    return [app_commands.Choice(name=c['name'], value=c['name']) for c in filtered]
+    db = interaction.client.db
+    championships = await db.search_names(interaction.guild_id, "championships", current)
+    return [app_commands.Choice(name=c['name'], value=c['name']) for c in championships]
 
 async def match_type_autocomplete(interaction: discord.Interaction, current: str):
     """Autocomplete for match types"""
@@ -93,7 +88,7 @@ async def match_type_autocomplete(interaction: discord.Interaction, current: str
 class Events(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     event_group = app_commands.Group(name="event", description="Event and show management")
     
     @event_group.command(name="template", description="Create show/event template (Admin/Booker)")
@@ -216,11 +211,12 @@ class Events(commands.Cog):
             await interaction.response.send_message(f"❌ Event '{event}' not found!", ephemeral=True)
             return
         
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
+        names = [wrestler1, wrestler2, wrestler3, wrestler4, wrestler5, wrestler6]
+        found = await self.db.get_wrestlers_by_names(interaction.guild_id, names)
         participants = []
-        for name in [wrestler1, wrestler2, wrestler3, wrestler4, wrestler5, wrestler6]:
+        for name in names:
             if name:
-                w = next((wrestler for wrestler in all_wrestlers if wrestler['name'].lower() == name.lower()), None)
+                w = found.get(name.lower())
                 if not w:
                     await interaction.response.send_message(f"❌ Wrestler '{name}' not found!", ephemeral=True)
                     return
@@ -313,8 +309,7 @@ class Events(commands.Cog):
             return
         
         # Get ALL user's wrestlers
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        user_wrestlers = [w for w in all_wrestlers if w['user_id'] == interaction.user.id]
+        user_wrestlers = await self.db.get_wrestler_summaries(interaction.guild_id, interaction.user.id)
         
         if not user_wrestlers:
             await interaction.response.send_message(
@@ -339,7 +334,7 @@ class Events(commands.Cog):
         for wrestler in user_wrestlers:
             already_on_card = False
             for match in matches:
-                if wrestler['id'] in match['participants']:
+                if wrestler.id in match['participants']:
                     already_on_card = True
                     break
             if not already_on_card:
@@ -429,7 +424,7 @@ class Events(commands.Cog):
             embed.add_field(name="About", value=event['description'], inline=False)
         
         card_text = ""
-        all_wrestlers = await self.db.get_all_wrestlers(event['guild_id'])
+        wrestler_names = {w.id: w.name for w in await self.db.get_wrestler_names(event['guild_id'])}
         championships = await self.db.get_all_championships(event['guild_id'])
         
         for match in matches:
@@ -440,11 +435,7 @@ class Events(commands.Cog):
             
             if match['is_open_spot']:
                 # Get current participants in the open spot
-                participant_names = []
-                for p_id in match['participants']:
-                    w = next((wrestler for wrestler in all_wrestlers if wrestler['id'] == p_id), None)
-                    if w:
-                        participant_names.append(w['name'])
+                participant_names = [wrestler_names[p_id] for p_id in match['participants'] if p_id in wrestler_names]
                 
                 spots_filled = len(participant_names)
                 spots_total = match['spots_available']
@@ -463,11 +454,7 @@ class Events(commands.Cog):
                     card_text += f"**{format_participants(participant_names, match['match_type'])}**\n"
                     card_text += f"   *{match['match_type']}*\n"
             else:
-                participant_names = []
-                for p_id in match['participants']:
-                    w = next((wrestler for wrestler in all_wrestlers if wrestler['id'] == p_id), None)
-                    if w:
-                        participant_names.append(w['name'])
+                participant_names = [wrestler_names[p_id] for p_id in match['participants'] if p_id in wrestler_names]
                 
                 card_text += f"**{format_participants(participant_names, match['match_type'])}**\n"
                 card_text += f"   *{match['match_type']}*"
@@ -512,7 +499,7 @@ class Events(commands.Cog):
             )
         
         # Get data
-        all_wrestlers = await self.db.get_all_wrestlers(event['guild_id'])
+        wrestler_names = {w.id: w.name for w in await self.db.get_wrestler_names(event['guild_id'])}
         championships = await self.db.get_all_championships(event['guild_id'])
         
         main_events = [m for m in matches if m['is_main_event']]
@@ -526,11 +513,7 @@ class Events(commands.Cog):
                     main_text += "\n"  # Spacing between matches
                 
                 if match['is_open_spot']:
-                    participant_names = []
-                    for p_id in match['participants']:
-                        w = next((wrestler for wrestler in all_wrestlers if wrestler['id'] == p_id), None)
-                        if w:
-                            participant_names.append(w['name'])
+                    participant_names = [wrestler_names[p_id] for p_id in match['participants'] if p_id in wrestler_names]
                     
                     spots_filled = len(participant_names)
                     spots_total = match['spots_available']
@@ -545,11 +528,7 @@ class Events(commands.Cog):
                         main_text += f"**{format_participants(participant_names, match['match_type'])}**\n"
                         main_text += f"   *{match['match_type']}*\n"
                 else:
-                    participant_names = []
-                    for p_id in match['participants']:
-                        w = next((wrestler for wrestler in all_wrestlers if wrestler['id'] == p_id), None)
-                        if w:
-                            participant_names.append(w['name'])
+                    participant_names = [wrestler_names[p_id] for p_id in match['participants'] if p_id in wrestler_names]
                     
                     main_text += f"**{format_participants(participant_names, match['match_type'])}**\n"
                     
@@ -574,11 +553,7 @@ class Events(commands.Cog):
                     card_text += "\n"  # Blank line between matches for breathing room
                 
                 if match['is_open_spot']:
-                    participant_names = []
-                    for p_id in match['participants']:
-                        w = next((wrestler for wrestler in all_wrestlers if wrestler['id'] == p_id), None)
-                        if w:
-                            participant_names.append(w['name'])
+                    participant_names = [wrestler_names[p_id] for p_id in match['participants'] if p_id in wrestler_names]
                     
                     spots_filled = len(participant_names)
                     spots_total = match['spots_available']
@@ -591,11 +566,7 @@ class Events(commands.Cog):
                         card_text += f"**{format_participants(participant_names, match['match_type'])}**\n"
                         card_text += f"   *{match['match_type']}*\n"
                 else:
-                    participant_names = []
-                    for p_id in match['participants']:
-                        w = next((wrestler for wrestler in all_wrestlers if wrestler['id'] == p_id), None)
-                        if w:
-                            participant_names.append(w['name'])
+                    participant_names = [wrestler_names[p_id] for p_id in match['participants'] if p_id in wrestler_names]
                     
                     card_text += f"**{format_participants(participant_names, match['match_type'])}**\n"
                     
@@ -771,7 +742,7 @@ class Events(commands.Cog):
         if event['banner_url']:
             embed.set_thumbnail(url=event['banner_url'])
         
-        all_wrestlers = await self.db.get_all_wrestlers(event['guild_id'])
+        wrestler_names = {w.id: w.name for w in await self.db.get_wrestler_names(event['guild_id'])}
         championships = await self.db.get_all_championships(event['guild_id'])
         
         results_text = ""
@@ -786,18 +757,10 @@ class Events(commands.Cog):
             import json
             winner_ids = json.loads(match_record['winner_ids']) if isinstance(match_record['winner_ids'], str) else match_record['winner_ids']
             
-            winner_names = []
-            for w_id in winner_ids:
-                w = next((wrestler for wrestler in all_wrestlers if wrestler['id'] == w_id), None)
-                if w:
-                    winner_names.append(w['name'])
+            winner_names = [wrestler_names[w_id] for w_id in winner_ids if w_id in wrestler_names]
             # Get loser names           
             loser_ids = json.loads(match_record['loser_ids']) if isinstance(match_record['loser_ids'], str) else match_record['loser_ids']
-            loser_names = []
-            for l_id in loser_ids:
-                l = next((wrestler for wrestler in all_wrestlers if wrestler['id'] == l_id), None)
-                if l:
-                    loser_names.append(l['name'])
+            loser_names = [wrestler_names[l_id] for l_id in loser_ids if l_id in wrestler_names]
 
             results_text += f"\n**{match['match_order']}.** "
             if match['is_main_event']:
@@ -843,7 +806,7 @@ class Events(commands.Cog):
         if event['banner_url']:
             embed.set_thumbnail(url=event['banner_url'])
         
-        all_wrestlers = await self.db.get_all_wrestlers(event['guild_id'])
+        wrestler_names = {w.id: w.name for w in await self.db.get_wrestler_names(event['guild_id'])}
         championships = await self.db.get_all_championships(event['guild_id'])
         
         main_events = [m for m in matches if m['is_main_event']]
@@ -862,11 +825,7 @@ class Events(commands.Cog):
                 import json
                 winner_ids = json.loads(match_record['winner_ids']) if isinstance(match_record['winner_ids'], str) else match_record['winner_ids']
                 
-                winner_names = []
-                for w_id in winner_ids:
-                    w = next((wrestler for wrestler in all_wrestlers if wrestler['id'] == w_id), None)
-                    if w:
-                        winner_names.append(w['name'])
+                winner_names = [wrestler_names[w_id] for w_id in winner_ids if w_id in wrestler_names]
                 
                 main_text += f"\n🏆 **{' & '.join(winner_names)}** WIN"
                 
@@ -902,11 +861,7 @@ class Events(commands.Cog):
                 import json
                 winner_ids = json.loads(match_record['winner_ids']) if isinstance(match_record['winner_ids'], str) else match_record['winner_ids']
                 
-                winner_names = []
-                for w_id in winner_ids:
-                    w = next((wrestler for wrestler in all_wrestlers if wrestler['id'] == w_id), None)
-                    if w:
-                        winner_names.append(w['name'])
+                winner_names = [wrestler_names[w_id] for w_id in winner_ids if w_id in wrestler_names]
                 
                 card_text += f"→ **{' & '.join(winner_names)}** win"
                 
@@ -1096,15 +1051,10 @@ class Step3_MatchSelect(discord.ui.Select):
             return
         
         # Get participants
-        all_wrestlers = await self.parent_cog.db.get_all_wrestlers(interaction.guild_id)
+        wrestler_names = {w.id: w.name for w in await self.parent_cog.db.get_wrestler_names(interaction.guild_id)}
         
-        participant_names = []
-        participant_ids = []
-        for p_id in match['participants']:
-            w = next((wrestler for wrestler in all_wrestlers if wrestler['id'] == p_id), None)
-            if w:
-                participant_names.append(w['name'])
-                participant_ids.append(w['id'])
+        participant_ids = [p_id for p_id in match['participants'] if p_id in wrestler_names]
+        participant_names = [wrestler_names[p_id] for p_id in participant_ids]
         
         if not participant_names:
             await interaction.response.edit_message(
@@ -1272,74 +1222,6 @@ class Step6_RatingSelect(discord.ui.Select):
         self.loser_names = loser_names
         self.finish_type = finish_type
     
-    async def award_xp(self, winner_ids, loser_ids, championship_id, rating):
-        """Award XP to all participants based on match conditions"""
-        results = []
-        
-        # Check if main event
-        is_main_event = self.match.get('is_main_event', False)
-
-        # Check for rivalry
-        all_participants = winner_ids + loser_ids
-        rivalry = await self.parent_cog.db.check_rivalry_between_wrestlers(all_participants)
-        rivalry_bonus = 0
-        
-        if rivalry:
-            # Update rivalry stats
-            await self.parent_cog.db.update_rivalry_after_match(rivalry['id'], winner_ids, loser_ids)
-            rivalry_bonus = 0.10  # 10% bonus
-            self.has_rivalry = True
-        else:
-            self.has_rivalry = False
-       
-        # Award to winners
-        for i, winner_id in enumerate(winner_ids):
-            xp = 50  # Base win XP
-            
-            # Main event bonus
-            if self.match.get('is_main_event'):
-                xp += 25
-            
-            # Championship bonus
-            if championship_id:
-                xp += 100
-            
-            # Rating bonus
-            if rating:
-                if rating >= 5.0:
-                    xp += 50
-                elif rating >= 4.5:
-                    xp += 40
-                elif rating >= 4.0:
-                    xp += 30
-                elif rating >= 3.5:
-                    xp += 20
-                elif rating >= 3.0:
-                    xp += 10
-            
-            # Award XP
-            result = await self.parent_cog.db.add_xp(winner_id, xp)
-            if result:
-                result['name'] = self.winner_names[i] if i < len(self.winner_names) else "Wrestler"
-                results.append(result)
-        
-        # Award to losers (participation XP)
-        for i, loser_id in enumerate(loser_ids):
-            xp = 10  # Base participation
-            
-            if self.match.get('is_main_event'):
-                xp += 25
-            
-            if championship_id:
-                xp += 100  # Still get title match XP
-            
-            result = await self.parent_cog.db.add_xp(loser_id, xp)
-            if result:
-                result['name'] = self.loser_names[i] if i < len(self.loser_names) else "Wrestler"
-                results.append(result)
-        
-        return results
-    
     async def callback(self, interaction: discord.Interaction):
         rating_value = float(self.values[0]) if self.values[0] != "0" else None
         
@@ -1348,92 +1230,24 @@ class Step6_RatingSelect(discord.ui.Select):
         
         # NOW RECORD THE MATCH!
         try:
-            # Handle championship logic if this is a title match
-            championship_id = self.match.get('championship_id')
-            title_changed = False
-            new_champion_names = None
-            
-            if championship_id:
-                # Get championship
-                champ_obj = await self.parent_cog.db.get_championship_by_id(championship_id)
-                is_tag_team = champ_obj['is_tag_team'] if champ_obj else False
-                
-                # Get current champion(s)
-                current_champion_ids = []
-                if champ_obj and champ_obj.get('current_champion_ids'):
-                    current_champion_ids = json.loads(champ_obj['current_champion_ids']) if isinstance(champ_obj['current_champion_ids'], str) else champ_obj['current_champion_ids']
-                elif champ_obj and champ_obj.get('current_champion_id'):
-                    current_champion_ids = [champ_obj['current_champion_id']]
-                
-                # Check if ALL current champions lost
-                if current_champion_ids:
-                    all_champs_lost = all(champ_id in self.loser_ids for champ_id in current_champion_ids)
-                    
-                    if all_champs_lost:
-                        # TITLE CHANGE!
-                        title_changed = True
-                        
-                        # Determine new champions
-                        if is_tag_team and len(self.winner_ids) >= 2:
-                            new_champ_ids = self.winner_ids[:2]
-                            new_champion_names = f"{self.winner_names[0]} & {self.winner_names[1]}"
-                        else:
-                            new_champ_ids = [self.winner_ids[0]]
-                            new_champion_names = self.winner_names[0]
-                        
-                        # End old reigns
-                        for _ in current_champion_ids:
-                            await self.parent_cog.db.end_title_reign(championship_id)
-                        
-                        # Start new reigns
-                        for i, new_champ_id in enumerate(new_champ_ids):
-                            await self.parent_cog.db.start_title_reign(
-                                championship_id=championship_id,
-                                wrestler_id=new_champ_id,
-                                wrestler_name=self.winner_names[i] if i < len(self.winner_names) else self.winner_names[0]
-                            )
-                        
-                        # Update current champions
-                        await self.parent_cog.db.update_current_champions(championship_id, new_champ_ids)
-                    
-                    elif any(champ_id in self.winner_ids for champ_id in current_champion_ids):
-                        # Successful defense
-                        await self.parent_cog.db.increment_title_defense(championship_id)
-            
-            # Record the match
-            match_id = await self.parent_cog.db.record_match(
+            # Titles, match, records, rivalry, XP and the card link all land in one commit
+            result = await self.parent_cog.db.record_event_match(
                 guild_id=interaction.guild_id,
+                event_instance_id=self.event['id'],
+                event_match_id=self.match['id'],
+                match_type=self.match['match_type'],
                 winner_ids=self.winner_ids,
                 winner_names=self.winner_names,
                 loser_ids=self.loser_ids,
                 loser_names=self.loser_names,
-                match_type=self.match['match_type'],
                 finish_type=self.finish_type,
                 rating=rating_value,
-                championship_id=championship_id,
-                event_instance_id=self.event['id'],
-                notes=None
-            )
-            
-            # Update wrestler records
-            for w_id in self.winner_ids:
-                await self.parent_cog.db.update_wrestler_record(w_id, won=True)
-            for l_id in self.loser_ids:
-                await self.parent_cog.db.update_wrestler_record(l_id, won=False)
-            
-            # Award XP
-            xp_results = await self.award_xp(
-                self.winner_ids, self.loser_ids, 
-                championship_id, rating_value
-            )
-            
-            # Link to event match
-            await self.parent_cog.db.link_match_to_event_match(
-                self.event['id'],
-                match_id,
-                self.match['match_type'],
-                self.winner_ids + self.loser_ids
+                championship_id=self.match.get('championship_id'),
+                is_main_event=bool(self.match.get('is_main_event', False))
             )
+            title_changed = result['title_changed']
+            new_champion_names = result['new_champion_names']
+            xp_results = result['xp_results']
             
             # Success embed
             if title_changed:
@@ -1462,13 +1276,13 @@ class Step6_RatingSelect(discord.ui.Select):
             # Show XP and level ups
             if xp_results:
                 xp_summary = []
-                has_rivalry = getattr(self, 'has_rivalry', False)
+                has_rivalry = result['has_rivalry']
                 
-                for result in xp_results:
-                    if result['leveled_up']:
-                        xp_summary.append(f"🎉 **{result['name']}** → Level {result['new_level']}!")
+                for xp_result in xp_results:
+                    if xp_result['leveled_up']:
+                        xp_summary.append(f"🎉 **{xp_result['name']}** → Level {xp_result['new_level']}!")
                     else:
-                        xp_summary.append(f"+{result['xp_gained']} XP for {result['name']}")
+                        xp_summary.append(f"+{xp_result['xp_gained']} XP for {xp_result['name']}")
                 
                 if xp_summary:
                     xp_title = "⚔️ Experience (Rivalry +10%)" if has_rivalry else "Experience"
@@ -1488,81 +1302,6 @@ class Step6_RatingSelect(discord.ui.Select):
                 content=f"❌ Error recording match: {str(e)}",
                 ephemeral=True
             )
-    async def award_xp(self, winner_ids, loser_ids, championship_id, rating):
-        """Award XP to all participants based on match conditions"""
-        results = []
-        
-        # Check if main event
-        is_main_event = self.match.get('is_main_event', False)
-        
-        # Award XP to WINNERS
-        for winner_id, winner_name in zip(winner_ids, self.winner_names):
-            xp = 50  # Base win XP
-            
-            # Main event bonus
-            if is_main_event:
-                xp += 25
-            
-            # Championship bonus
-            if championship_id:
-                xp += 100  # Title match bonus
-            
-            # Rating bonus
-            if rating:
-                if rating >= 5.0:
-                    xp += 50
-                elif rating >= 4.5:
-                    xp += 40
-                elif rating >= 4.0:
-                    xp += 30
-                elif rating >= 3.5:
-                    xp += 20
-                elif rating >= 3.0:
-                    xp += 10
-            
-            # Rivalry bonus (10%)
-            if rivalry:
-                xp = int(xp * (1 + rivalry_bonus))
-            
-            # Award XP and check for level up
-            level_result = await self.parent_cog.db.add_xp(winner_id, xp)
-            
-            results.append({
-                'name': winner_name,
-                'xp_gained': xp,
-                'leveled_up': level_result is not None,
-                'new_level': level_result['new_level'] if level_result else None,
-                'rivalry_bonus': rivalry is not None  # Flag for display
-            })
-        
-        # Award XP to LOSERS (participation XP)
-        for loser_id, loser_name in zip(loser_ids, self.loser_names):
-            xp = 10  # Base participation XP
-            
-            # Main event bonus (still get it for participating)
-            if is_main_event:
-                xp += 25
-            
-            # Championship bonus (still valuable experience)
-            if championship_id:
-                xp += 100
-            
-            # Rivalry bonus (10%)
-            if rivalry:
-                xp = int(xp * (1 + rivalry_bonus))
-            
-            # Award XP and check for level up
-            level_result = await self.parent_cog.db.add_xp(loser_id, xp)
-            
-            results.append({
-                'name': loser_name,
-                'xp_gained': xp,
-                'leveled_up': level_result is not None,
-                'new_level': level_result['new_level'] if level_result else None,
-                'rivalry_bonus': rivalry is not None  # Flag for display
-            })
-        
-        return results
 
 class ChannelSelectView(discord.ui.View):
     def __init__(self, parent_cog, template_type, name, description, default_time, banner_url):
@@ -1627,9 +1366,9 @@ class WrestlerSelect(discord.ui.Select):
         options = []
         for wrestler in available_wrestlers:
             options.append(discord.SelectOption(
-                label=wrestler['name'],
-                description=f"{wrestler['archetype']} - {wrestler['weight_class']}",
-                value=str(wrestler['id'])
+                label=wrestler.name,
+                description=f"{wrestler.archetype} - {wrestler.weight_class}",
+                value=str(wrestler.id)
             ))
         
         super().__init__(placeholder="Choose your wrestler...", options=options, min_values=1, max_values=1)
@@ -1640,7 +1379,7 @@ class WrestlerSelect(discord.ui.Select):
     
     async def callback(self, interaction: discord.Interaction):
         wrestler_id = int(self.values[0])
-        wrestler = next((w for w in self.available_wrestlers if w['id'] == wrestler_id), None)
+        wrestler = next((w for w in self.available_wrestlers if w.id == wrestler_id), None)
         
         if not wrestler:
             await interaction.response.edit_message(content="❌ Wrestler not found!", view=None)
@@ -1648,7 +1387,7 @@ class WrestlerSelect(discord.ui.Select):
         
         # Now show match selection
         await interaction.response.edit_message(
-            content=f"**{wrestler['name']}** - Select match to join:",
+            content=f"**{wrestler.name}** - Select match to join:",
             view=ApplyView(self.parent_cog, self.event_id, wrestler, self.open_matches)
         )
 
@@ -1682,7 +1421,7 @@ class ApplySelect(discord.ui.Select):
         match_id = int(self.values[0])
         
         try:
-            await self.parent_cog.db.apply_for_match(match_id, self.wrestler['id'], interaction.user.id)
+            await self.parent_cog.db.apply_for_match(match_id, self.wrestler.id, interaction.user.id)
             
             # Get event to update announcement
             event = await self.parent_cog.db.get_event_instance_by_id(self.event_instance_id)
@@ -1713,7 +1452,7 @@ class ApplySelect(discord.ui.Select):
                         pass  # No permission to edit, no problem
             
             await interaction.response.edit_message(
-                content=f"✅ **{self.wrestler['name']}** has been added to the match!\n🔄 Event announcement updated.",
+                content=f"✅ **{self.wrestler.name}** has been added to the match!\n🔄 Event announcement updated.",
                 view=None
             )
         except ValueError as e:
@@ -1,25 +1,23 @@
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
-from database import Database
 from datetime import datetime, timedelta
 from typing import Optional, List
 
 
 # Autocomplete for wrestlers
 async def wrestler_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
-    db = Database()
-    wrestlers = await db.get_all_wrestlers(interaction.guild_id)
-    if not wrestlers:
+    db = interaction.client.db
+    wrestlers = await db.search_names(interaction.guild_id, "wrestlers", current)
+    if not wrestlers and not current:
         return [app_commands.Choice(name="(No wrestlers found)", value="none")]
-    filtered = [w for w in wrestlers if current.lower() in w['name'].lower()][:25]
-    return [app_commands.Choice(name=w['name'], value=w['name']) for w in filtered]
+    return [app_commands.Choice(name=w['name'], value=w['name']) for w in wrestlers]
 
 
 class Inactivity(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
         self.inactivity_check.start()
     
     def cog_unload(self):
@@ -237,8 +235,7 @@ class Inactivity(commands.Cog):
         
         if wrestler:
             # ===== SPECIFIC WRESTLER =====
-            all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-            wrestler_obj = next((w for w in all_wrestlers if w['name'].lower() == wrestler.lower()), None)
+            wrestler_obj = await self.db.get_wrestler_by_name(interaction.guild_id, wrestler)
             
             if not wrestler_obj:
                 await interaction.response.send_message(f"❌ '{wrestler}' not found!", ephemeral=True)
@@ -317,8 +314,7 @@ class Inactivity(commands.Cog):
     ):
         """Toggle wrestler between active and inactive"""
         
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        wrestler_obj = next((w for w in all_wrestlers if w['name'].lower() == wrestler.lower()), None)
+        wrestler_obj = await self.db.get_wrestler_by_name(interaction.guild_id, wrestler)
         
         if not wrestler_obj:
             await interaction.response.send_message(f"❌ '{wrestler}' not found!", ephemeral=True)
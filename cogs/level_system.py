@@ -1,34 +1,31 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from database import Database
 from typing import Optional
 
 # Autocomplete for wrestlers
 async def wrestler_autocomplete(interaction: discord.Interaction, current: str):
-    db = Database()
-    wrestlers = await db.get_all_wrestlers(interaction.guild_id)
-    if not wrestlers:
+    db = interaction.client.db
+    wrestlers = await db.search_names(interaction.guild_id, "wrestlers", current)
+    if not wrestlers and not current:
         return [app_commands.Choice(name="(No wrestlers found)", value="none")]
-    filtered = [w for w in wrestlers if current.lower() in w['name'].lower()][:25]
-    return [app_commands.Choice(name=w['name'], value=w['name']) for w in filtered]
+    return [app_commands.Choice(name=w['name'], value=w['name']) for w in wrestlers]
 
 
 class LevelSystem(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     
     @app_commands.command(name="level", description="View wrestler level and progress")
     @app_commands.autocomplete(wrestler_name=wrestler_autocomplete)
     async def level(self, interaction: discord.Interaction, wrestler_name: Optional[str] = None):
         """View level progress for a wrestler"""
         
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        
         # If no name provided, get user's wrestler
         if not wrestler_name:
-            wrestler = next((w for w in all_wrestlers if w['user_id'] == interaction.user.id), None)
+            user_wrestlers = await self.db.get_wrestlers_by_user(interaction.guild_id, interaction.user.id)
+            wrestler = user_wrestlers[0] if user_wrestlers else None
             if not wrestler:
                 await interaction.response.send_message(
                     "❌ You don't have a wrestler! Use /create_wrestler first.",
@@ -36,7 +33,7 @@ class LevelSystem(commands.Cog):
                 )
                 return
         else:
-            wrestler = next((w for w in all_wrestlers if w['name'].lower() == wrestler_name.lower()), None)
+            wrestler = await self.db.get_wrestler_by_name(interaction.guild_id, wrestler_name)
             if not wrestler:
                 await interaction.response.send_message(
                     f"❌ Wrestler '{wrestler_name}' not found!",
@@ -1,7 +1,6 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from database import Database
 from datetime import datetime
 from typing import Optional, List
 import json
@@ -9,18 +8,17 @@ import json
 
 # Autocomplete for wrestlers
 async def wrestler_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
-    db = Database()
-    wrestlers = await db.get_all_wrestlers(interaction.guild_id)
-    if not wrestlers:
+    db = interaction.client.db
+    wrestlers = await db.search_names(interaction.guild_id, "wrestlers", current)
+    if not wrestlers and not current:
         return [app_commands.Choice(name="(No wrestlers found)", value="none")]
-    filtered = [w for w in wrestlers if current.lower() in w['name'].lower()][:25]
-    return [app_commands.Choice(name=w['name'], value=w['name']) for w in filtered]
+    return [app_commands.Choice(name=w['name'], value=w['name']) for w in wrestlers]
 
 
 class Matches(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     
     @app_commands.command(name="leaderboard", description="View server leaderboards")
     @app_commands.choices(
@@ -47,25 +45,22 @@ class Matches(commands.Cog):
             await interaction.response.send_message("❌ Please select either a stat or streak type!", ephemeral=True)
             return
         
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        
-        if not all_wrestlers:
-            await interaction.response.send_message("❌ No wrestlers found in this server!", ephemeral=True)
-            return
-        
         embed = discord.Embed(title="🏆 Leaderboard", color=discord.Color.gold())
         
         if stat:
             stat_value = stat.value
+            counts = await self.db.get_leaderboard_counts(interaction.guild_id)
+            
+            if not counts['wrestlers']:
+                await interaction.response.send_message("❌ No wrestlers found in this server!", ephemeral=True)
+                return
             
             if stat_value == "wins":
-                wrestlers_with_matches = [w for w in all_wrestlers if w['wins'] + w['losses'] > 0]
-                
-                if not wrestlers_with_matches:
+                if not counts['with_matches']:
                     await interaction.response.send_message("❌ No matches recorded yet!", ephemeral=True)
                     return
                 
-                sorted_wrestlers = sorted(wrestlers_with_matches, key=lambda x: x['wins'], reverse=True)[:10]
+                sorted_wrestlers = await self.db.get_leaderboard(interaction.guild_id, "wins")
                 embed.description = "**Most Wins**"
                 
                 for i, wrestler in enumerate(sorted_wrestlers, 1):
@@ -77,23 +72,15 @@ class Matches(commands.Cog):
                     )
             
             elif stat_value == "winrate":
-                wrestlers_with_matches = [w for w in all_wrestlers if w['wins'] + w['losses'] > 0]
-                
-                if not wrestlers_with_matches:
+                if not counts['with_matches']:
                     await interaction.response.send_message("❌ No matches recorded yet!", ephemeral=True)
                     return
                 
-                for wrestler in wrestlers_with_matches:
-                    total = wrestler['wins'] + wrestler['losses']
-                    wrestler['winrate'] = (wrestler['wins'] / total * 100) if total > 0 else 0
-                
-                qualified = [w for w in wrestlers_with_matches if w['wins'] + w['losses'] >= 3]
-                
-                if not qualified:
+                if not counts['winrate_qualified']:
                     await interaction.response.send_message("❌ No wrestlers with at least 3 matches!", ephemeral=True)
                     return
                 
-                sorted_wrestlers = sorted(qualified, key=lambda x: x['winrate'], reverse=True)[:10]
+                sorted_wrestlers = await self.db.get_leaderboard(interaction.guild_id, "winrate")
                 embed.description = "**Best Win Rate** (min. 3 matches)"
                 
                 for i, wrestler in enumerate(sorted_wrestlers, 1):
@@ -105,7 +92,7 @@ class Matches(commands.Cog):
                     )
             
             elif stat_value == "currency":
-                sorted_wrestlers = sorted(all_wrestlers, key=lambda x: x['currency'], reverse=True)[:10]
+                sorted_wrestlers = await self.db.get_leaderboard(interaction.guild_id, "currency")
                 
                 settings = await self.db.get_server_settings(interaction.guild_id)
                 symbol = settings['currency_symbol']
@@ -123,54 +110,24 @@ class Matches(commands.Cog):
         
         elif streak:
             streak_type = streak.value
-            wrestlers_with_streaks = []
-            
-            for wrestler in all_wrestlers:
-                matches = await self.db.get_wrestler_matches(wrestler['id'], limit=50)
-                
-                if not matches:
-                    continue
-                
-                current_streak = 0
-                current_type = None
-                
-                for match in matches:
-                    is_win = wrestler['id'] in match['winner_ids']
-                    
-                    if current_streak == 0:
-                        current_streak = 1
-                        current_type = "W" if is_win else "L"
-                    elif (is_win and current_type == "W") or (not is_win and current_type == "L"):
-                        current_streak += 1
-                    else:
-                        break
-                
-                wrestler['current_streak'] = current_streak
-                wrestler['streak_type'] = current_type
-                
-                if current_streak > 0:
-                    wrestlers_with_streaks.append(wrestler)
-            
-            if not wrestlers_with_streaks:
-                await interaction.response.send_message("❌ No active streaks!", ephemeral=True)
-                return
             
             if streak_type == "overall":
-                sorted_wrestlers = sorted(wrestlers_with_streaks, key=lambda x: x['current_streak'], reverse=True)[:10]
+                sorted_wrestlers = await self.db.get_streak_leaderboard(interaction.guild_id)
+                if not sorted_wrestlers:
+                    await interaction.response.send_message("❌ No active streaks!", ephemeral=True)
+                    return
                 embed.description = "**Longest Current Streaks**"
             elif streak_type == "hot":
-                hot_streaks = [w for w in wrestlers_with_streaks if w['streak_type'] == "W"]
-                if not hot_streaks:
+                sorted_wrestlers = await self.db.get_streak_leaderboard(interaction.guild_id, "W")
+                if not sorted_wrestlers:
                     await interaction.response.send_message("❌ No win streaks!", ephemeral=True)
                     return
-                sorted_wrestlers = sorted(hot_streaks, key=lambda x: x['current_streak'], reverse=True)[:10]
                 embed.description = "🔥 **Hottest Win Streaks**"
             else:  # cold
-                cold_streaks = [w for w in wrestlers_with_streaks if w['streak_type'] == "L"]
-                if not cold_streaks:
+                sorted_wrestlers = await self.db.get_streak_leaderboard(interaction.guild_id, "L")
+                if not sorted_wrestlers:
                     await interaction.response.send_message("❌ No loss streaks!", ephemeral=True)
                     return
-                sorted_wrestlers = sorted(cold_streaks, key=lambda x: x['current_streak'], reverse=True)[:10]
                 embed.description = "❄️ **Coldest Loss Streaks**"
             
             for i, wrestler in enumerate(sorted_wrestlers, 1):
@@ -191,8 +148,7 @@ class Matches(commands.Cog):
     async def match_history(self, interaction: discord.Interaction, wrestler_name: str, limit: Optional[int] = 10):
         """View match history for a wrestler"""
         
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        wrestler = next((w for w in all_wrestlers if w['name'].lower() == wrestler_name.lower()), None)
+        wrestler = await self.db.get_wrestler_by_name(interaction.guild_id, wrestler_name)
         
         if not wrestler:
             await interaction.response.send_message(f"❌ Wrestler '{wrestler_name}' not found!", ephemeral=True)
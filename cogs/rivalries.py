@@ -8,12 +8,11 @@ from typing import Optional, List
 
 # Autocomplete
 async def wrestler_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
-    db = Database()
-    wrestlers = await db.get_all_wrestlers(interaction.guild_id)
-    if not wrestlers:
+    db = interaction.client.db
+    wrestlers = await db.search_names(interaction.guild_id, "wrestlers", current)
+    if not wrestlers and not current:
         return [app_commands.Choice(name="(No wrestlers found)", value="none")]
-    filtered = [w for w in wrestlers if current.lower() in w['name'].lower()][:25]
-    return [app_commands.Choice(name=w['name'], value=w['name']) for w in filtered]
+    return [app_commands.Choice(name=w['name'], value=w['name']) for w in wrestlers]
 
 
 async def is_admin_or_booker(interaction: discord.Interaction, db: Database) -> bool:
@@ -34,7 +33,7 @@ async def is_admin_or_booker(interaction: discord.Interaction, db: Database) ->
 class Rivalries(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     
     rivalry_group = app_commands.Group(
         name="rivalry",
@@ -58,9 +57,9 @@ class Rivalries(commands.Cog):
             return
         
         # Get wrestlers
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        w1 = next((w for w in all_wrestlers if w['name'].lower() == wrestler1.lower()), None)
-        w2 = next((w for w in all_wrestlers if w['name'].lower() == wrestler2.lower()), None)
+        found = await self.db.get_wrestlers_by_names(interaction.guild_id, [wrestler1, wrestler2])
+        w1 = found.get(wrestler1.lower())
+        w2 = found.get(wrestler2.lower())
         
         if not w1:
             await interaction.response.send_message(f"❌ Wrestler '{wrestler1}' not found!", ephemeral=True)
@@ -78,7 +77,7 @@ class Rivalries(commands.Cog):
         if rivalry1:
             # Get opponent name
             opponent_id = rivalry1['wrestler2_id'] if rivalry1['wrestler1_id'] == w1['id'] else rivalry1['wrestler1_id']
-            opponent = next((w for w in all_wrestlers if w['id'] == opponent_id), None)
+            opponent = await self.db.get_wrestler_by_id(opponent_id, interaction.guild_id)
             await interaction.response.send_message(
                 f"❌ **{w1['name']}** already has a rivalry with **{opponent['name'] if opponent else 'Unknown'}**!\n"
                 f"End it first with `/rivalry end`",
@@ -89,7 +88,7 @@ class Rivalries(commands.Cog):
         rivalry2 = await self.db.get_active_rivalry_for_wrestler(w2['id'])
         if rivalry2:
             opponent_id = rivalry2['wrestler2_id'] if rivalry2['wrestler1_id'] == w2['id'] else rivalry2['wrestler1_id']
-            opponent = next((w for w in all_wrestlers if w['id'] == opponent_id), None)
+            opponent = await self.db.get_wrestler_by_id(opponent_id, interaction.guild_id)
             await interaction.response.send_message(
                 f"❌ **{w2['name']}** already has a rivalry with **{opponent['name'] if opponent else 'Unknown'}**!\n"
                 f"End it first with `/rivalry end`",
@@ -130,8 +129,7 @@ class Rivalries(commands.Cog):
             return
         
         # Get wrestler
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        w = next((wr for wr in all_wrestlers if wr['name'].lower() == wrestler.lower()), None)
+        w = await self.db.get_wrestler_by_name(interaction.guild_id, wrestler)
         
         if not w:
             await interaction.response.send_message(f"❌ Wrestler '{wrestler}' not found!", ephemeral=True)
@@ -148,7 +146,7 @@ class Rivalries(commands.Cog):
         
         # Get opponent name
         opponent_id = rivalry['wrestler2_id'] if rivalry['wrestler1_id'] == w['id'] else rivalry['wrestler1_id']
-        opponent = next((wr for wr in all_wrestlers if wr['id'] == opponent_id), None)
+        opponent = await self.db.get_wrestler_by_id(opponent_id, interaction.guild_id)
         
         # End rivalry
         await self.db.end_rivalry(rivalry['id'])
@@ -240,8 +238,7 @@ class Rivalries(commands.Cog):
         """View rivalry details for a specific wrestler"""
         
         # Get wrestler
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        w = next((wr for wr in all_wrestlers if wr['name'].lower() == wrestler.lower()), None)
+        w = await self.db.get_wrestler_by_name(interaction.guild_id, wrestler)
         
         if not w:
             await interaction.response.send_message(f"❌ Wrestler '{wrestler}' not found!", ephemeral=True)
@@ -258,7 +255,7 @@ class Rivalries(commands.Cog):
         
         # Get opponent
         opponent_id = rivalry['wrestler2_id'] if rivalry['wrestler1_id'] == w['id'] else rivalry['wrestler1_id']
-        opponent = next((wr for wr in all_wrestlers if wr['id'] == opponent_id), None)
+        opponent = await self.db.get_wrestler_by_id(opponent_id, interaction.guild_id)
         
         # Calculate stats
         if rivalry['wrestler1_id'] == w['id']:
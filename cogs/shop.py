@@ -1,9 +1,9 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from database import Database
 from utils.constants import ATTRIBUTES, SHOP_PRICES, MAX_ATTRIBUTE_VALUE
 from utils.helpers import create_shop_embed
+from database import ATTRIBUTE_CAPS, DEFAULT_ATTRIBUTE_CAP
 from typing import Optional, List
 
 # Autocomplete for own wrestlers
@@ -12,29 +12,25 @@ async def own_wrestler_autocomplete(
     current: str
 ) -> List[app_commands.Choice[str]]:
     """Autocomplete for wrestler_name - shows user's own wrestlers"""
-    db = Database()
+    db = interaction.client.db
     
-    # Get user's wrestlers
-    wrestlers = await db.get_wrestlers_by_user(interaction.guild_id, interaction.user.id)
+    # Search user's wrestlers (in-memory name index, prefix matches first)
+    wrestlers = await db.search_names(
+        interaction.guild_id, "wrestlers", current, user_id=interaction.user.id
+    )
     
-    if not wrestlers:
+    if not wrestlers and not current:
         return [app_commands.Choice(name="(You have no wrestlers)", value="none")]
     
-    # Filter based on current input
-    filtered = [
-        w for w in wrestlers 
-        if current.lower() in w['name'].lower()
-    ][:25]  # Discord limit
-    
     return [
         app_commands.Choice(name=w['name'], value=w['name'])
-        for w in filtered
+        for w in wrestlers
     ]
 
 class Shop(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     
     @app_commands.command(name="shop", description="Browse the wrestler upgrade shop")
     @app_commands.autocomplete(wrestler_name=own_wrestler_autocomplete)
@@ -171,8 +167,7 @@ class AttributeDropdown(discord.ui.Select):
         
         # Get level cap
         wrestler_level = wrestler.get('level', 1)
-        level_caps = {1: 70, 2: 75, 3: 80, 4: 85, 5: 90, 6: 92, 7: 95, 8: 97, 9: 99, 10: 100}
-        attribute_cap = level_caps.get(wrestler_level, 70)
+        attribute_cap = ATTRIBUTE_CAPS.get(wrestler_level, DEFAULT_ATTRIBUTE_CAP)
         
         # Group attributes for easier selection
         options = []
@@ -228,8 +223,7 @@ class AttributeDropdown(discord.ui.Select):
         
         # Get wrestler's current level and cap
         wrestler_level = self.wrestler.get('level', 1)
-        level_caps = {1: 70, 2: 75, 3: 80, 4: 85, 5: 90, 6: 92, 7: 95, 8: 97, 9: 99, 10: 100}
-        attribute_cap = level_caps.get(wrestler_level, 70)
+        attribute_cap = ATTRIBUTE_CAPS.get(wrestler_level, DEFAULT_ATTRIBUTE_CAP)
         
         # Check current value
         current = self.wrestler['attributes'].get(selected_attr, 50)
@@ -268,16 +262,28 @@ class AttributeDropdown(discord.ui.Select):
             )
             return
         
-        # Deduct currency
-        await self.db.update_wrestler_currency(self.wrestler['id'], -self.cost)
-        
-        # Update attribute
-        final_value = await self.db.update_wrestler_attribute(
+        # Deduct currency and update attribute - the database re-checks the cap and
+        # the balance, so a stale dropdown or a double click can't charge twice
+        upgrade = await self.db.update_wrestler_attribute(
             self.wrestler['id'],
             selected_attr,
-            actual_increase
+            actual_increase,
+            cost=self.cost
         )
         
+        if upgrade is None:
+            await interaction.response.send_message(
+                f"❌ Cannot upgrade **{selected_attr}** - it's already at your level cap, "
+                f"or you can't afford {self.settings['currency_symbol']}{self.cost:,}.\n"
+                f"Nothing was charged.",
+                ephemeral=True
+            )
+            return
+        current = upgrade.old_value
+        new_value = upgrade.new_value
+        actual_increase = new_value - current
+        new_balance = upgrade.currency
+        
         # Add to upgrade queue WITH old and new values
         await self.db.add_upgrade_to_queue(
             interaction.guild_id,
@@ -289,9 +295,6 @@ class AttributeDropdown(discord.ui.Select):
             new_value  # new_value
         )
         
-        # Calculate new balance
-        new_balance = self.wrestler['currency'] - self.cost
-        
         # Success message
         embed = discord.Embed(
             title="✅ Upgrade Purchased!",
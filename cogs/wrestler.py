@@ -1,8 +1,8 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from database import Database
 from utils.constants import ARCHETYPES, PERSONAS, MOVE_CATEGORIES, BODY_TYPES, get_base_attributes, get_height_for_archetype
+from utils.move_catalog import move_catalog, is_heel_move
 from utils.helpers import (
     create_wrestler_embed, 
     create_full_attributes_embed,
@@ -10,19 +10,18 @@ from utils.helpers import (
     calculate_archetype_and_alignment,
     calculate_personality_traits
 )
-from typing import Optional, List
+from typing import Optional, List, Dict
 import random
 
 
 # ==================== AUTOCOMPLETE ====================
 
 async def wrestler_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
-    db = Database()
-    wrestlers = await db.get_wrestlers_by_user(interaction.guild_id, interaction.user.id)
-    if not wrestlers:
+    db = interaction.client.db
+    wrestlers = await db.search_names(interaction.guild_id, "wrestlers", current, user_id=interaction.user.id)
+    if not wrestlers and not current:
         return [app_commands.Choice(name="(You have no wrestlers)", value="none")]
-    filtered = [w for w in wrestlers if current.lower() in w['name'].lower()][:25]
-    return [app_commands.Choice(name=w['name'], value=w['name']) for w in filtered]
+    return [app_commands.Choice(name=w['name'], value=w['name']) for w in wrestlers]
 
 
 # ==================== CONSTANTS ====================
@@ -34,13 +33,6 @@ ALIGNMENT_PERSONAS = {
     "Tweener": ["Giant", "Grappler", "Ground", "Luchador", "Power", "Technician"]
 }
 
-# Move keywords
-HEEL_KEYWORDS = ['choke', 'sleeper', 'guillotine', 'rear naked', 'trap', 'heel', 'behind']
-FACE_KEYWORDS = ['splash', 'press', 'crossbody', 'moonsault', 'elbow drop']
-TECHNICAL_KEYWORDS = ['lock', 'bar', 'crab', 'stretch', 'figure']
-POWER_KEYWORDS = ['slam', 'bomb', 'press', 'gorilla', 'military']
-AERIAL_KEYWORDS = ['diving', 'springboard', 'moonsault', 'splash', 'shooting star', 'top rope']
-
 # Costs
 TURN_COST = 1000
 RENAME_COST = 2000
@@ -79,61 +71,6 @@ def get_trait_adjustments(new_alignment: str) -> Dict[str, int]:
         }
 
 
-def is_heel_move(move_name: str) -> bool:
-    """Check if a move is a Heel move"""
-    return any(keyword in move_name.lower() for keyword in HEEL_KEYWORDS)
-
-
-def filter_moves_by_alignment(available_moves: List[str], alignment: str, archetype: str = "Balanced") -> List[str]:
-    """Filter moves based on alignment and archetype"""
-    
-    scored_moves = []
-    
-    for move in available_moves:
-        move_lower = move.lower()
-        score = 0
-        
-        # Alignment scoring
-        if alignment == "Heel":
-            if any(kw in move_lower for kw in HEEL_KEYWORDS):
-                score += 3
-        elif alignment == "Face":
-            if any(kw in move_lower for kw in FACE_KEYWORDS):
-                score += 3
-            if any(kw in move_lower for kw in HEEL_KEYWORDS):
-                score -= 2
-        
-        # Archetype scoring
-        if archetype == "Technical":
-            if any(kw in move_lower for kw in TECHNICAL_KEYWORDS):
-                score += 2
-        elif archetype == "Powerhouse":
-            if any(kw in move_lower for kw in POWER_KEYWORDS):
-                score += 2
-        elif archetype == "High Flyer":
-            if any(kw in move_lower for kw in AERIAL_KEYWORDS):
-                score += 2
-        
-        scored_moves.append((move, score))
-    
-    scored_moves.sort(key=lambda x: x[1], reverse=True)
-    result = [move for move, score in scored_moves[:6]]
-    
-    if len(result) < 5 and len(available_moves) > len(result):
-        remaining = [m for m in available_moves if m not in result]
-        result.extend(remaining[:5-len(result)])
-    
-    return result
-
-
-def get_all_moves(move_type: str) -> List[str]:
-    """Get all moves of a type (Finishers or Signatures)"""
-    all_moves = []
-    for category_data in MOVE_CATEGORIES.values():
-        all_moves.extend(category_data['moves'][move_type])
-    return all_moves
-
-
 def calculate_new_traits(current_traits: dict, new_alignment: str) -> dict:
     """Calculate new personality traits based on alignment"""
     adjustments = get_trait_adjustments(new_alignment)
@@ -174,23 +111,19 @@ async def own_wrestler_autocomplete(
     current: str
 ) -> List[app_commands.Choice[str]]:
     """Autocomplete for wrestler_name - shows user's own wrestlers"""
-    db = Database()
+    db = interaction.client.db
     
-    # Get user's wrestlers
-    wrestlers = await db.get_wrestlers_by_user(interaction.guild_id, interaction.user.id)
+    # Search user's wrestlers (in-memory name index, prefix matches first)
+    wrestlers = await db.search_names(
+        interaction.guild_id, "wrestlers", current, user_id=interaction.user.id
+    )
     
-    if not wrestlers:
+    if not wrestlers and not current:
         return [app_commands.Choice(name="(You have no wrestlers)", value="none")]
     
-    # Filter based on current input
-    filtered = [
-        w for w in wrestlers 
-        if current.lower() in w['name'].lower()
-    ][:25]  # Discord limit
-    
     return [
         app_commands.Choice(name=w['name'], value=w['name'])
-        for w in filtered
+        for w in wrestlers
     ]
 
 # Autocomplete for viewing any wrestler (including other users)
@@ -199,23 +132,17 @@ async def any_wrestler_autocomplete(
     current: str
 ) -> List[app_commands.Choice[str]]:
     """Autocomplete for wrestler_name - shows all wrestlers in server"""
-    db = Database()
+    db = interaction.client.db
     
-    # Get all wrestlers in server
-    wrestlers = await db.get_all_wrestlers(interaction.guild_id)
+    # Search all wrestlers in server (in-memory name index, prefix matches first)
+    wrestlers = await db.search_names(interaction.guild_id, "wrestlers", current)
     
-    if not wrestlers:
+    if not wrestlers and not current:
         return [app_commands.Choice(name="(No wrestlers found)", value="none")]
     
-    # Filter based on current input
-    filtered = [
-        w for w in wrestlers 
-        if current.lower() in w['name'].lower()
-    ][:25]  # Discord limit
-    
     return [
         app_commands.Choice(name=f"{w['name']} (ID: {w['user_id']})", value=w['name'])
-        for w in filtered
+        for w in wrestlers
     ]
 # ==================== VIEW CLASSES ====================
 
@@ -408,7 +335,7 @@ class TurnConfirmView(discord.ui.View):
 class Wrestler(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     wrestler_group = app_commands.Group(name="wrestler", description="Wrestler management commands")
     
     @wrestler_group.command(name="create", description="Create your wrestler for the league!")
@@ -478,8 +405,7 @@ class Wrestler(commands.Cog):
             
             # If wrestler_name is provided and not found in own wrestlers, search all
             if wrestler_name and not any(w['name'].lower() == wrestler_name.lower() for w in wrestlers):
-                all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-                wrestler = next((w for w in all_wrestlers if w['name'].lower() == wrestler_name.lower()), None)
+                wrestler = await self.db.get_wrestler_by_name(interaction.guild_id, wrestler_name)
                 
                 if wrestler:
                     # Found in other users, get the owner
@@ -630,8 +556,7 @@ class Wrestler(commands.Cog):
     async def history(
        self,interaction: discord.Interaction,wrestler_name: str,limit: Optional[int] = 10
     ):
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        wrestler = next((w for w in all_wrestlers if w['name'].lower() == wrestler_name.lower()), None)
+        wrestler = await self.db.get_wrestler_by_name(interaction.guild_id, wrestler_name)
         
         if not wrestler:
             await interaction.response.send_message(f"❌ Wrestler '{wrestler_name}' not found!", ephemeral=True)
@@ -699,8 +624,7 @@ class Wrestler(commands.Cog):
         """View all championships held by a wrestler"""
     
         # Get wrestler
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        wrestler_obj = next((w for w in all_wrestlers if w['name'].lower() == wrestler_name.lower()), None)
+        wrestler_obj = await self.db.get_wrestler_by_name(interaction.guild_id, wrestler_name)
     
         if not wrestler_obj:
             await interaction.response.send_message(
@@ -775,8 +699,7 @@ class Wrestler(commands.Cog):
         """Force retire any wrestler (admin only)"""
         
         # Get ALL wrestlers (not just user's)
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        wrestler = next((w for w in all_wrestlers if w['name'].lower() == wrestler_name.lower()), None)
+        wrestler = await self.db.get_wrestler_by_name(interaction.guild_id, wrestler_name)
         
         if not wrestler:
             await interaction.response.send_message(
@@ -878,25 +801,23 @@ class Wrestler(commands.Cog):
         signature_must_change = new_alignment == "Face" and signature_is_heel
         finisher_must_change = new_alignment == "Face" and finisher_is_heel
         
-        # Get available moves
-        all_signatures = get_all_moves('Signatures')
-        all_finishers = get_all_moves('Finishers')
+        # Suggested moves (precomputed in the move catalog), minus moves other wrestlers use
+        catalog = move_catalog()
+        taken = await self.db.get_taken_moves(interaction.guild_id)
         
         # Filter signatures
         if signature_must_change:
-            signature_moves = [m for m in all_signatures if not is_heel_move(m)]
-            signature_moves = filter_moves_by_alignment(signature_moves, new_alignment, archetype)
+            signature_moves = list(catalog.suggestions('Signatures', new_alignment, archetype, exclude_heel=True, exclude=taken['signature']))
         elif new_alignment == "Heel":
-            signature_moves = filter_moves_by_alignment(all_signatures, new_alignment, archetype)
+            signature_moves = list(catalog.suggestions('Signatures', new_alignment, archetype, exclude=taken['signature']))
         else:
             signature_moves = []
         
         # Filter finishers
         if finisher_must_change:
-            finisher_moves = [m for m in all_finishers if not is_heel_move(m)]
-            finisher_moves = filter_moves_by_alignment(finisher_moves, new_alignment, archetype)
+            finisher_moves = list(catalog.suggestions('Finishers', new_alignment, archetype, exclude_heel=True, exclude=taken['finisher']))
         elif new_alignment == "Heel":
-            finisher_moves = filter_moves_by_alignment(all_finishers, new_alignment, archetype)
+            finisher_moves = list(catalog.suggestions('Finishers', new_alignment, archetype, exclude=taken['finisher']))
         else:
             finisher_moves = []
         
@@ -982,8 +903,7 @@ class Wrestler(commands.Cog):
         
         """Execute the turn"""
         # Get FRESH wrestler data with all fields
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        wrestler_fresh = next((w for w in all_wrestlers if w['id'] == wrestler['id']), None)
+        wrestler_fresh = await self.db.get_wrestler_by_id(wrestler['id'], interaction.guild_id)
         
         if not wrestler_fresh:
             await interaction.followup.send("❌ Wrestler not found!", ephemeral=True)
@@ -1113,8 +1033,8 @@ class Wrestler(commands.Cog):
             await interaction.response.send_message("❌ Name must be 2-50 characters!", ephemeral=True)
             return
         
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        if any(w['name'].lower() == new_name.lower() for w in all_wrestlers):
+        taken_names = await self.db.get_wrestler_names(interaction.guild_id)
+        if any(w.name.lower() == new_name.lower() for w in taken_names):
             await interaction.response.send_message(f"❌ '{new_name}' already taken!", ephemeral=True)
             return
         
@@ -1858,22 +1778,13 @@ class MoveCategoryButton(discord.ui.Button):
             
             # Step 3: Get all moves
             print(f"[DEBUG] Step 3: Getting moves from {self.category}...")
-            all_moves = MOVE_CATEGORIES[self.category]['moves']['Finishers' if self.move_type == 'finisher' else 'Signatures']
+            all_moves = move_catalog().by_category[(self.category, 'Finishers' if self.move_type == 'finisher' else 'Signatures')]
             print(f"[DEBUG] Step 3: Found {len(all_moves)} total moves")
             
             # Step 4: Filter taken moves
             print(f"[DEBUG] Step 4: Checking which moves are available...")
-            available_moves = []
-            for i, move in enumerate(all_moves):
-                is_taken = await view.db.check_move_exists(
-                    interaction.guild_id,
-                    move,
-                    self.move_type
-                )
-                if not is_taken:
-                    available_moves.append(move)
-                if i % 5 == 0:  # Progress every 5 moves
-                    print(f"[DEBUG] Step 4: Checked {i+1}/{len(all_moves)} moves...")
+            taken = (await view.db.get_taken_moves(interaction.guild_id))[self.move_type]
+            available_moves = [move for move in all_moves if move not in taken]
             
             print(f"[DEBUG] Step 4: {len(available_moves)} moves available")
             
@@ -1,8 +1,8 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from database import Database
-from utils.constants import PERSONAS, MOVE_CATEGORIES
+from utils.constants import PERSONAS
+from utils.move_catalog import move_catalog, is_heel_move
 from datetime import datetime
 from typing import Optional, List, Dict
 import json
@@ -11,12 +11,11 @@ import json
 # ==================== AUTOCOMPLETE ====================
 
 async def wrestler_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
-    db = Database()
-    wrestlers = await db.get_wrestlers_by_user(interaction.guild_id, interaction.user.id)
-    if not wrestlers:
+    db = interaction.client.db
+    wrestlers = await db.search_names(interaction.guild_id, "wrestlers", current, user_id=interaction.user.id)
+    if not wrestlers and not current:
         return [app_commands.Choice(name="(You have no wrestlers)", value="none")]
-    filtered = [w for w in wrestlers if current.lower() in w['name'].lower()][:25]
-    return [app_commands.Choice(name=w['name'], value=w['name']) for w in filtered]
+    return [app_commands.Choice(name=w['name'], value=w['name']) for w in wrestlers]
 
 
 # ==================== CONSTANTS ====================
@@ -28,13 +27,6 @@ ALIGNMENT_PERSONAS = {
     "Tweener": ["Giant", "Grappler", "Ground", "Luchador", "Power", "Technician"]
 }
 
-# Move keywords
-HEEL_KEYWORDS = ['choke', 'sleeper', 'guillotine', 'rear naked', 'trap', 'heel', 'behind']
-FACE_KEYWORDS = ['splash', 'press', 'crossbody', 'moonsault', 'elbow drop']
-TECHNICAL_KEYWORDS = ['lock', 'bar', 'crab', 'stretch', 'figure']
-POWER_KEYWORDS = ['slam', 'bomb', 'press', 'gorilla', 'military']
-AERIAL_KEYWORDS = ['diving', 'springboard', 'moonsault', 'splash', 'shooting star', 'top rope']
-
 # Costs
 TURN_COST = 1000
 RENAME_COST = 2000
@@ -73,61 +65,6 @@ def get_trait_adjustments(new_alignment: str) -> Dict[str, int]:
         }
 
 
-def is_heel_move(move_name: str) -> bool:
-    """Check if a move is a Heel move"""
-    return any(keyword in move_name.lower() for keyword in HEEL_KEYWORDS)
-
-
-def filter_moves_by_alignment(available_moves: List[str], alignment: str, archetype: str = "Balanced") -> List[str]:
-    """Filter moves based on alignment and archetype"""
-    
-    scored_moves = []
-    
-    for move in available_moves:
-        move_lower = move.lower()
-        score = 0
-        
-        # Alignment scoring
-        if alignment == "Heel":
-            if any(kw in move_lower for kw in HEEL_KEYWORDS):
-                score += 3
-        elif alignment == "Face":
-            if any(kw in move_lower for kw in FACE_KEYWORDS):
-                score += 3
-            if any(kw in move_lower for kw in HEEL_KEYWORDS):
-                score -= 2
-        
-        # Archetype scoring
-        if archetype == "Technical":
-            if any(kw in move_lower for kw in TECHNICAL_KEYWORDS):
-                score += 2
-        elif archetype == "Powerhouse":
-            if any(kw in move_lower for kw in POWER_KEYWORDS):
-                score += 2
-        elif archetype == "High Flyer":
-            if any(kw in move_lower for kw in AERIAL_KEYWORDS):
-                score += 2
-        
-        scored_moves.append((move, score))
-    
-    scored_moves.sort(key=lambda x: x[1], reverse=True)
-    result = [move for move, score in scored_moves[:6]]
-    
-    if len(result) < 5 and len(available_moves) > len(result):
-        remaining = [m for m in available_moves if m not in result]
-        result.extend(remaining[:5-len(result)])
-    
-    return result
-
-
-def get_all_moves(move_type: str) -> List[str]:
-    """Get all moves of a type (Finishers or Signatures)"""
-    all_moves = []
-    for category_data in MOVE_CATEGORIES.values():
-        all_moves.extend(category_data['moves'][move_type])
-    return all_moves
-
-
 def calculate_new_traits(current_traits: dict, new_alignment: str) -> dict:
     """Calculate new personality traits based on alignment"""
     adjustments = get_trait_adjustments(new_alignment)
@@ -339,7 +276,7 @@ class TurnConfirmView(discord.ui.View):
 class WrestlerChanges(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     
     wrestler_group = app_commands.Group(name="wrestler", description="Wrestler management")
     
@@ -418,25 +355,23 @@ class WrestlerChanges(commands.Cog):
         signature_must_change = new_alignment == "Face" and signature_is_heel
         finisher_must_change = new_alignment == "Face" and finisher_is_heel
         
-        # Get available moves
-        all_signatures = get_all_moves('Signatures')
-        all_finishers = get_all_moves('Finishers')
+        # Suggested moves (precomputed in the move catalog), minus moves other wrestlers use
+        catalog = move_catalog()
+        taken = await self.db.get_taken_moves(interaction.guild_id)
         
         # Filter signatures
         if signature_must_change:
-            signature_moves = [m for m in all_signatures if not is_heel_move(m)]
-            signature_moves = filter_moves_by_alignment(signature_moves, new_alignment, archetype)
+            signature_moves = list(catalog.suggestions('Signatures', new_alignment, archetype, exclude_heel=True, exclude=taken['signature']))
         elif new_alignment == "Heel":
-            signature_moves = filter_moves_by_alignment(all_signatures, new_alignment, archetype)
+            signature_moves = list(catalog.suggestions('Signatures', new_alignment, archetype, exclude=taken['signature']))
         else:
             signature_moves = []
         
         # Filter finishers
         if finisher_must_change:
-            finisher_moves = [m for m in all_finishers if not is_heel_move(m)]
-            finisher_moves = filter_moves_by_alignment(finisher_moves, new_alignment, archetype)
+            finisher_moves = list(catalog.suggestions('Finishers', new_alignment, archetype, exclude_heel=True, exclude=taken['finisher']))
         elif new_alignment == "Heel":
-            finisher_moves = filter_moves_by_alignment(all_finishers, new_alignment, archetype)
+            finisher_moves = list(catalog.suggestions('Finishers', new_alignment, archetype, exclude=taken['finisher']))
         else:
             finisher_moves = []
         
@@ -641,8 +576,8 @@ class WrestlerChanges(commands.Cog):
             await interaction.response.send_message("❌ Name must be 2-50 characters!", ephemeral=True)
             return
         
-        all_wrestlers = await self.db.get_all_wrestlers(interaction.guild_id)
-        if any(w['name'].lower() == new_name.lower() for w in all_wrestlers):
+        taken_names = await self.db.get_wrestler_names(interaction.guild_id)
+        if any(w.name.lower() == new_name.lower() for w in taken_names):
             await interaction.response.send_message(f"❌ '{new_name}' already taken!", ephemeral=True)
             return
         
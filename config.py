@@ -16,9 +16,14 @@ class Config:
     # Bot Settings
     BOT_PREFIX = '!'
     BOT_STATUS = "WWE matches | /help"
+    FORCE_COMMAND_SYNC = os.getenv('FORCE_COMMAND_SYNC', '0') == '1'  # sync slash commands even if unchanged
     
     # Database
     DATABASE_PATH = "wrestling_bot.db"
+    DATABASE_POOL_SIZE = int(os.getenv('DATABASE_POOL_SIZE', 4))  # reader connections (plus one writer)
+    DATABASE_PRAGMA_PROFILE = os.getenv('DATABASE_PRAGMA_PROFILE', 'balanced')  # durable / balanced / throughput
+    CURRENCY_FLUSH_SECONDS = float(os.getenv('CURRENCY_FLUSH_SECONDS', 5))  # how often chat currency is saved
+    ROSTER_CACHE_MAX_WRESTLERS = int(os.getenv('ROSTER_CACHE_MAX_WRESTLERS', 5000))  # cached roster rows across all guilds
     
     # Default Server Settings
     DEFAULT_CURRENCY_NAME = "Dollars"
@@ -1,348 +1,495 @@
 import aiosqlite
+import asyncio
 import json
+import functools
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Optional, Dict, List, Any
-from utils.constants import ATTRIBUTES, DEFAULT_ATTRIBUTE_VALUE
+from typing import Optional, Dict, List, Any, Iterable, NamedTuple, Set, Tuple
+from utils.packed_attributes import pack_attributes, ATTRIBUTE_INDEX, SQL_FUNCTIONS
+from utils.models import Wrestler, Match, Championship, TitleReign, EventInstance
+from utils.leaderboards import LeaderboardEngine, LEADERBOARD_SIZE
+from utils.currency_buffer import CurrencyBuffer
+from utils.roster_cache import RosterCache
+from utils.singleflight import SingleFlight
+from utils.name_index import NameIndexes, MAX_RESULTS, WRESTLERS, CHAMPIONSHIPS, TEMPLATES, EVENTS
+from utils.schema import SCHEMA, INDEXES
+from utils.taken_moves import TakenMoves, FINISHER, SIGNATURE
+
+
+# SQLite pragma presets applied to every pooled connection (Config.DATABASE_PRAGMA_PROFILE).
+# WAL lets readers keep going while the writer commits; the presets differ in
+# how hard they fsync and how much memory they trade for fewer disk reads.
+PRAGMA_PROFILES = {
+    # Full fsync on every commit - safest if the host may lose power
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "mmap_size": 0,
+        "cache_size": -8000,  # negative = KiB, so ~8 MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # WAL + NORMAL can lose the last commits on power loss but never corrupts
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 64 * 1024 * 1024,
+        "cache_size": -16000,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # No fsync at all - fastest, only for hosts where losing recent writes is acceptable
+    "throughput": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64000,
+        "temp_store": "MEMORY",
+        "busy_timeout": 10000,
+    },
+}
+
+
+def get_pragma_profile(name: str) -> Dict[str, Any]:
+    """Look up a pragma preset by name"""
+    try:
+        return PRAGMA_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown database pragma profile '{name}' (choose from: {', '.join(PRAGMA_PROFILES)})"
+        )
+
+
+# Highest value an attribute can be bought up to at each wrestler level
+ATTRIBUTE_CAPS = {1: 70, 2: 75, 3: 80, 4: 85, 5: 90, 6: 92, 7: 95, 8: 97, 9: 99, 10: 100}
+DEFAULT_ATTRIBUTE_CAP = 70
+# The same caps as a SQL expression over the wrestlers.level column
+ATTRIBUTE_CAP_SQL = "CASE level {} ELSE {} END".format(
+    " ".join(f"WHEN {level} THEN {cap}" for level, cap in ATTRIBUTE_CAPS.items()),
+    DEFAULT_ATTRIBUTE_CAP
+)
+
+
+class Transaction:
+    """A unit of work: Database calls made inside it share one connection and one commit.
+    
+    Created by Database.transaction(). Attribute access falls through to the
+    Database, so `await tx.record_match(...)` and `await db.record_match(...)`
+    inside the block are equivalent.
+    """
+    
+    def __init__(self, database: "Database", connection: aiosqlite.Connection):
+        self.database = database
+        self.connection = connection
+        self.active = True
+        self._on_commit: List[Any] = []
+    
+    def __getattr__(self, name):
+        return getattr(self.database, name)
+    
+    def after_commit(self, callback, *args):
+        """Run callback(*args) once the transaction commits (dropped on rollback)"""
+        self._on_commit.append((callback, args))
+    
+    def _run_commit_callbacks(self):
+        for callback, args in self._on_commit:
+            callback(*args)
+        self._on_commit.clear()
+
+
+class _TransactionConnection:
+    """Connection handed to Database methods inside a transaction - commits are deferred"""
+    
+    def __init__(self, connection: aiosqlite.Connection):
+        self._connection = connection
+    
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+    
+    async def commit(self):
+        # The transaction commits once, when its block exits
+        pass
+
+
+# Transaction active in the current task (if any)
+_current_transaction: ContextVar[Optional[Transaction]] = ContextVar("current_transaction", default=None)
+
+
+class ConnectionPool:
+    """Long-lived SQLite connections shared by every Database method.
+    
+    Reads are spread over a small pool of reader connections; all writes go
+    through a single writer connection guarded by a lock, so SQLite never
+    sees two writers from this process at once.
+    """
+    
+    def __init__(self, db_path: str, size: int = 4, pragmas: Optional[Dict[str, Any]] = None):
+        self.db_path = db_path
+        self.size = max(1, size)
+        self.pragmas = pragmas if pragmas is not None else PRAGMA_PROFILES["balanced"]
+        self._readers: Optional[asyncio.Queue] = None
+        self._reader_conns: List[aiosqlite.Connection] = []
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._open_lock: Optional[asyncio.Lock] = None
+        # Bumped every time the writer is released, i.e. after anything may have committed
+        self.write_epoch = 0
+    
+    @property
+    def is_open(self) -> bool:
+        return self._writer is not None
+    
+    async def _connect(self) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(self.db_path)
+        conn.row_factory = aiosqlite.Row
+        for pragma, value in self.pragmas.items():
+            await conn.execute(f"PRAGMA {pragma} = {value}")
+        for name, num_params, func in SQL_FUNCTIONS:
+            await conn.create_function(name, num_params, func, deterministic=True)
+        return conn
+    
+    async def open(self):
+        """Open the writer and reader connections (no-op if already open)"""
+        if self._open_lock is None:
+            self._open_lock = asyncio.Lock()
+        async with self._open_lock:
+            if self.is_open:
+                return
+            self._write_lock = asyncio.Lock()
+            self._readers = asyncio.Queue()
+            self._reader_conns = []
+            for _ in range(self.size):
+                conn = await self._connect()
+                self._reader_conns.append(conn)
+                self._readers.put_nowait(conn)
+            self._writer = await self._connect()
+    
+    async def close(self):
+        """Close every pooled connection"""
+        if not self.is_open:
+            return
+        async with self._write_lock:
+            writer, self._writer = self._writer, None
+            await writer.close()
+        for conn in self._reader_conns:
+            await conn.close()
+        self._reader_conns = []
+        self._readers = None
+    
+    def _active_transaction(self) -> Optional[Transaction]:
+        # Tasks spawned inside a transaction inherit it; once it has finished
+        # they must go back to the normal (locked) connections
+        tx = _current_transaction.get()
+        if tx is not None and tx.active and tx.database.pool is self:
+            return tx
+        return None
+    
+    @asynccontextmanager
+    async def reader(self):
+        """Borrow a reader connection for the duration of the block"""
+        tx = self._active_transaction()
+        if tx is not None:
+            # Read through the transaction so its uncommitted writes are visible
+            yield _TransactionConnection(tx.connection)
+            return
+        if not self.is_open:
+            await self.open()
+        readers = self._readers
+        conn = await readers.get()
+        try:
+            yield conn
+        finally:
+            readers.put_nowait(conn)
+    
+    @asynccontextmanager
+    async def writer(self):
+        """Hold the writer connection; uncommitted work is rolled back on exit"""
+        tx = self._active_transaction()
+        if tx is not None:
+            yield _TransactionConnection(tx.connection)
+            return
+        if not self.is_open:
+            await self.open()
+        async with self._write_lock:
+            conn = self._writer
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    await conn.rollback()
+                self.write_epoch += 1
+
+
+def coalesced(method):
+    """Let concurrent identical calls of a read method share one query.
+    
+    Calls only join a query that started after the last write, so a caller
+    always sees its own committed changes. Reads inside a transaction are
+    never shared.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if self.pool._active_transaction() is not None:
+            return await method(self, *args, **kwargs)
+        key = (method.__name__, args, tuple(sorted(kwargs.items())), self.pool.write_epoch)
+        return await self.singleflight.do(key, lambda: method(self, *args, **kwargs))
+    return wrapper
+
+
+class WrestlerName(NamedTuple):
+    """Just enough of a wrestler to show or look up its name"""
+    id: int
+    name: str
+    user_id: int
+
+
+class WrestlerSummary(NamedTuple):
+    """Roster-list view of a wrestler (no JSON columns or free text)"""
+    id: int
+    name: str
+    user_id: int
+    alignment: Optional[str]
+    archetype: str
+    weight_class: str
+    level: int
+    wins: int
+    losses: int
+    currency: int
+
+
+class AttributeUpgrade(NamedTuple):
+    """Result of a successful update_wrestler_attribute() purchase"""
+    old_value: int
+    new_value: int
+    currency: int  # balance after paying, including chat currency not yet saved
+
+
+# One pool per database file, shared by every Database instance pointing at it
+_pools: Dict[str, ConnectionPool] = {}
+
+
+def get_pool(db_path: str, size: int = 4, pragmas: Optional[Dict[str, Any]] = None) -> ConnectionPool:
+    """Get (or create) the shared connection pool for a database file"""
+    pool = _pools.get(db_path)
+    if pool is None:
+        pool = _pools[db_path] = ConnectionPool(db_path, size, pragmas)
+    return pool
+
 
 class Database:
-    def __init__(self, db_path: str = "wrestling_bot.db"):
+    def __init__(
+        self,
+        db_path: str = "wrestling_bot.db",
+        pool_size: int = 4,
+        pragma_profile: str = "balanced",
+        currency_flush_interval: float = 5.0,
+        roster_cache_size: int = 5000
+    ):
         self.db_path = db_path
+        self.pool = get_pool(db_path, pool_size, get_pragma_profile(pragma_profile))
+        self.leaderboards = LeaderboardEngine()
+        self.currency_buffer = CurrencyBuffer()
+        self.currency_flush_interval = currency_flush_interval
+        self._flush_task: Optional[asyncio.Task] = None
+        self._backfill_task: Optional[asyncio.Task] = None
+        # guild_id -> parsed server_settings row (None = guild not set up)
+        self._settings_cache: Dict[int, Optional[Dict[str, Any]]] = {}
+        self._settings_generation: Dict[int, int] = {}
+        self.rosters = RosterCache(roster_cache_size)
+        self.name_indexes = NameIndexes()
+        self.taken_moves = TakenMoves()
+        self.singleflight = SingleFlight()
+    
+    async def start(self):
+        """Start the database service (call once at bot startup, before cogs load)"""
+        await self.pool.open()
+        await self._load_currency_cooldowns()
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._currency_flush_loop())
+    
+    async def close(self):
+        """Stop the database service (call once at bot shutdown)"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        if self._backfill_task is not None:
+            # An interrupted backfill resumes from its last batch on the next start
+            self._backfill_task.cancel()
+            try:
+                await self._backfill_task
+            except asyncio.CancelledError:
+                pass
+            self._backfill_task = None
+        # Save any chat currency still sitting in memory
+        await self.flush_currency()
+        await self.pool.close()
+    
+    @asynccontextmanager
+    async def transaction(self):
+        """Run several Database calls as one unit of work.
+        
+            async with db.transaction() as tx:
+                match_id = await tx.record_match(...)
+                await tx.update_wrestler_record(...)
+        
+        Every call inside the block (from this task, or tasks it starts while
+        the block is open) uses the writer connection, sees the block's own
+        uncommitted writes, and is committed once at the end - or rolled back
+        entirely if the block raises. Nested transaction() blocks join the
+        outer one. In-memory caches are only updated after the commit.
+        """
+        tx = self.pool._active_transaction()
+        if tx is not None:
+            yield tx
+            return
+        
+        async with self.pool.writer() as conn:
+            tx = Transaction(self, conn)
+            token = _current_transaction.set(tx)
+            try:
+                yield tx
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
+            finally:
+                tx.active = False
+                _current_transaction.reset(token)
+        tx._run_commit_callbacks()
+    
+    def _after_commit(self, callback, *args):
+        """Apply an in-memory update now, or when the surrounding transaction commits"""
+        tx = self.pool._active_transaction()
+        if tx is not None:
+            tx.after_commit(callback, *args)
+        else:
+            callback(*args)
     
     async def initialize(self):
-        """Initialize database tables"""
-        async with aiosqlite.connect(self.db_path) as db:
-            # Server settings table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS server_settings (
-                    guild_id INTEGER PRIMARY KEY,
-                    currency_name TEXT DEFAULT 'Dollars',
-                    currency_symbol TEXT DEFAULT '$',
-                    currency_min INTEGER DEFAULT 5,
-                    currency_max INTEGER DEFAULT 15,
-                    currency_cooldown INTEGER DEFAULT 60,
-                    announcement_channel_id INTEGER,
-                    shop_channel_id INTEGER,
-                    currency_channels TEXT,
-                    max_wrestlers_per_user INTEGER DEFAULT 3,
-                    booker_role_id INTEGER,
-                    setup_completed INTEGER DEFAULT 0
-                )
-            """)
-            
-            # Wrestlers table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS wrestlers (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    name TEXT NOT NULL,
-                    archetype TEXT NOT NULL,
-                    weight_class TEXT NOT NULL,
-                    persona TEXT NOT NULL,
-                    finisher TEXT NOT NULL,
-                    signature TEXT NOT NULL,
-                    attributes TEXT NOT NULL,
-                    personality TEXT,
-                    gender TEXT,
-                    alignment TEXT,
-                    body_type TEXT,
-                    height_feet TEXT,
-                    height_cm INTEGER,
-                    appearance TEXT,
-                    outfit TEXT,
-                    currency INTEGER DEFAULT 0,
-                    level INTEGER DEFAULT 1,
-                    xp INTEGER DEFAULT 0,
-                    wins INTEGER DEFAULT 0,
-                    losses INTEGER DEFAULT 0,
-                    created_at TEXT NOT NULL,
-                    is_retired INTEGER DEFAULT 0,
-                    UNIQUE(guild_id, user_id, name)
-                )
-            """)
-            
-            # Currency tracking for cooldowns
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS currency_cooldowns (
-                    guild_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    last_earned TEXT NOT NULL,
-                    PRIMARY KEY (guild_id, user_id)
-                )
-            """)
-            
-            # Upgrade queue for admins
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS upgrade_queue (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    wrestler_id INTEGER NOT NULL,
-                    wrestler_name TEXT NOT NULL,
-                    attribute TEXT NOT NULL,
-                    amount INTEGER NOT NULL,
-                    old_value INTEGER,
-                    new_value INTEGER,
-                    timestamp TEXT NOT NULL,
-                    processed INTEGER DEFAULT 0
-                )
-            """)
-            
-            # User wrestler limits (overrides)
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS user_wrestler_limits (
-                    guild_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    max_wrestlers INTEGER NOT NULL,
-                    PRIMARY KEY (guild_id, user_id)
-                )
-            """)
-            
-            # ========== PHASE 2 TABLES ==========
-            
-            # Matches table - stores all match results
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS matches (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    event_id INTEGER,
-                    winner_ids TEXT NOT NULL,
-                    winner_names TEXT NOT NULL,
-                    loser_ids TEXT NOT NULL,
-                    loser_names TEXT NOT NULL,
-                    match_type TEXT NOT NULL,
-                    finish_type TEXT NOT NULL,
-                    rating REAL,
-                    championship_id INTEGER,
-                    match_date TEXT NOT NULL,
-                    notes TEXT,
-                    FOREIGN KEY (championship_id) REFERENCES championships(id),
-                    FOREIGN KEY (event_id) REFERENCES events(id)
-                )
-            """)
-            
-            # Championships table - defines all titles
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS championships (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    name TEXT NOT NULL,
-                    description TEXT,
-                    gender_requirement TEXT,
-                    weight_class_requirement TEXT,
-                    is_tag_team INTEGER DEFAULT 0,
-                    current_champion_id INTEGER,
-                    created_at TEXT NOT NULL,
-                    is_active INTEGER DEFAULT 1,
-                    UNIQUE(guild_id, name)
-                )
-            """)
-            
-            # Title reigns table - tracks championship history
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS title_reigns (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    championship_id INTEGER NOT NULL,
-                    wrestler_id INTEGER NOT NULL,
-                    wrestler_name TEXT NOT NULL,
-                    reign_number INTEGER NOT NULL,
-                    won_date TEXT NOT NULL,
-                    lost_date TEXT,
-                    days_held INTEGER DEFAULT 0,
-                    successful_defenses INTEGER DEFAULT 0,
-                    is_current INTEGER DEFAULT 1,
-                    FOREIGN KEY (championship_id) REFERENCES championships(id),
-                    FOREIGN KEY (wrestler_id) REFERENCES wrestlers(id)
-                )
-            """)
-            
-            # Title divisions - assigns wrestlers to title divisions
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS title_divisions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    championship_id INTEGER NOT NULL,
-                    wrestler_id INTEGER NOT NULL,
-                    wrestler_name TEXT NOT NULL,
-                    assigned_date TEXT NOT NULL,
-                    is_active INTEGER DEFAULT 1,
-                    FOREIGN KEY (championship_id) REFERENCES championships(id),
-                    FOREIGN KEY (wrestler_id) REFERENCES wrestlers(id),
-                    UNIQUE(championship_id, wrestler_id)
-                )
-            """)
-            
-            # Division rankings - point-based contender system
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS division_rankings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    championship_id INTEGER NOT NULL,
-                    wrestler_id INTEGER NOT NULL,
-                    wrestler_name TEXT NOT NULL,
-                    points INTEGER DEFAULT 0,
-                    wins INTEGER DEFAULT 0,
-                    losses INTEGER DEFAULT 0,
-                    last_updated TEXT NOT NULL,
-                    FOREIGN KEY (championship_id) REFERENCES championships(id),
-                    FOREIGN KEY (wrestler_id) REFERENCES wrestlers(id),
-                    UNIQUE(championship_id, wrestler_id)
-                )
-            """)
-            
-            # Events table - stores shows/PPVs
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    name TEXT NOT NULL,
-                    event_date TEXT NOT NULL,
-                    description TEXT,
-                    announcement_message_id INTEGER,
-                    is_completed INTEGER DEFAULT 0,
-                    created_at TEXT NOT NULL,
-                    UNIQUE(guild_id, name, event_date)
-                )
-            """)
-            
-            # Event matches - planned match card
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS event_matches (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    event_id INTEGER NOT NULL,
-                    match_order INTEGER,
-                    wrestler1_id INTEGER,
-                    wrestler1_name TEXT,
-                    wrestler2_id INTEGER,
-                    wrestler2_name TEXT,
-                    match_type TEXT NOT NULL,
-                    championship_id INTEGER,
-                    stipulation TEXT,
-                    is_open_spot INTEGER DEFAULT 0,
-                    open_spots_count INTEGER DEFAULT 0,
-                    open_spot_description TEXT,
-                    match_result_id INTEGER,
-                    FOREIGN KEY (event_id) REFERENCES events(id),
-                    FOREIGN KEY (wrestler1_id) REFERENCES wrestlers(id),
-                    FOREIGN KEY (wrestler2_id) REFERENCES wrestlers(id),
-                    FOREIGN KEY (championship_id) REFERENCES championships(id),
-                    FOREIGN KEY (match_result_id) REFERENCES matches(id)
-                )
-            """)
-            
-            # Event applications - users apply for open spots
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS event_applications (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    event_match_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    wrestler_id INTEGER NOT NULL,
-                    wrestler_name TEXT NOT NULL,
-                    application_date TEXT NOT NULL,
-                    is_accepted INTEGER DEFAULT 0,
-                    FOREIGN KEY (event_match_id) REFERENCES event_matches(id),
-                    FOREIGN KEY (wrestler_id) REFERENCES wrestlers(id),
-                    UNIQUE(event_match_id, wrestler_id)
-                )
-            """)
-            
-            # ==================== PHASE 3 TABLES ====================
-            
-            # Event Templates - reusable show/event templates
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS event_templates (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    type TEXT NOT NULL,
-                    name TEXT NOT NULL,
-                    description TEXT,
-                    default_time TEXT,
-                    announcement_channel_id INTEGER,
-                    banner_url TEXT,
-                    created_at TEXT NOT NULL,
-                    UNIQUE(guild_id, name)
-                )
-            """)
-            
-            # Event Instances - specific occurrences with auto-numbering  
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS event_instances (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    template_id INTEGER,
-                    base_name TEXT NOT NULL,
-                    full_name TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    instance_number INTEGER NOT NULL,
-                    date TEXT NOT NULL,
-                    time TEXT,
-                    description TEXT,
-                    banner_url TEXT,
-                    status TEXT DEFAULT 'planned',
-                    announcement_message_id INTEGER,
-                    announcement_channel_id INTEGER,
-                    created_at TEXT NOT NULL,
-                    completed_at TEXT,
-                    FOREIGN KEY (template_id) REFERENCES event_templates(id)
-                )
-            """)
-            
-            # Event Instance Matches - match card
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS event_instance_matches (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    event_instance_id INTEGER NOT NULL,
-                    match_order INTEGER NOT NULL,
-                    match_type TEXT NOT NULL,
-                    championship_id INTEGER,
-                    participants TEXT NOT NULL,
-                    is_open_spot INTEGER DEFAULT 0,
-                    spots_available INTEGER,
-                    spots_filled INTEGER DEFAULT 0,
-                    open_spot_description TEXT,
-                    is_main_event INTEGER DEFAULT 0,
-                    status TEXT DEFAULT 'pending',
-                    match_id INTEGER,
-                    FOREIGN KEY (event_instance_id) REFERENCES event_instances(id),
-                    FOREIGN KEY (championship_id) REFERENCES championships(id),
-                    FOREIGN KEY (match_id) REFERENCES matches(id)
-                )
-            """)
+        """Bring the database schema up to date (see utils/schema.py)"""
+        async with self.pool.writer() as db:
+            await SCHEMA.migrate(db)
+            backfills = await SCHEMA.pending_backfills(db)
+        
+        # Data rewrites run in small batches so the bot can serve commands meanwhile
+        if backfills and self._backfill_task is None:
+            self._backfill_task = asyncio.create_task(self._run_backfills(backfills))
+    
+    async def _run_backfills(self, names: List[str], batch_size: int = 500):
+        """Work through pending backfills, one short write transaction per batch"""
+        for name in names:
+            print(f"📦 Backfilling {name} in the background...")
+            finished = False
+            while not finished:
+                async with self.pool.writer() as db:
+                    finished = await SCHEMA.run_backfill_batch(db, name, batch_size)
+                # Let queued writes in between batches
+                await asyncio.sleep(0)
+            print(f"✅ Backfill {name} finished")
+    
+    async def get_index_stats(self) -> List[Dict[str, Any]]:
+        """List every index in the database with its size on disk (size is None if unavailable)"""
+        async with self.pool.reader() as db:
+            async with db.execute("""
+                SELECT name, tbl_name, sql FROM sqlite_master
+                WHERE type = 'index'
+                ORDER BY tbl_name, name
+            """) as cursor:
+                rows = await cursor.fetchall()
             
-            # Event Instance Applications - user applications
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS event_instance_applications (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    event_instance_match_id INTEGER NOT NULL,
-                    wrestler_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    applied_at TEXT NOT NULL,
-                    status TEXT DEFAULT 'accepted',
-                    FOREIGN KEY (event_instance_match_id) REFERENCES event_instance_matches(id),
-                    FOREIGN KEY (wrestler_id) REFERENCES wrestlers(id),
-                    UNIQUE(event_instance_match_id, wrestler_id)
-                )
-            """)
+            # dbstat is an optional SQLite extension - fall back to no sizes without it
+            sizes = {}
+            try:
+                async with db.execute(
+                    "SELECT name, SUM(pgsize) FROM dbstat GROUP BY name"
+                ) as cursor:
+                    sizes = {row[0]: row[1] for row in await cursor.fetchall()}
+            except aiosqlite.OperationalError:
+                pass
             
+            registry = {name for name, _, _, _ in INDEXES}
+            return [
+                {
+                    'name': row['name'],
+                    'table': row['tbl_name'],
+                    'size_bytes': sizes.get(row['name']),
+                    'is_partial': bool(row['sql'] and ' WHERE ' in row['sql'].upper()),
+                    'is_registered': row['name'] in registry,
+                    'is_automatic': row['sql'] is None
+                }
+                for row in rows
+            ]
+    
+    def get_singleflight_stats(self) -> Dict[str, int]:
+        """Counters for coalesced reads (calls, executed, coalesced, in_flight)"""
+        return self.singleflight.stats()
+    
+    # ==================== BOT STATE ====================
+    
+    async def get_bot_state(self, key: str) -> Optional[str]:
+        """Read a bot-wide state value (None if never set)"""
+        async with self.pool.reader() as db:
+            async with db.execute("SELECT value FROM bot_state WHERE key = ?", (key,)) as cursor:
+                row = await cursor.fetchone()
+                return row[0] if row else None
+    
+    async def set_bot_state(self, key: str, value: str):
+        """Store a bot-wide state value"""
+        async with self.pool.writer() as db:
+            await db.execute(
+                "INSERT OR REPLACE INTO bot_state (key, value, updated_at) VALUES (?, ?, ?)",
+                (key, value, datetime.utcnow().isoformat())
+            )
             await db.commit()
     
     # ==================== SERVER SETTINGS ====================
     
     async def get_server_settings(self, guild_id: int) -> Optional[Dict[str, Any]]:
-        """Get server settings"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        """Get server settings (cached per guild until a setting changes)"""
+        if guild_id in self._settings_cache:
+            settings = self._settings_cache[guild_id]
+            return dict(settings) if settings is not None else None
+        
+        generation, settings = await self._read_server_settings(guild_id)
+        
+        # Only cache if no setting changed while we were reading, and never
+        # from inside a transaction (its writes may still roll back)
+        if self._settings_generation.get(guild_id, 0) == generation and self.pool._active_transaction() is None:
+            self._settings_cache[guild_id] = settings
+        return dict(settings) if settings is not None else None
+    
+    @coalesced
+    async def _read_server_settings(self, guild_id: int):
+        """Read and parse a guild's settings row. Returns (generation at start, settings)"""
+        generation = self._settings_generation.get(guild_id, 0)
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM server_settings WHERE guild_id = ?",
                 (guild_id,)
             ) as cursor:
                 row = await cursor.fetchone()
-                if row:
-                    settings = dict(row)
-                    # Parse currency channels JSON
-                    if settings['currency_channels']:
-                        settings['currency_channels'] = json.loads(settings['currency_channels'])
-                    return settings
-                return None
+        
+        settings = None
+        if row:
+            settings = dict(row)
+            # Parse currency channels JSON once (empty = all channels)
+            channels = settings['currency_channels']
+            settings['currency_channels'] = frozenset(json.loads(channels) if channels else [])
+        return generation, settings
+    
+    def _drop_server_settings(self, guild_id: int):
+        self._settings_cache.pop(guild_id, None)
+        self._settings_generation[guild_id] = self._settings_generation.get(guild_id, 0) + 1
+    
+    def _invalidate_server_settings(self, guild_id: int):
+        """Forget a guild's cached settings after a write (and again once its transaction commits)"""
+        self._drop_server_settings(guild_id)
+        self._after_commit(self._drop_server_settings, guild_id)
     
     async def setup_server(
         self,
@@ -356,7 +503,7 @@ class Database:
         max_wrestlers_per_user: int
     ):
         """Initial server setup"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute("""
                 INSERT OR REPLACE INTO server_settings 
                 (guild_id, currency_name, currency_symbol, currency_min, currency_max, 
@@ -367,10 +514,11 @@ class Database:
                 announcement_channel_id, json.dumps(currency_channels), max_wrestlers_per_user
             ))
             await db.commit()
+        self._invalidate_server_settings(guild_id)
     
     async def update_server_setting(self, guild_id: int, setting: str, value: Any):
         """Update a specific server setting"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             if setting == 'currency_channels' and isinstance(value, list):
                 value = json.dumps(value)
             
@@ -379,6 +527,7 @@ class Database:
                 (value, guild_id)
             )
             await db.commit()
+        self._invalidate_server_settings(guild_id)
     
     # ==================== WRESTLERS ====================
     
@@ -403,7 +552,7 @@ class Database:
         outfit: str = None
     ) -> int:
         """Create a new wrestler and return its ID"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             cursor = await db.execute("""
                 INSERT INTO wrestlers 
                 (guild_id, user_id, name, archetype, weight_class, persona, finisher, signature, 
@@ -412,125 +561,365 @@ class Database:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 guild_id, user_id, name, archetype, weight_class, persona,
-                finisher, signature, json.dumps(attributes), 
+                finisher, signature, pack_attributes(attributes), 
                 json.dumps(personality) if personality else None,
                 gender, alignment, body_type, height_feet, height_cm,
                 appearance, outfit, datetime.utcnow().isoformat()
             ))
             await db.commit()
-            return cursor.lastrowid
+            await self._sync_roster(db, [cursor.lastrowid], guild_id=guild_id)
+        self._after_commit(self.leaderboards.add_wrestler, guild_id, cursor.lastrowid, name)
+        self._after_commit(self.currency_buffer.add_wrestler, guild_id, user_id, cursor.lastrowid)
+        self._after_commit(self.name_indexes.add, guild_id, WRESTLERS, {'id': cursor.lastrowid, 'name': name, 'user_id': user_id})
+        self._after_commit(self.taken_moves.add, guild_id, cursor.lastrowid, finisher, signature)
+        return cursor.lastrowid
+    
+    def _decode_wrestler(self, row) -> Wrestler:
+        """Turn a wrestlers row into a Wrestler (attributes/personality decode on first access)"""
+        return Wrestler.from_row(row)
+    
+    def _hand_out(self, wrestler: Wrestler) -> Wrestler:
+        """Copy a cached wrestler for a caller (with unsaved chat currency merged in)"""
+        wrestler = wrestler.copy()
+        # Still-raw columns are immutable and get decoded separately by each copy
+        if wrestler.is_decoded('attributes'):
+            wrestler['attributes'] = wrestler['attributes'].copy()
+        if wrestler.is_decoded('personality') and isinstance(wrestler['personality'], dict):
+            wrestler['personality'] = dict(wrestler['personality'])
+        return self.currency_buffer.merge(wrestler)
+    
+    def _cached_roster(self, guild_id: int) -> Optional[Dict[int, Dict[str, Any]]]:
+        # Inside a transaction the cache may be behind the block's own writes
+        if self.pool._active_transaction() is not None:
+            return None
+        return self.rosters.get(guild_id)
+    
+    async def _sync_roster(
+        self,
+        db: aiosqlite.Connection,
+        wrestler_ids: Optional[Iterable[int]] = None,
+        guild_id: Optional[int] = None,
+        user_id: Optional[int] = None
+    ):
+        """Write changed wrestler rows through to the roster cache.
+        
+        Call right after the write's commit, while still holding the writer:
+        pass the wrestler IDs that changed, or a guild (and optionally user)
+        for bulk updates.
+        """
+        self._after_commit(self.rosters.touch)
+        
+        if wrestler_ids is not None:
+            wrestler_ids = [
+                w_id for w_id in wrestler_ids
+                if self.rosters.guild_of(w_id) is not None or
+                (guild_id is not None and self.rosters.is_cached(guild_id))
+            ]
+            if not wrestler_ids:
+                return
+            placeholders = ",".join("?" * len(wrestler_ids))
+            query, params = f"SELECT * FROM wrestlers WHERE id IN ({placeholders})", wrestler_ids
+        elif guild_id is not None and self.rosters.is_cached(guild_id):
+            if user_id is not None:
+                query, params = "SELECT * FROM wrestlers WHERE guild_id = ? AND user_id = ?", (guild_id, user_id)
+            else:
+                query, params = "SELECT * FROM wrestlers WHERE guild_id = ?", (guild_id,)
+        else:
+            return
+        
+        async with db.execute(query, params) as cursor:
+            rows = [self._decode_wrestler(row) for row in await cursor.fetchall()]
+        self._after_commit(self.rosters.apply, rows)
     
     async def get_wrestler_by_id(self, wrestler_id: int, guild_id: int) -> Optional[Dict[str, Any]]:
         """Get wrestler by ID"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        roster = self._cached_roster(guild_id)
+        if roster is not None:
+            wrestler = roster.get(wrestler_id)
+            return self._hand_out(wrestler) if wrestler else None
+        
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM wrestlers WHERE id = ? AND guild_id = ? AND is_retired = 0",
                 (wrestler_id, guild_id)
             ) as cursor:
                 row = await cursor.fetchone()
                 if row:
-                    wrestler = dict(row)
-                    wrestler['attributes'] = json.loads(wrestler['attributes'])
-                    if wrestler.get('personality'):
-                        wrestler['personality'] = json.loads(wrestler['personality'])
-                    return wrestler
+                    return self.currency_buffer.merge(self._decode_wrestler(row))
                 return None
     
     async def get_wrestlers_by_user(self, guild_id: int, user_id: int) -> List[Dict[str, Any]]:
         """Get all active wrestlers owned by a user"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        roster = self._cached_roster(guild_id)
+        if roster is not None:
+            return [self._hand_out(w) for w in roster.values() if w['user_id'] == user_id]
+        
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM wrestlers WHERE guild_id = ? AND user_id = ? AND is_retired = 0",
                 (guild_id, user_id)
             ) as cursor:
                 rows = await cursor.fetchall()
-                wrestlers = []
-                for row in rows:
-                    wrestler = dict(row)
-                    wrestler['attributes'] = json.loads(wrestler['attributes'])
-                    if wrestler.get('personality'):
-                        wrestler['personality'] = json.loads(wrestler['personality'])
-                    wrestlers.append(wrestler)
-                return wrestlers
+                return [self.currency_buffer.merge(self._decode_wrestler(row)) for row in rows]
+    
+    async def get_wrestler_by_name(self, guild_id: int, name: str) -> Optional[Dict[str, Any]]:
+        """Get an active wrestler by name (case-insensitive)"""
+        found = await self.get_wrestlers_by_names(guild_id, [name])
+        return found.get(name.lower())
+    
+    async def get_wrestlers_by_names(self, guild_id: int, names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several active wrestlers by name, keyed by lowercased name (missing names are left out)"""
+        wanted = {name.lower() for name in names if name}
+        if not wanted:
+            return {}
+        
+        roster = self._cached_roster(guild_id)
+        if roster is not None:
+            found = {}
+            for w in roster.values():
+                key = w['name'].lower()
+                if key in wanted and key not in found:
+                    found[key] = self._hand_out(w)
+            return found
+        
+        # NOCASE only folds ASCII, so a non-ASCII name means scanning the whole roster
+        if all(name.isascii() for name in wanted):
+            placeholders = ", ".join("?" * len(wanted))
+            name_filter, params = f"AND name COLLATE NOCASE IN ({placeholders})", (guild_id, *wanted)
+        else:
+            name_filter, params = "", (guild_id,)
+        async with self.pool.reader() as db:
+            async with db.execute(
+                f"""SELECT * FROM wrestlers
+                    WHERE guild_id = ? AND is_retired = 0 {name_filter}
+                    ORDER BY id DESC""",
+                params
+            ) as cursor:
+                rows = await cursor.fetchall()
+        # Oldest wrestler wins if two names only differ by case
+        return {
+            row['name'].lower(): self.currency_buffer.merge(self._decode_wrestler(row))
+            for row in rows if row['name'].lower() in wanted
+        }
     
     async def get_all_wrestlers(self, guild_id: int) -> List[Dict[str, Any]]:
-        """Get all active wrestlers in a server"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        """Get all active wrestlers in a server (served from the roster cache after the first read)"""
+        roster = self._cached_roster(guild_id)
+        if roster is not None:
+            return [self._hand_out(w) for w in roster.values()]
+        
+        generation, wrestlers = await self._read_roster(guild_id)
+        if self.pool._active_transaction() is None:
+            if not self.rosters.is_cached(guild_id):  # a coalesced caller may have stored it already
+                self.rosters.store(guild_id, wrestlers, generation)
+            return [self._hand_out(w) for w in wrestlers]
+        return [self.currency_buffer.merge(w) for w in wrestlers]
+    
+    async def get_wrestler_names(self, guild_id: int, active_only: bool = True) -> List[WrestlerName]:
+        """(id, name, user_id) for every wrestler in a server"""
+        roster = self._cached_roster(guild_id) if active_only else None
+        if roster is not None:
+            return [WrestlerName(w['id'], w['name'], w['user_id']) for w in roster.values()]
+        
+        query = "SELECT id, name, user_id FROM wrestlers WHERE guild_id = ?"
+        if active_only:
+            query += " AND is_retired = 0"
+        async with self.pool.reader() as db:
+            async with db.execute(query, (guild_id,)) as cursor:
+                return [WrestlerName(*row) for row in await cursor.fetchall()]
+    
+    async def get_wrestler_summaries(self, guild_id: int, user_id: Optional[int] = None) -> List[WrestlerSummary]:
+        """Compact stats for a server's active wrestlers (optionally one user's)"""
+        pending = self.currency_buffer.pending_for
+        roster = self._cached_roster(guild_id)
+        if roster is not None:
+            return [
+                WrestlerSummary(
+                    w['id'], w['name'], w['user_id'], w['alignment'], w['archetype'], w['weight_class'],
+                    w['level'], w['wins'], w['losses'], w['currency'] + pending(w['id'])
+                )
+                for w in roster.values()
+                if user_id is None or w['user_id'] == user_id
+            ]
+        
+        query = """
+            SELECT id, name, user_id, alignment, archetype, weight_class, level, wins, losses, currency
+            FROM wrestlers WHERE guild_id = ? AND is_retired = 0
+        """
+        params = (guild_id,)
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params = (guild_id, user_id)
+        async with self.pool.reader() as db:
+            async with db.execute(query, params) as cursor:
+                rows = await cursor.fetchall()
+        return [WrestlerSummary(*row[:9], row[9] + pending(row[0])) for row in rows]
+    
+    @coalesced
+    async def _read_roster(self, guild_id: int):
+        """Read and decode a guild's active roster. Returns (cache generation at start, wrestlers)"""
+        generation = self.rosters.generation
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM wrestlers WHERE guild_id = ? AND is_retired = 0",
                 (guild_id,)
             ) as cursor:
                 rows = await cursor.fetchall()
-                wrestlers = []
-                for row in rows:
-                    wrestler = dict(row)
-                    wrestler['attributes'] = json.loads(wrestler['attributes'])
-                    if wrestler.get('personality'):
-                        wrestler['personality'] = json.loads(wrestler['personality'])
-                    wrestlers.append(wrestler)
-                return wrestlers
+        return generation, [self._decode_wrestler(row) for row in rows]
     
     async def update_wrestler_currency(self, wrestler_id: int, amount: int):
         """Update wrestler's currency"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE wrestlers SET currency = currency + ? WHERE id = ?",
                 (amount, wrestler_id)
             )
             await db.commit()
+            await self._sync_roster(db, [wrestler_id])
+        self._after_commit(self.leaderboards.add_currency, wrestler_id, amount)
     
-    async def update_wrestler_attribute(self, wrestler_id: int, attribute: str, amount: int):
-        """Update a wrestler's attribute"""
-        async with aiosqlite.connect(self.db_path) as db:
-            # Get current attributes
+    async def update_wrestler_attribute(
+        self,
+        wrestler_id: int,
+        attribute: str,
+        amount: int,
+        cost: int = 0
+    ) -> Optional[AttributeUpgrade]:
+        """Raise a wrestler's attribute (capped by their level) and charge `cost`, in one statement.
+        
+        Nothing changes and None is returned if the wrestler doesn't exist, the
+        attribute is already at the level cap, or they can't afford `cost`.
+        """
+        index = ATTRIBUTE_INDEX[attribute]
+        async with self.pool.writer() as db:
+            # Chat currency still in the buffer counts towards the balance. It
+            # is only flushed on the writer, so it can't change under us here.
+            pending = self.currency_buffer.pending_for(wrestler_id)
             async with db.execute(
-                "SELECT attributes FROM wrestlers WHERE id = ?",
-                (wrestler_id,)
+                "SELECT attr_get(attributes, ?) FROM wrestlers WHERE id = ?",
+                (index, wrestler_id)
+            ) as cursor:
+                before = await cursor.fetchone()
+            async with db.execute(
+                f"""
+                UPDATE wrestlers
+                SET attributes = attr_set(attributes, :index, max(
+                        attr_get(attributes, :index),
+                        min({ATTRIBUTE_CAP_SQL}, attr_get(attributes, :index) + :amount)
+                    )),
+                    currency = currency - :cost
+                WHERE id = :wrestler_id
+                  AND currency + :pending >= :cost
+                  AND attr_get(attributes, :index) < {ATTRIBUTE_CAP_SQL}
+                RETURNING attr_get(attributes, :index), currency
+                """,
+                {'index': index, 'amount': amount, 'cost': cost, 'pending': pending, 'wrestler_id': wrestler_id}
             ) as cursor:
                 row = await cursor.fetchone()
-                if row:
-                    attributes = json.loads(row[0])
-                    # Update attribute (cap at 100)
-                    current = attributes.get(attribute, DEFAULT_ATTRIBUTE_VALUE)
-                    attributes[attribute] = min(100, current + amount)
-                    
-                    # Save back
-                    await db.execute(
-                        "UPDATE wrestlers SET attributes = ? WHERE id = ?",
-                        (json.dumps(attributes), wrestler_id)
-                    )
-                    await db.commit()
-                    return attributes[attribute]
-        return None
+            await db.commit()
+            if row is None:
+                return None
+            await self._sync_roster(db, [wrestler_id])
+        if cost:
+            self._after_commit(self.leaderboards.add_currency, wrestler_id, -cost)
+        return AttributeUpgrade(before[0], row[0], row[1] + pending)
     
     async def retire_wrestler(self, wrestler_id: int):
         """Mark wrestler as retired"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE wrestlers SET is_retired = 1 WHERE id = ?",
                 (wrestler_id,)
             )
             await db.commit()
+            await self._sync_roster(db, [wrestler_id])
+        self._after_commit(self.leaderboards.remove_wrestler, wrestler_id)
+        self._after_commit(self.currency_buffer.remove_wrestler, wrestler_id)
+        self._after_commit(self.name_indexes.remove, WRESTLERS, wrestler_id)
+        self._after_commit(self.taken_moves.remove, wrestler_id)
+    
+    async def _load_taken_moves(self, guild_id: int):
+        """Load a guild's taken finishers and signatures"""
+        roster = self._cached_roster(guild_id)
+        if roster is not None:
+            self.taken_moves.load(guild_id, [(w['id'], w['finisher'], w['signature']) for w in roster.values()])
+            return
+        # Read on the writer connection so nothing can commit between this
+        # snapshot and the registry taking over incremental updates
+        async with self.pool.writer() as db:
+            if self.taken_moves.is_loaded(guild_id):
+                return
+            async with db.execute(
+                "SELECT id, finisher, signature FROM wrestlers WHERE guild_id = ? AND is_retired = 0",
+                (guild_id,)
+            ) as cursor:
+                self.taken_moves.load(guild_id, await cursor.fetchall())
+    
+    async def get_taken_moves(self, guild_id: int) -> Dict[str, Set[str]]:
+        """Every finisher and signature used by an active wrestler: {'finisher': {...}, 'signature': {...}}"""
+        if not self.taken_moves.is_loaded(guild_id):
+            await self._load_taken_moves(guild_id)
+        return {
+            FINISHER: self.taken_moves.moves(guild_id, FINISHER),
+            SIGNATURE: self.taken_moves.moves(guild_id, SIGNATURE)
+        }
     
     async def check_move_exists(self, guild_id: int, move: str, move_type: str) -> bool:
         """Check if a unique move is already taken in the server"""
-        async with aiosqlite.connect(self.db_path) as db:
-            column = "finisher" if move_type == "finisher" else "signature"
-            async with db.execute(
-                f"SELECT COUNT(*) FROM wrestlers WHERE guild_id = ? AND {column} = ? AND is_retired = 0",
-                (guild_id, move)
-            ) as cursor:
-                row = await cursor.fetchone()
-                return row[0] > 0
+        if not self.taken_moves.is_loaded(guild_id):
+            await self._load_taken_moves(guild_id)
+        return self.taken_moves.is_taken(guild_id, move, FINISHER if move_type == FINISHER else SIGNATURE)
+    
+    # ==================== AUTOCOMPLETE ====================
+    
+    _NAME_QUERIES = {
+        WRESTLERS: "SELECT id, name, user_id FROM wrestlers WHERE guild_id = ? AND is_retired = 0",
+        CHAMPIONSHIPS: "SELECT id, name FROM championships WHERE guild_id = ? AND is_active = 1",
+        TEMPLATES: "SELECT id, name, type FROM event_templates WHERE guild_id = ?",
+        EVENTS: "SELECT id, full_name AS name FROM event_instances WHERE guild_id = ? AND status = 'planned'",
+    }
+    
+    async def _load_name_index(self, guild_id: int, kind: str):
+        """Build a guild's name index for one kind"""
+        roster = self._cached_roster(guild_id) if kind == WRESTLERS else None
+        if roster is not None:
+            self.name_indexes.load(guild_id, kind, [
+                {'id': w['id'], 'name': w['name'], 'user_id': w['user_id']} for w in roster.values()
+            ])
+            return
+        # Read on the writer connection so nothing can commit between this
+        # snapshot and the index taking over incremental updates
+        async with self.pool.writer() as db:
+            if self.name_indexes.get(guild_id, kind) is not None:
+                return
+            async with db.execute(self._NAME_QUERIES[kind], (guild_id,)) as cursor:
+                rows = await cursor.fetchall()
+            self.name_indexes.load(guild_id, kind, [dict(row) for row in rows])
+    
+    async def search_names(
+        self,
+        guild_id: int,
+        kind: str,
+        current: str,
+        user_id: Optional[int] = None,
+        limit: int = MAX_RESULTS
+    ) -> List[Dict[str, Any]]:
+        """Autocomplete search over 'wrestlers', 'championships', 'templates' or 'events' (planned).
+        
+        Returns dicts with 'id' and 'name' (plus 'user_id' for wrestlers and
+        'type' for templates), prefix matches first. Pass user_id to only
+        search that user's wrestlers.
+        """
+        if self.name_indexes.get(guild_id, kind) is None:
+            await self._load_name_index(guild_id, kind)
+        where = (lambda entry: entry['user_id'] == user_id) if user_id is not None else None
+        return self.name_indexes.get(guild_id, kind).search(current, limit, where)
     
     # ==================== CURRENCY COOLDOWNS ====================
     
     async def get_last_currency_earned(self, guild_id: int, user_id: int) -> Optional[str]:
         """Get when user last earned currency"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT last_earned FROM currency_cooldowns WHERE guild_id = ? AND user_id = ?",
                 (guild_id, user_id)
@@ -540,12 +929,80 @@ class Database:
     
     async def update_currency_cooldown(self, guild_id: int, user_id: int):
         """Update when user last earned currency"""
-        async with aiosqlite.connect(self.db_path) as db:
+        now = datetime.utcnow()
+        async with self.pool.writer() as db:
             await db.execute("""
                 INSERT OR REPLACE INTO currency_cooldowns (guild_id, user_id, last_earned)
                 VALUES (?, ?, ?)
-            """, (guild_id, user_id, datetime.utcnow().isoformat()))
+            """, (guild_id, user_id, now.isoformat()))
             await db.commit()
+        self.currency_buffer.last_earned[(guild_id, user_id)] = now
+    
+    # ==================== CHAT CURRENCY (WRITE-BEHIND) ====================
+    
+    async def _load_currency_cooldowns(self):
+        """Seed the accrual buffer with saved cooldowns"""
+        try:
+            async with self.pool.reader() as db:
+                async with db.execute(
+                    "SELECT guild_id, user_id, last_earned FROM currency_cooldowns"
+                ) as cursor:
+                    self.currency_buffer.load_cooldowns(await cursor.fetchall())
+        except aiosqlite.OperationalError:
+            pass  # Fresh database - initialize() hasn't created the table yet
+    
+    async def accrue_chat_currency(self, guild_id: int, user_id: int, cooldown_seconds: int, amount: int) -> List[int]:
+        """Credit a chatting user's wrestlers in memory (saved by the next flush).
+        
+        Returns the wrestler IDs credited - empty if the user is on cooldown or has no wrestlers.
+        """
+        buffer = self.currency_buffer
+        if buffer.on_cooldown(guild_id, user_id, cooldown_seconds):
+            return []
+        
+        if not buffer.knows_user(guild_id, user_id):
+            # First message from this user since startup - remember their roster
+            async with self.pool.reader() as db:
+                async with db.execute(
+                    "SELECT id FROM wrestlers WHERE guild_id = ? AND user_id = ? AND is_retired = 0",
+                    (guild_id, user_id)
+                ) as cursor:
+                    rows = await cursor.fetchall()
+            buffer.set_user_wrestlers(guild_id, user_id, [row[0] for row in rows])
+        
+        credited = buffer.accrue(guild_id, user_id, amount)
+        for wrestler_id in credited:
+            self.leaderboards.add_currency(wrestler_id, amount)
+        return credited
+    
+    async def flush_currency(self):
+        """Write buffered chat currency and cooldowns to the database in one batch"""
+        buffer = self.currency_buffer
+        if not buffer.has_changes():
+            return
+        currency, cooldowns = buffer.snapshot()
+        async with self.pool.writer() as db:
+            await db.executemany(
+                "UPDATE wrestlers SET currency = currency + ? WHERE id = ?",
+                [(amount, wrestler_id) for wrestler_id, amount in currency.items()]
+            )
+            await db.executemany("""
+                INSERT OR REPLACE INTO currency_cooldowns (guild_id, user_id, last_earned)
+                VALUES (?, ?, ?)
+            """, [(guild_id, user_id, when.isoformat()) for (guild_id, user_id), when in cooldowns.items()])
+            await db.commit()
+            await self._sync_roster(db, list(currency))
+        buffer.mark_flushed(currency, cooldowns)
+    
+    async def _currency_flush_loop(self):
+        """Flush buffered chat currency every few seconds"""
+        while True:
+            await asyncio.sleep(self.currency_flush_interval)
+            try:
+                await self.flush_currency()
+            except Exception as e:
+                # Keep the amounts buffered and try again next time
+                print(f"⚠️ Currency flush failed: {e}")
     
     # ==================== UPGRADE QUEUE ====================
     
@@ -560,7 +1017,7 @@ class Database:
         new_value: int
     ):
         """Add an upgrade to the admin queue"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute("""
                 INSERT INTO upgrade_queue 
                 (guild_id, wrestler_id, wrestler_name, attribute, amount, old_value, new_value, timestamp)
@@ -570,8 +1027,7 @@ class Database:
     
     async def get_pending_upgrades(self, guild_id: int) -> List[Dict[str, Any]]:
         """Get all pending upgrades for a server"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM upgrade_queue WHERE guild_id = ? AND processed = 0 ORDER BY timestamp",
                 (guild_id,)
@@ -581,8 +1037,7 @@ class Database:
     
     async def get_wrestler_upgrade_history(self, wrestler_id: int) -> List[Dict[str, Any]]:
         """Get complete upgrade history for a specific wrestler (including processed)"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM upgrade_queue WHERE wrestler_id = ? ORDER BY timestamp DESC",
                 (wrestler_id,)
@@ -592,7 +1047,7 @@ class Database:
     
     async def clear_processed_upgrades(self, guild_id: int):
         """Mark all upgrades as processed"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE upgrade_queue SET processed = 1 WHERE guild_id = ?",
                 (guild_id,)
@@ -603,9 +1058,9 @@ class Database:
     
     async def get_user_wrestler_limit(self, guild_id: int, user_id: int) -> Optional[int]:
         """Get custom wrestler limit for a user (None if using server default)"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.reader() as db:
             async with db.execute(
-                "SELECT max_wrestlers FROM user_wrestler_limits WHERE guild_id = ? AND user_id = ?",
+                "SELECT wrestler_limit FROM user_wrestler_limits WHERE guild_id = ? AND user_id = ?",
                 (guild_id, user_id)
             ) as cursor:
                 row = await cursor.fetchone()
@@ -629,7 +1084,8 @@ class Database:
         notes: Optional[str] = None
     ) -> int:
         """Record a match result with multiple participants"""
-        async with aiosqlite.connect(self.db_path) as db:
+        match_date = datetime.utcnow().isoformat()
+        async with self.pool.writer() as db:
             cursor = await db.execute("""
                 INSERT INTO matches 
                 (guild_id, event_instance_id, winner_ids, winner_names, loser_ids, loser_names, 
@@ -640,75 +1096,146 @@ class Database:
                 json.dumps(winner_ids), json.dumps(winner_names),
                 json.dumps(loser_ids), json.dumps(loser_names),
                 match_type, finish_type, rating, championship_id, 
-                datetime.utcnow().isoformat(), notes
+                match_date, notes
             ))
+            match_id = cursor.lastrowid
+            
+            await db.executemany("""
+                INSERT OR IGNORE INTO match_participants
+                (match_id, wrestler_id, guild_id, is_winner, match_date)
+                VALUES (?, ?, ?, ?, ?)
+            """, [(match_id, w_id, guild_id, 1, match_date) for w_id in winner_ids] +
+                 [(match_id, l_id, guild_id, 0, match_date) for l_id in loser_ids])
+            
             await db.commit()
-            return cursor.lastrowid
+            return match_id
     
     async def update_wrestler_record(self, wrestler_id: int, won: bool):
-        """Update wrestler's win/loss record"""
-        async with aiosqlite.connect(self.db_path) as db:
-            if won:
-                await db.execute(
-                    "UPDATE wrestlers SET wins = wins + 1 WHERE id = ?",
-                    (wrestler_id,)
-                )
-            else:
-                await db.execute(
-                    "UPDATE wrestlers SET losses = losses + 1 WHERE id = ?",
-                    (wrestler_id,)
-                )
+        """Update wrestler's win/loss record and current streak"""
+        if won:
+            await self.update_wrestler_records([wrestler_id], [])
+        else:
+            await self.update_wrestler_records([], [wrestler_id])
+    
+    async def update_wrestler_records(self, winner_ids: List[int], loser_ids: List[int]):
+        """Update win/loss records and current streaks for everyone in a match"""
+        async with self.pool.writer() as db:
+            # SET expressions all see the pre-update row, so the streak is computed from the old values
+            await db.executemany("""
+                UPDATE wrestlers
+                SET wins = wins + 1,
+                    current_streak = CASE WHEN streak_type = 'W' THEN current_streak + 1 ELSE 1 END,
+                    streak_type = 'W',
+                    longest_win_streak = MAX(
+                        COALESCE(longest_win_streak, 0),
+                        CASE WHEN streak_type = 'W' THEN current_streak + 1 ELSE 1 END
+                    )
+                WHERE id = ?
+            """, [(w_id,) for w_id in winner_ids])
+            await db.executemany("""
+                UPDATE wrestlers
+                SET losses = losses + 1,
+                    current_streak = CASE WHEN streak_type = 'L' THEN current_streak + 1 ELSE 1 END,
+                    streak_type = 'L'
+                WHERE id = ?
+            """, [(l_id,) for l_id in loser_ids])
             await db.commit()
+            await self._sync_roster(db, list(winner_ids) + list(loser_ids))
+        for w_id in winner_ids:
+            self._after_commit(self.leaderboards.record_result, w_id, True)
+        for l_id in loser_ids:
+            self._after_commit(self.leaderboards.record_result, l_id, False)
+    
+    async def get_streak_leaderboard(self, guild_id: int, streak_type: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get wrestlers with the longest current streaks ('W', 'L' or None for either)"""
+        async with self.pool.reader() as db:
+            if streak_type:
+                async with db.execute("""
+                    SELECT id, name, wins, losses, current_streak, streak_type, longest_win_streak
+                    FROM wrestlers
+                    WHERE guild_id = ? AND is_retired = 0 AND streak_type = ? AND current_streak > 0
+                    ORDER BY current_streak DESC
+                    LIMIT ?
+                """, (guild_id, streak_type, limit)) as cursor:
+                    rows = await cursor.fetchall()
+            else:
+                async with db.execute("""
+                    SELECT id, name, wins, losses, current_streak, streak_type, longest_win_streak
+                    FROM wrestlers
+                    WHERE guild_id = ? AND is_retired = 0 AND current_streak > 0
+                    ORDER BY current_streak DESC
+                    LIMIT ?
+                """, (guild_id, limit)) as cursor:
+                    rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+    
+    async def _load_leaderboard(self, guild_id: int):
+        """Seed a guild's in-memory leaderboard from the active roster"""
+        # Read on the writer connection so no stat update can commit between
+        # this snapshot and the engine taking over incremental updates
+        async with self.pool.writer() as db:
+            if self.leaderboards.is_loaded(guild_id):
+                return
+            async with db.execute(
+                "SELECT id, name, wins, losses, currency FROM wrestlers WHERE guild_id = ? AND is_retired = 0",
+                (guild_id,)
+            ) as cursor:
+                rows = await cursor.fetchall()
+            self.leaderboards.load(guild_id, [self.currency_buffer.merge(dict(row)) for row in rows])
+    
+    async def get_leaderboard(self, guild_id: int, stat: str, limit: int = LEADERBOARD_SIZE) -> List[Dict[str, Any]]:
+        """Get the top wrestlers for 'wins', 'winrate' or 'currency' (served from memory)"""
+        if not self.leaderboards.is_loaded(guild_id):
+            await self._load_leaderboard(guild_id)
+        return self.leaderboards.top(guild_id, stat, limit)
+    
+    async def get_leaderboard_counts(self, guild_id: int) -> Dict[str, int]:
+        """Get how many wrestlers exist / have matches / qualify for win rate"""
+        if not self.leaderboards.is_loaded(guild_id):
+            await self._load_leaderboard(guild_id)
+        return self.leaderboards.counts(guild_id)
     
     async def get_wrestler_matches(self, wrestler_id: int, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get match history for a wrestler"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            # Get all recent matches
+        """Get match history for a wrestler (most recent first)"""
+        async with self.pool.reader() as db:
             async with db.execute("""
-                SELECT * FROM matches 
-                ORDER BY match_date DESC
+                SELECT m.* FROM match_participants mp
+                JOIN matches m ON m.id = mp.match_id
+                WHERE mp.wrestler_id = ?
+                ORDER BY mp.match_date DESC
                 LIMIT ?
-            """, (limit * 10,)) as cursor:  # Get more than needed, filter in Python
+            """, (wrestler_id, limit)) as cursor:
                 rows = await cursor.fetchall()
                 matches = []
                 for row in rows:
-                    match = dict(row)
+                    match = Match.from_row(row)
                     # Parse JSON arrays
-                    winner_ids = json.loads(match['winner_ids'])
-                    loser_ids = json.loads(match['loser_ids'])
-                    
-                    # Check if wrestler_id is actually in the arrays
-                    if wrestler_id in winner_ids or wrestler_id in loser_ids:
-                        match['winner_ids'] = winner_ids
-                        match['winner_names'] = json.loads(match['winner_names'])
-                        match['loser_ids'] = loser_ids
-                        match['loser_names'] = json.loads(match['loser_names'])
-                        matches.append(match)
-                        
-                        # Stop once we have enough
-                        if len(matches) >= limit:
-                            break
-                
+                    match['winner_ids'] = json.loads(match['winner_ids'])
+                    match['winner_names'] = json.loads(match['winner_names'])
+                    match['loser_ids'] = json.loads(match['loser_ids'])
+                    match['loser_names'] = json.loads(match['loser_names'])
+                    matches.append(match)
                 return matches
     
     async def set_booker_role(self, guild_id: int, role_id: int):
         """Set the booker role for match/event management"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE server_settings SET booker_role_id = ? WHERE guild_id = ?",
                 (role_id, guild_id)
             )
             await db.commit()
+        self._invalidate_server_settings(guild_id)
     
     async def remove_booker_role(self, guild_id: int):
         """Remove booker role (only admins can manage)"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE server_settings SET booker_role_id = NULL WHERE guild_id = ?",
                 (guild_id,)
             )
             await db.commit()
+        self._invalidate_server_settings(guild_id)
     
     # ==================== CHAMPIONSHIPS (PHASE 2B) ====================
     
@@ -722,7 +1249,7 @@ class Database:
         is_tag_team: bool
     ) -> int:
         """Create a new championship"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             cursor = await db.execute("""
                 INSERT INTO championships 
                 (guild_id, name, description, gender_requirement, weight_class_requirement, 
@@ -733,33 +1260,33 @@ class Database:
                 1 if is_tag_team else 0, datetime.utcnow().isoformat()
             ))
             await db.commit()
-            return cursor.lastrowid
+        self._after_commit(self.name_indexes.add, guild_id, CHAMPIONSHIPS, {'id': cursor.lastrowid, 'name': name})
+        return cursor.lastrowid
     
     async def get_championship_by_name(self, guild_id: int, name: str) -> Optional[Dict[str, Any]]:
         """Get championship by name"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM championships WHERE guild_id = ? AND name = ? AND is_active = 1",
                 (guild_id, name)
             ) as cursor:
                 row = await cursor.fetchone()
-                return dict(row) if row else None
+                return Championship.from_row(row) if row else None
     
+    @coalesced
     async def get_all_championships(self, guild_id: int) -> List[Dict[str, Any]]:
         """Get all active championships"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM championships WHERE guild_id = ? AND is_active = 1 ORDER BY name",
                 (guild_id,)
             ) as cursor:
                 rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
+                return [Championship.from_row(row) for row in rows]
     
     async def update_current_champion(self, championship_id: int, wrestler_id: Optional[int]):
         """Update current champion (None = vacant)"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE championships SET current_champion_id = ? WHERE id = ?",
                 (wrestler_id, championship_id)
@@ -773,56 +1300,65 @@ class Database:
         wrestler_name: str
     ) -> int:
         """Start a new title reign"""
-        async with aiosqlite.connect(self.db_path) as db:
-            # Get reign number (previous reigns + 1)
-            async with db.execute(
-                "SELECT COUNT(*) FROM title_reigns WHERE championship_id = ? AND wrestler_id = ?",
-                (championship_id, wrestler_id)
-            ) as cursor:
-                row = await cursor.fetchone()
-                reign_number = row[0] + 1
+        reign_ids = await self.start_title_reigns(championship_id, [(wrestler_id, wrestler_name)])
+        return reign_ids[0]
+    
+    async def start_title_reigns(self, championship_id: int, champions: List[Tuple[int, str]]) -> List[int]:
+        """Start new title reigns for (wrestler_id, wrestler_name) pairs - two for tag titles"""
+        won_date = datetime.utcnow().isoformat()
+        wrestler_ids = [w_id for w_id, _ in champions]
+        async with self.pool.writer() as db:
+            # Get reign numbers (previous reigns + 1)
+            placeholders = ",".join("?" * len(wrestler_ids))
+            async with db.execute(f"""
+                SELECT wrestler_id, COUNT(*) FROM title_reigns
+                WHERE championship_id = ? AND wrestler_id IN ({placeholders})
+                GROUP BY wrestler_id
+            """, (championship_id, *wrestler_ids)) as cursor:
+                previous_reigns = dict(await cursor.fetchall())
             
-            # Create new reign
-            cursor = await db.execute("""
-                INSERT INTO title_reigns
-                (championship_id, wrestler_id, wrestler_name, reign_number, 
-                 won_date, days_held, successful_defenses, is_current)
-                VALUES (?, ?, ?, ?, ?, 0, 0, 1)
-            """, (
-                championship_id, wrestler_id, wrestler_name, reign_number,
-                datetime.utcnow().isoformat()
-            ))
+            # Create new reigns
+            reign_ids = []
+            for wrestler_id, wrestler_name in champions:
+                cursor = await db.execute("""
+                    INSERT INTO title_reigns
+                    (championship_id, wrestler_id, wrestler_name, reign_number, 
+                     won_date, days_held, successful_defenses, is_current)
+                    VALUES (?, ?, ?, ?, ?, 0, 0, 1)
+                """, (
+                    championship_id, wrestler_id, wrestler_name,
+                    previous_reigns.get(wrestler_id, 0) + 1, won_date
+                ))
+                reign_ids.append(cursor.lastrowid)
             await db.commit()
-            return cursor.lastrowid
+            return reign_ids
     
     async def end_title_reign(self, championship_id: int):
-        """End current title reign"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            # Get current reign
+        """End current title reign (both reigns for tag titles)"""
+        now = datetime.utcnow()
+        async with self.pool.writer() as db:
+            # Get current reigns
             async with db.execute(
-                "SELECT * FROM title_reigns WHERE championship_id = ? AND is_current = 1",
+                "SELECT id, won_date FROM title_reigns WHERE championship_id = ? AND is_current = 1",
                 (championship_id,)
             ) as cursor:
-                reign = await cursor.fetchone()
+                reigns = await cursor.fetchall()
             
-            if reign:
-                reign_dict = dict(reign)
-                won_date = datetime.fromisoformat(reign_dict['won_date'])
-                days_held = (datetime.utcnow() - won_date).days
-                
-                # Update reign
-                await db.execute("""
+            if reigns:
+                await db.executemany("""
                     UPDATE title_reigns 
                     SET lost_date = ?, days_held = ?, is_current = 0
                     WHERE id = ?
-                """, (datetime.utcnow().isoformat(), days_held, reign_dict['id']))
+                """, [
+                    (now.isoformat(), (now - datetime.fromisoformat(won_date)).days, reign_id)
+                    for reign_id, won_date in reigns
+                ])
                 
                 await db.commit()
     
     async def increment_title_defense(self, championship_id: int):
         """Increment successful defenses for current champion"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute("""
                 UPDATE title_reigns 
                 SET successful_defenses = successful_defenses + 1
@@ -832,19 +1368,17 @@ class Database:
     
     async def get_current_reign(self, championship_id: int) -> Optional[Dict[str, Any]]:
         """Get current title reign"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM title_reigns WHERE championship_id = ? AND is_current = 1",
                 (championship_id,)
             ) as cursor:
                 row = await cursor.fetchone()
-                return dict(row) if row else None
+                return TitleReign.from_row(row) if row else None
     
     async def get_championship_reigns(self, championship_id: int) -> List[Dict[str, Any]]:
         """Get all reigns for a championship"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute("""
                 SELECT tr.*, c.name as championship_name
                 FROM title_reigns tr
@@ -853,12 +1387,11 @@ class Database:
                 ORDER BY tr.won_date DESC
             """, (championship_id,)) as cursor:
                 rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
+                return [TitleReign.from_row(row) for row in rows]
     
     async def get_wrestler_title_reigns(self, wrestler_id: int) -> List[Dict[str, Any]]:
         """Get all title reigns for a wrestler"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute("""
                 SELECT tr.*, c.name as championship_name
                 FROM title_reigns tr
@@ -867,7 +1400,7 @@ class Database:
                 ORDER BY tr.won_date DESC
             """, (wrestler_id,)) as cursor:
                 rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
+                return [TitleReign.from_row(row) for row in rows]
     
     async def check_championship_eligibility(
         self,
@@ -877,8 +1410,7 @@ class Database:
         is_tag_team: bool
     ) -> Optional[str]:
         """Check if wrestler is eligible for championship. Returns error message or None"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM championships WHERE id = ?",
                 (championship_id,)
@@ -912,7 +1444,7 @@ class Database:
         description: Optional[str]
     ) -> int:
         """Create a new event/show"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             cursor = await db.execute("""
                 INSERT INTO events 
                 (guild_id, name, event_date, description, created_at, is_completed)
@@ -923,8 +1455,7 @@ class Database:
     
     async def get_event_by_name(self, guild_id: int, name: str) -> Optional[Dict[str, Any]]:
         """Get event by name"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM events WHERE guild_id = ? AND name = ?",
                 (guild_id, name)
@@ -934,8 +1465,7 @@ class Database:
     
     async def get_all_events(self, guild_id: int) -> List[Dict[str, Any]]:
         """Get all events for a server"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM events WHERE guild_id = ? ORDER BY event_date DESC",
                 (guild_id,)
@@ -954,7 +1484,7 @@ class Database:
         match_order: Optional[int]
     ) -> int:
         """Add a planned match to an event"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             cursor = await db.execute("""
                 INSERT INTO event_matches
                 (event_id, match_type, wrestler_ids, wrestler_names, championship_id,
@@ -979,7 +1509,7 @@ class Database:
         match_order: Optional[int]
     ) -> int:
         """Add an open spot match to an event"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             cursor = await db.execute("""
                 INSERT INTO event_matches
                 (event_id, match_type, championship_id, stipulation, match_order,
@@ -994,8 +1524,7 @@ class Database:
     
     async def get_event_matches(self, event_id: int) -> List[Dict[str, Any]]:
         """Get all matches for an event"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute("""
                 SELECT em.*, c.name as championship_name
                 FROM event_matches em
@@ -1008,7 +1537,7 @@ class Database:
     
     async def update_event_announcement(self, event_id: int, message_id: int):
         """Save announcement message ID"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE events SET announcement_message_id = ? WHERE id = ?",
                 (message_id, event_id)
@@ -1017,8 +1546,7 @@ class Database:
     
     async def get_event_by_id(self, event_id: int) -> Optional[Dict[str, Any]]:
         """Get event by ID"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM events WHERE id = ?",
                 (event_id,)
@@ -1034,7 +1562,7 @@ class Database:
         announcement_channel_id: Optional[int], banner_url: Optional[str]
     ) -> int:
         """Create reusable template"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             cursor = await db.execute("""
                 INSERT INTO event_templates 
                 (guild_id, type, name, description, default_time, 
@@ -1043,12 +1571,13 @@ class Database:
             """, (guild_id, template_type, name, description, default_time,
                   announcement_channel_id, banner_url, datetime.utcnow().isoformat()))
             await db.commit()
-            return cursor.lastrowid
+        self._after_commit(self.name_indexes.add, guild_id, TEMPLATES, {'id': cursor.lastrowid, 'name': name, 'type': template_type})
+        return cursor.lastrowid
     
+    @coalesced
     async def get_event_templates(self, guild_id: int, template_type: Optional[str] = None):
         """Get all templates"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             if template_type:
                 async with db.execute(
                     "SELECT * FROM event_templates WHERE guild_id = ? AND type = ?",
@@ -1083,7 +1612,7 @@ class Database:
         announcement_channel_id: Optional[int]
     ):
         """Create instance with auto-numbering"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             # Get next number
             async with db.execute(
                 "SELECT MAX(instance_number) FROM event_instances WHERE guild_id = ? AND template_id = ?",
@@ -1107,12 +1636,13 @@ class Database:
                   date, time, description, banner_url, announcement_channel_id,
                   datetime.utcnow().isoformat()))
             await db.commit()
-            return cursor.lastrowid, full_name
+        self._after_commit(self.name_indexes.add, guild_id, EVENTS, {'id': cursor.lastrowid, 'name': full_name})
+        return cursor.lastrowid, full_name
     
+    @coalesced
     async def get_event_instances(self, guild_id: int, status: Optional[str] = None):
         """Get all instances"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             if status:
                 async with db.execute(
                     "SELECT * FROM event_instances WHERE guild_id = ? AND status = ? ORDER BY date DESC",
@@ -1125,36 +1655,34 @@ class Database:
                     (guild_id,)
                 ) as cursor:
                     rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+            return [EventInstance.from_row(row) for row in rows]
     
     async def get_event_instance_by_name(self, guild_id: int, name: str):
         """Get instance by name"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM event_instances WHERE guild_id = ? AND full_name = ?",
                 (guild_id, name)
             ) as cursor:
                 row = await cursor.fetchone()
-                return dict(row) if row else None
+                return EventInstance.from_row(row) if row else None
     
     async def get_event_instance_by_id(self, event_id: int):
         """Get instance by ID"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM event_instances WHERE id = ?",
                 (event_id,)
             ) as cursor:
                 row = await cursor.fetchone()
-                return dict(row) if row else None
+                return EventInstance.from_row(row) if row else None
     
     async def add_event_match(
         self, event_id: int, order: int, match_type: str,
         participants: List[int], championship_id: Optional[int], is_main: bool
     ) -> int:
         """Add match to card"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             cursor = await db.execute("""
                 INSERT INTO event_instance_matches
                 (event_instance_id, match_order, match_type, participants,
@@ -1170,7 +1698,7 @@ class Database:
         spots: int, description: Optional[str], is_main: bool
     ) -> int:
         """Add open spot match"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             cursor = await db.execute("""
                 INSERT INTO event_instance_matches
                 (event_instance_id, match_order, match_type, participants,
@@ -1183,8 +1711,7 @@ class Database:
     
     async def get_event_matches(self, event_id: int):
         """Get all matches for event"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM event_instance_matches WHERE event_instance_id = ? ORDER BY match_order",
                 (event_id,)
@@ -1199,8 +1726,7 @@ class Database:
     
     async def apply_for_match(self, match_id: int, wrestler_id: int, user_id: int) -> int:
         """Apply for open spot (auto-accept first come first serve)"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.writer() as db:
             async with db.execute(
                 "SELECT * FROM event_instance_matches WHERE id = ?", (match_id,)
             ) as cursor:
@@ -1233,21 +1759,28 @@ class Database:
     
     async def update_event_status(self, event_id: int, status: str):
         """Update event status (planned/ongoing/closed)"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "UPDATE event_instances SET status = ? WHERE id = ?",
+        async with self.pool.writer() as db:
+            async with db.execute(
+                "UPDATE event_instances SET status = ? WHERE id = ? RETURNING guild_id, full_name",
                 (status, event_id)
-            )
+            ) as cursor:
+                event = await cursor.fetchone()
             if status == 'closed':
                 await db.execute(
                     "UPDATE event_instances SET completed_at = ? WHERE id = ?",
                     (datetime.utcnow().isoformat(), event_id)
                 )
             await db.commit()
+        # Only planned events are offered by autocomplete
+        if status == 'planned':
+            if event:
+                self._after_commit(self.name_indexes.add, event['guild_id'], EVENTS, {'id': event_id, 'name': event['full_name']})
+        else:
+            self._after_commit(self.name_indexes.remove, EVENTS, event_id)
     
     async def update_current_champions(self, championship_id: int, wrestler_ids: List[int]):
         """Update current champion(s) - supports singles and tag teams"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             import json
             await db.execute(
                 "UPDATE championships SET current_champion_ids = ?, current_champion_id = ? WHERE id = ?",
@@ -1257,30 +1790,27 @@ class Database:
     
     async def get_championship_by_id(self, championship_id: int) -> Optional[Dict[str, Any]]:
         """Get championship by ID"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM championships WHERE id = ?",
                 (championship_id,)
             ) as cursor:
                 row = await cursor.fetchone()
-                return dict(row) if row else None
+                return Championship.from_row(row) if row else None
     
     async def get_match_by_id(self, match_id: int) -> Optional[Dict[str, Any]]:
         """Get match by ID"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM matches WHERE id = ?",
                 (match_id,)
             ) as cursor:
                 row = await cursor.fetchone()
-                return dict(row) if row else None
+                return Match.from_row(row) if row else None
     
-    async def link_match_to_event_match(self, event_instance_id: int, match_id: int, match_type: str, participants: List[int]):
+    async def link_match_to_event_match(self, event_instance_id: int, match_id: int, match_type: str):
         """Link a recorded match to an event match card"""
-        async with aiosqlite.connect(self.db_path) as db:
-            import json
+        async with self.pool.reader() as db:
             # Find matching event match
             async with db.execute("""
                 SELECT id FROM event_instance_matches 
@@ -1291,22 +1821,131 @@ class Database:
                 LIMIT 1
             """, (event_instance_id, match_type)) as cursor:
                 event_match = await cursor.fetchone()
+        
+        if event_match:
+            await self.complete_event_match(event_match[0], match_id)
+            return event_match[0]
+        
+        return None
+    
+    async def complete_event_match(self, event_match_id: int, match_id: int):
+        """Link a recorded match to its event card slot and mark it completed"""
+        async with self.pool.writer() as db:
+            await db.execute("""
+                UPDATE event_instance_matches 
+                SET match_id = ?, status = 'completed'
+                WHERE id = ?
+            """, (match_id, event_match_id))
+            await db.commit()
+    
+    async def record_event_match(
+        self,
+        guild_id: int,
+        event_instance_id: int,
+        event_match_id: int,
+        match_type: str,
+        winner_ids: List[int],
+        winner_names: List[str],
+        loser_ids: List[int],
+        loser_names: List[str],
+        finish_type: str,
+        rating: Optional[float] = None,
+        championship_id: Optional[int] = None,
+        is_main_event: bool = False
+    ) -> Dict[str, Any]:
+        """Record an event card result in one go: titles, match, records, rivalry, XP and card link"""
+        participants = winner_ids + loser_ids
+        title_changed = False
+        new_champion_names = None
+        
+        async with self.transaction():
+            # ===== Championship =====
+            if championship_id:
+                champ = await self.get_championship_by_id(championship_id)
+                
+                current_champion_ids = []
+                if champ and champ.get('current_champion_ids'):
+                    current_champion_ids = champ['current_champion_ids']
+                    if isinstance(current_champion_ids, str):
+                        current_champion_ids = json.loads(current_champion_ids)
+                elif champ and champ.get('current_champion_id'):
+                    current_champion_ids = [champ['current_champion_id']]
+                
+                if current_champion_ids and all(c_id in loser_ids for c_id in current_champion_ids):
+                    # TITLE CHANGE! Tag titles go to the first two winners
+                    title_changed = True
+                    new_count = 2 if champ['is_tag_team'] and len(winner_ids) >= 2 else 1
+                    new_champ_ids = winner_ids[:new_count]
+                    new_champ_names = [
+                        winner_names[i] if i < len(winner_names) else winner_names[0]
+                        for i in range(new_count)
+                    ]
+                    new_champion_names = " & ".join(new_champ_names)
+                    
+                    await self.end_title_reign(championship_id)
+                    await self.start_title_reigns(championship_id, list(zip(new_champ_ids, new_champ_names)))
+                    await self.update_current_champions(championship_id, new_champ_ids)
+                
+                elif any(c_id in winner_ids for c_id in current_champion_ids):
+                    # Successful defense
+                    await self.increment_title_defense(championship_id)
             
-            if event_match:
-                # Link and mark as completed
-                await db.execute("""
-                    UPDATE event_instance_matches 
-                    SET match_id = ?, status = 'completed'
-                    WHERE id = ?
-                """, (match_id, event_match[0]))
-                await db.commit()
-                return event_match[0]
+            # ===== Match, records & streaks =====
+            match_id = await self.record_match(
+                guild_id=guild_id,
+                winner_ids=winner_ids,
+                winner_names=winner_names,
+                loser_ids=loser_ids,
+                loser_names=loser_names,
+                match_type=match_type,
+                finish_type=finish_type,
+                rating=rating,
+                championship_id=championship_id,
+                event_instance_id=event_instance_id
+            )
+            await self.update_wrestler_records(winner_ids, loser_ids)
             
-            return None
+            # ===== Rivalry =====
+            rivalry = await self.check_rivalry_between_wrestlers(participants)
+            if rivalry:
+                await self.update_rivalry_after_match(rivalry['id'], winner_ids, loser_ids)
+            
+            # ===== XP & level ups =====
+            xp_awards = {}
+            for w_id in winner_ids:
+                xp_awards[w_id] = self.calculate_match_xp(True, is_main_event, championship_id, rating, rivalry is not None)
+            for l_id in loser_ids:
+                xp_awards[l_id] = self.calculate_match_xp(False, is_main_event, championship_id, rating, rivalry is not None)
+            progress = await self.add_xp_to_wrestlers(xp_awards)
+            
+            # ===== Event card =====
+            await self.complete_event_match(event_match_id, match_id)
+        
+        xp_results = []
+        for w_id, name in list(zip(winner_ids, winner_names)) + list(zip(loser_ids, loser_names)):
+            level = progress.get(w_id)
+            leveled_up = level is not None and level['new_level'] > level['old_level']
+            xp_results.append({
+                'wrestler_id': w_id,
+                'name': name,
+                'xp_gained': xp_awards[w_id],
+                'leveled_up': leveled_up,
+                'new_level': level['new_level'] if leveled_up else None,
+                'bonus_currency': level['bonus_currency'] if level else 0,
+                'rivalry_bonus': rivalry is not None  # Flag for display
+            })
+        
+        return {
+            'match_id': match_id,
+            'title_changed': title_changed,
+            'new_champion_names': new_champion_names,
+            'has_rivalry': rivalry is not None,
+            'xp_results': xp_results
+        }
     
     async def update_event_instance_announcement(self, event_instance_id: int, message_id: int):
         """Save announcement message ID for event instance"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE event_instances SET announcement_message_id = ? WHERE id = ?",
                 (message_id, event_instance_id)
@@ -1315,35 +1954,20 @@ class Database:
     
     async def delete_event_match(self, event_match_id: int):
         """Delete an event match"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute("DELETE FROM event_instance_matches WHERE id = ?", (event_match_id,))
             await db.commit()
     
     async def delete_event_instance(self, event_instance_id: int):
         """Delete an event instance"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute("DELETE FROM event_instances WHERE id = ?", (event_instance_id,))
             await db.commit()
+        self._after_commit(self.name_indexes.remove, EVENTS, event_instance_id)
     
     # ========== LEVEL SYSTEM ==========
     
     
-    async def get_attribute_cap(self, level: int) -> int:
-        """Get the attribute cap for a given level"""
-        caps = {
-            1: 70,
-            2: 75,
-            3: 80,
-            4: 85,
-            5: 90,
-            6: 92,
-            7: 95,
-            8: 97,
-            9: 99,
-            10: 100
-        }
-        return caps.get(level, 70)
-    
     async def get_upgrade_cost(self, current_value: int) -> int:
         """Calculate cost to upgrade attribute (progressive tax)"""
         # Base cost increases with attribute value
@@ -1358,72 +1982,121 @@ class Database:
         else:
             return 2000  # 95-100 is very expensive
     
+    def calculate_level_up(self, current_level: int, new_xp: int):
+        """Work out the level for a new XP total. Returns (new_level, bonus_currency)"""
+        # Level thresholds
+        thresholds = [0, 250, 850, 1950, 3750, 6450, 10250, 15450, 22450, 31950]
+        
+        # Check for level up
+        new_level = current_level
+        if current_level < 10:
+            for level in range(current_level, 10):
+                if new_xp >= thresholds[level]:
+                    new_level = level + 1
+                else:
+                    break
+        
+        # Currency bonus on level up
+        bonus_currency = 0
+        if new_level > current_level:
+            if new_level == 2:
+                bonus_currency = 500
+            elif new_level == 6:
+                bonus_currency = 1000
+        
+        return new_level, bonus_currency
+    
+    def calculate_match_xp(
+        self,
+        won: bool,
+        is_main_event: bool = False,
+        championship_id: Optional[int] = None,
+        rating: Optional[float] = None,
+        has_rivalry: bool = False
+    ) -> int:
+        """XP earned for one wrestler's part in a match"""
+        xp = 50 if won else 10  # Base win XP / participation XP
+        
+        # Main event bonus (losers still get it for participating)
+        if is_main_event:
+            xp += 25
+        
+        # Championship bonus
+        if championship_id:
+            xp += 100
+        
+        # Rating bonus (winners only)
+        if won and rating:
+            if rating >= 5.0:
+                xp += 50
+            elif rating >= 4.5:
+                xp += 40
+            elif rating >= 4.0:
+                xp += 30
+            elif rating >= 3.5:
+                xp += 20
+            elif rating >= 3.0:
+                xp += 10
+        
+        # Rivalry bonus (10%)
+        if has_rivalry:
+            xp = int(xp * (1 + 0.10))
+        
+        return xp
+    
     async def add_xp(self, wrestler_id: int, xp: int):
         """Add XP to wrestler and check for level up"""
-        async with aiosqlite.connect(self.db_path) as db:
+        progress = await self.add_xp_to_wrestlers({wrestler_id: xp})
+        result = progress.get(wrestler_id)
+        
+        # Return level up info if leveled
+        if result and result['new_level'] > result['old_level']:
+            return result
+        return None
+    
+    async def add_xp_to_wrestlers(self, xp_awards: Dict[int, int]) -> Dict[int, Dict[str, int]]:
+        """Add XP to several wrestlers at once. Returns level progress for each one found"""
+        wrestler_ids = list(xp_awards)
+        if not wrestler_ids:
+            return {}
+        
+        async with self.pool.writer() as db:
             # Get current stats
+            placeholders = ",".join("?" * len(wrestler_ids))
             async with db.execute(
-                "SELECT level, xp FROM wrestlers WHERE id = ?",
-                (wrestler_id,)
+                f"SELECT id, level, xp FROM wrestlers WHERE id IN ({placeholders})",
+                wrestler_ids
             ) as cursor:
-                result = await cursor.fetchone()
-                if not result:
-                    return None
-                
-                current_level, current_xp = result
-                new_xp = current_xp + xp
-                
-                # Level thresholds
-                thresholds = [0, 250, 850, 1950, 3750, 6450, 10250, 15450, 22450, 31950]
-                
-                # Check for level up
-                new_level = current_level
-                if current_level < 10:
-                    for level in range(current_level, 10):
-                        if new_xp >= thresholds[level]:
-                            new_level = level + 1
-                        else:
-                            break
-                
-                # Update wrestler
-                await db.execute(
-                    "UPDATE wrestlers SET xp = ?, level = ? WHERE id = ?",
-                    (new_xp, new_level, wrestler_id)
-                )
-                
-                # Award currency bonus on level up
-                if new_level > current_level:
-                    bonus_currency = 0
-                    if new_level == 2:
-                        bonus_currency = 500
-                    elif new_level == 6:
-                        bonus_currency = 1000
-                    
-                    if bonus_currency > 0:
-                        await db.execute(
-                            "UPDATE wrestlers SET currency = currency + ? WHERE id = ?",
-                            (bonus_currency, wrestler_id)
-                        )
-                
-                await db.commit()
-                
-                # Return level up info if leveled
-                if new_level > current_level:
-                    return {
-                        'old_level': current_level, 
-                        'new_level': new_level, 
-                        'xp': new_xp,
-                        'bonus_currency': bonus_currency if new_level > current_level else 0
-                    }
-                return None
+                rows = await cursor.fetchall()
+            
+            progress = {}
+            for w_id, current_level, current_xp in rows:
+                new_xp = current_xp + xp_awards[w_id]
+                new_level, bonus_currency = self.calculate_level_up(current_level, new_xp)
+                progress[w_id] = {
+                    'old_level': current_level,
+                    'new_level': new_level,
+                    'xp': new_xp,
+                    'bonus_currency': bonus_currency
+                }
+            
+            # Update wrestlers (plus any level-up bonus)
+            await db.executemany(
+                "UPDATE wrestlers SET xp = ?, level = ?, currency = currency + ? WHERE id = ?",
+                [(p['xp'], p['new_level'], p['bonus_currency'], w_id) for w_id, p in progress.items()]
+            )
+            
+            await db.commit()
+            await self._sync_roster(db, list(progress))
+        
+        for w_id, p in progress.items():
+            if p['bonus_currency'] > 0:
+                self._after_commit(self.leaderboards.add_currency, w_id, p['bonus_currency'])
+        return progress
     
     async def get_attribute_cap(self, level: int) -> int:
         """Get maximum attribute value for a given level"""
-        caps = {
-            1: 70, 2: 75, 3: 80, 4: 85, 5: 90,
-            6: 92, 7: 95, 8: 97, 9: 99, 10: 100
-        }
-        return caps.get(level, 70)
+        return ATTRIBUTE_CAPS.get(level, DEFAULT_ATTRIBUTE_CAP)
     
     async def get_level_unlock(self, level: int) -> str:
         """Get unlock description for a level"""
@@ -1445,7 +2118,7 @@ class Database:
         """Claim daily reward and update streak"""
         from datetime import datetime, timedelta
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             # Get current data
             async with db.execute(
                 "SELECT last_daily_claim, daily_streak, longest_streak, currency FROM wrestlers WHERE id = ?",
@@ -1506,13 +2179,15 @@ class Database:
                     (now.isoformat(), new_streak, new_longest, reward, wrestler_id)
                 )
                 await db.commit()
+                await self._sync_roster(db, [wrestler_id])
+                self._after_commit(self.leaderboards.add_currency, wrestler_id, reward)
                 
                 return {
                     'success': True,
                     'reward': reward,
                     'streak': new_streak,
                     'streak_broken': streak_broken,
-                    'new_balance': currency + reward,
+                    'new_balance': currency + reward + self.currency_buffer.pending_for(wrestler_id),
                     'is_milestone': new_streak in [3, 7, 14, 30]
                 }
     
@@ -1533,17 +2208,18 @@ class Database:
     
     async def set_default_wrestler_limit(self, guild_id: int, limit: int):
         """Set default wrestler limit for all users"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE server_settings SET default_wrestler_limit = ? WHERE guild_id = ?",
                 (limit, guild_id)
             )
             await db.commit()
+        self._invalidate_server_settings(guild_id)
     
     async def set_user_wrestler_limit(self, guild_id: int, user_id: int, limit: int):
         """Set wrestler limit for specific user"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self.pool.writer() as db:
                 # Check if user limit exists
                 async with db.execute(
                     "SELECT * FROM user_wrestler_limits WHERE guild_id = ? AND user_id = ?",
@@ -1570,21 +2246,23 @@ class Database:
     
     async def update_currency_settings(self, guild_id: int, currency_name: str, currency_symbol: str):
         """Update currency settings"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE server_settings SET currency_name = ?, currency_symbol = ? WHERE guild_id = ?",
                 (currency_name, currency_symbol, guild_id)
             )
             await db.commit()
+        self._invalidate_server_settings(guild_id)
     
     async def set_shop_channel(self, guild_id: int, channel_id: int):
         """Set shop channel restriction"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE server_settings SET shop_channel_id = ? WHERE guild_id = ?",
                 (channel_id, guild_id)
             )
             await db.commit()
+        self._invalidate_server_settings(guild_id)
     
     async def create_server_settings(
         self,
@@ -1595,17 +2273,18 @@ class Database:
         booker_role_id: Optional[int] = None
     ):
         """Create initial server settings"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute("""
                 INSERT INTO server_settings 
                 (guild_id, currency_name, currency_symbol, announcement_channel_id, booker_role_id, setup_completed)
                 VALUES (?, ?, ?, ?, ?, 1)
             """, (guild_id, currency_name, currency_symbol, announcement_channel_id, booker_role_id))
             await db.commit()
+        self._invalidate_server_settings(guild_id)
     
     async def get_wrestler_limit(self, guild_id: int, user_id: int) -> int:
         """Get wrestler limit for a user (checks user-specific first, then default)"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.reader() as db:
             # Check user-specific limit
             async with db.execute(
                 "SELECT wrestler_limit FROM user_wrestler_limits WHERE guild_id = ? AND user_id = ?",
@@ -1627,20 +2306,20 @@ class Database:
     
     async def update_last_active(self, user_id: int, guild_id: int):
         """Update last_active for all wrestlers of a user + reactivate if inactive"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute("""
                 UPDATE wrestlers 
                 SET last_active = ?, is_inactive = 0
                 WHERE user_id = ? AND guild_id = ?
             """, (datetime.utcnow().isoformat(), user_id, guild_id))
             await db.commit()
+            await self._sync_roster(db, guild_id=guild_id, user_id=user_id)
     
     async def get_inactive_wrestlers(self, guild_id: int, days: int):
         """Get all wrestlers inactive for more than X days"""
         from datetime import timedelta
         cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute("""
                 SELECT * FROM wrestlers
                 WHERE guild_id = ?
@@ -1649,15 +2328,14 @@ class Database:
                 AND (last_active IS NULL OR last_active < ?)
             """, (guild_id, cutoff)) as cursor:
                 rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
+                return [Wrestler.from_row(row) for row in rows]
     
     async def get_warning_wrestlers(self, guild_id: int, warning_days: int, inactivity_days: int):
         """Get wrestlers approaching inactivity (between warning_days and inactivity_days)"""
         from datetime import timedelta
         warning_cutoff = (datetime.utcnow() - timedelta(days=warning_days)).isoformat()
         inactive_cutoff = (datetime.utcnow() - timedelta(days=inactivity_days)).isoformat()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute("""
                 SELECT * FROM wrestlers
                 WHERE guild_id = ?
@@ -1667,31 +2345,32 @@ class Database:
                 AND last_active >= ?
             """, (guild_id, warning_cutoff, inactive_cutoff)) as cursor:
                 rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
+                return [Wrestler.from_row(row) for row in rows]
     
     async def set_wrestler_inactive(self, wrestler_id: int):
         """Set a wrestler as inactive"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE wrestlers SET is_inactive = 1 WHERE id = ?",
                 (wrestler_id,)
             )
             await db.commit()
+            await self._sync_roster(db, [wrestler_id])
     
     async def set_wrestler_active(self, wrestler_id: int):
         """Set a wrestler as active"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE wrestlers SET is_inactive = 0, last_active = ? WHERE id = ?",
                 (datetime.utcnow().isoformat(), wrestler_id)
             )
             await db.commit()
+            await self._sync_roster(db, [wrestler_id])
     
     async def get_wrestler_champions(self, guild_id: int):
         """Get all wrestlers who are currently champions"""
         import json
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT * FROM championships WHERE guild_id = ? AND is_active = 1",
                 (guild_id,)
@@ -1711,18 +2390,19 @@ class Database:
     
     async def update_inactivity_settings(self, guild_id: int, inactivity_days: int, warning_days: int, log_channel_id: int = None):
         """Update inactivity settings for server"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute("""
                 UPDATE server_settings 
                 SET inactivity_days = ?, warning_days = ?, inactivity_log_channel_id = ?
                 WHERE guild_id = ?
             """, (inactivity_days, warning_days, log_channel_id, guild_id))
             await db.commit()
+        self._invalidate_server_settings(guild_id)
     # ==================== PHASE 4: RIVALRIES ====================
     
     async def create_rivalry(self, guild_id: int, wrestler1_id: int, wrestler2_id: int):
         """Create a new rivalry between two wrestlers"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute("""
                 INSERT INTO rivalries 
                 (guild_id, wrestler1_id, wrestler2_id, created_date)
@@ -1732,8 +2412,7 @@ class Database:
     
     async def get_active_rivalry_for_wrestler(self, wrestler_id: int):
         """Get active rivalry for a wrestler (if any)"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute("""
                 SELECT * FROM rivalries
                 WHERE (wrestler1_id = ? OR wrestler2_id = ?)
@@ -1742,10 +2421,10 @@ class Database:
                 row = await cursor.fetchone()
                 return dict(row) if row else None
     
+    @coalesced
     async def get_all_active_rivalries(self, guild_id: int):
         """Get all active rivalries in a guild"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute("""
                 SELECT r.*, 
                        w1.name as wrestler1_name,
@@ -1761,7 +2440,7 @@ class Database:
     
     async def end_rivalry(self, rivalry_id: int):
         """End a rivalry"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE rivalries SET is_active = 0 WHERE id = ?",
                 (rivalry_id,)
@@ -1773,27 +2452,21 @@ class Database:
         if len(wrestler_ids) < 2:
             return None
         
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
-            # Check all combinations
-            for i, w1 in enumerate(wrestler_ids):
-                for w2 in wrestler_ids[i+1:]:
-                    async with db.execute("""
-                        SELECT * FROM rivalries
-                        WHERE ((wrestler1_id = ? AND wrestler2_id = ?)
-                           OR (wrestler1_id = ? AND wrestler2_id = ?))
-                        AND is_active = 1
-                    """, (w1, w2, w2, w1)) as cursor:
-                        row = await cursor.fetchone()
-                        if row:
-                            return dict(row)
-            
-            return None
+        async with self.pool.reader() as db:
+            placeholders = ",".join("?" * len(wrestler_ids))
+            async with db.execute(f"""
+                SELECT * FROM rivalries
+                WHERE wrestler1_id IN ({placeholders})
+                AND wrestler2_id IN ({placeholders})
+                AND is_active = 1
+                LIMIT 1
+            """, (*wrestler_ids, *wrestler_ids)) as cursor:
+                row = await cursor.fetchone()
+                return dict(row) if row else None
     
     async def update_rivalry_after_match(self, rivalry_id: int, winner_ids: list, loser_ids: list):
         """Update rivalry stats after a match"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             # Get rivalry
             async with db.execute(
                 "SELECT wrestler1_id, wrestler2_id FROM rivalries WHERE id = ?",
@@ -1834,7 +2507,7 @@ class Database:
     async def record_turn(self, wrestler_id: int, old_alignment: str, new_alignment: str, 
                           old_persona: str, new_persona: str):
         """Record a turn in history"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute("""
                 INSERT INTO turn_history 
                 (wrestler_id, old_alignment, new_alignment, old_persona, new_persona, turn_date)
@@ -1847,11 +2520,11 @@ class Database:
                 (datetime.utcnow().isoformat(), wrestler_id)
             )
             await db.commit()
+            await self._sync_roster(db, [wrestler_id])
     
     async def get_turn_history(self, wrestler_id: int):
         """Get turn history for a wrestler"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self.pool.reader() as db:
             async with db.execute("""
                 SELECT * FROM turn_history 
                 WHERE wrestler_id = ? 
@@ -1864,36 +2537,41 @@ class Database:
                                                      persona: str, personality_traits: dict):
         """Update wrestler alignment, persona, and personality traits"""
         import json
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute("""
                 UPDATE wrestlers 
                 SET alignment = ?, persona = ?, personality_traits = ?
                 WHERE id = ?
             """, (alignment, persona, json.dumps(personality_traits), wrestler_id))
             await db.commit()
+            await self._sync_roster(db, [wrestler_id])
     
     async def update_wrestler_signature(self, wrestler_id: int, signature: str):
         """Update wrestler's signature move"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE wrestlers SET signature = ? WHERE id = ?",
                 (signature, wrestler_id)
             )
             await db.commit()
+            await self._sync_roster(db, [wrestler_id])
+        self._after_commit(self.taken_moves.set_move, wrestler_id, SIGNATURE, signature)
     
     async def update_wrestler_finisher(self, wrestler_id: int, finisher: str):
         """Update wrestler's finisher"""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE wrestlers SET finisher = ? WHERE id = ?",
                 (finisher, wrestler_id)
             )
             await db.commit()
+            await self._sync_roster(db, [wrestler_id])
+        self._after_commit(self.taken_moves.set_move, wrestler_id, FINISHER, finisher)
     
     async def rename_wrestler(self, wrestler_id: int, new_name: str, old_name: str):
         """Rename a wrestler and store old name in history"""
         import json
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             # Get current former_names
             async with db.execute(
                 "SELECT former_names FROM wrestlers WHERE id = ?",
@@ -1915,11 +2593,14 @@ class Database:
                 WHERE id = ?
             """, (new_name, json.dumps(former_names), datetime.utcnow().isoformat(), wrestler_id))
             await db.commit()
+            await self._sync_roster(db, [wrestler_id])
+        self._after_commit(self.leaderboards.rename_wrestler, wrestler_id, new_name)
+        self._after_commit(self.name_indexes.rename, WRESTLERS, wrestler_id, new_name)
     
     async def check_turn_cooldown(self, wrestler_id: int, cooldown_days: int) -> dict:
         """Check if wrestler can turn (cooldown check)"""
         from datetime import timedelta
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT last_turn_date FROM wrestlers WHERE id = ?",
                 (wrestler_id,)
@@ -1941,7 +2622,7 @@ class Database:
     async def check_rename_cooldown(self, wrestler_id: int, cooldown_days: int) -> dict:
         """Check if wrestler can be renamed (cooldown check)"""
         from datetime import timedelta
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.reader() as db:
             async with db.execute(
                 "SELECT last_rename_date FROM wrestlers WHERE id = ?",
                 (wrestler_id,)
@@ -0,0 +1,47 @@
+"""
+DATABASE MIGRATION SCRIPT
+Brings the database schema up to the latest version and finishes every pending backfill.
+The bot does the same on startup (backfills run in the background there) -
+use this to upgrade offline, e.g. before the first start after an update.
+"""
+
+import aiosqlite
+import asyncio
+
+from utils.schema import SCHEMA
+
+DB_PATH = "wrestling_bot.db"  # Change this if your DB has a different name
+
+
+async def migrate_database():
+    """Apply pending schema migrations, then run backfills to completion"""
+    
+    async with aiosqlite.connect(DB_PATH) as db:
+        version = await SCHEMA.current_version(db)
+        print(f"📊 Schema version {version} (latest is {SCHEMA.latest_version})")
+        
+        applied = await SCHEMA.migrate(db)
+        await SCHEMA.run_backfills(db)
+        
+        print("\n📊 Summary:")
+        print(f"  ✓ {applied} migration(s) applied")
+        print(f"  ✓ Schema version {await SCHEMA.current_version(db)}")
+        print("  ✓ All existing data preserved!")
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🔧 WRESTLING BOT DATABASE MIGRATION")
+    print("=" * 60)
+    print(f"\nTarget Database: {DB_PATH}")
+    print("\n⚠️  IMPORTANT:")
+    print("  • Stop the bot before running this")
+    print("  • Each migration step is all-or-nothing; backfills resume where they stopped")
+    print("  • Make a backup just in case!")
+    print("\nPress ENTER to continue or Ctrl+C to cancel...")
+    input()
+    
+    asyncio.run(migrate_database())
+    
+    print("\n" + "=" * 60)
+    print("✅ MIGRATION COMPLETE - Restart your bot!")
+    print("=" * 60)
@@ -0,0 +1,32 @@
+"""
+Slash command sync fingerprinting.
+
+A global tree.sync() is rate limited and only needed when the commands
+themselves changed. command_tree_fingerprint() hashes the payload a sync
+would upload; bot.py stores it after a successful sync and skips syncing
+while the fingerprint still matches.
+"""
+
+import hashlib
+import json
+from typing import Optional
+
+from discord import app_commands
+
+# bot_state key holding the fingerprint of the last synced tree
+FINGERPRINT_KEY = "command_tree_fingerprint"
+
+
+def command_tree_fingerprint(tree: app_commands.CommandTree, application_id: Optional[int]) -> str:
+    """SHA-256 of the global commands as they would be sent to Discord"""
+    commands = sorted(
+        (command.to_dict() for command in tree.get_commands()),
+        key=lambda command: (command.get("type", 1), command["name"])
+    )
+    payload = json.dumps(
+        {"application_id": application_id, "commands": commands},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
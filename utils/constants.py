@@ -1,7 +1,32 @@
 # Game Constants for WWE Wrestling Bot
-from typing import Dict, List
+from typing import Callable, Dict, Iterator, List, Mapping, Optional
 import random
 
+
+class LazyTable(Mapping):
+    """Read-only table built by `build()` the first time it is used (keeps imports fast)"""
+
+    __slots__ = ("_build", "_table")
+
+    def __init__(self, build: Callable[[], Dict]):
+        self._build = build
+        self._table: Optional[Dict] = None
+
+    def _loaded(self) -> Dict:
+        if self._table is None:
+            self._table = self._build()
+        return self._table
+
+    def __getitem__(self, key):
+        return self._loaded()[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._loaded())
+
+    def __len__(self) -> int:
+        return len(self._loaded())
+
+
 # Archetypes with their characteristics
 ARCHETYPES = {
     "Giant": {
@@ -193,135 +218,139 @@ BODY_TYPES = {
 }
 
 # In-Ring Personas/Styles
-PERSONAS = {
-    "American Power": {
-        "description": "Patriotic, powerful, crowd-driven",
-        "bonus_attrs": {
-            "Strength": 5,
-            "Grapple Offense": 5
-        }
-    },
+def _build_personas() -> Dict[str, Dict]:
+    """In-ring personas with their descriptions and attribute bonuses"""
+    return {
+        "American Power": {
+            "description": "Patriotic, powerful, crowd-driven",
+            "bonus_attrs": {
+                "Strength": 5,
+                "Grapple Offense": 5
+            }
+        },
 
-    "Fighter": {
-        "description": "Strike-heavy, tough, never backs down",
-        "bonus_attrs": {
-            "Running Offense": 5,
-            "Head Durability": 5
-        }
-    },
+        "Fighter": {
+            "description": "Strike-heavy, tough, never backs down",
+            "bonus_attrs": {
+                "Running Offense": 5,
+                "Head Durability": 5
+            }
+        },
 
-    "Giant": {
-        "description": "Massive powerhouse, hard to take down",
-        "bonus_attrs": {
-            "Strength": 8,
-            "Pin Escape": 5
-        }
-    },
+        "Giant": {
+            "description": "Massive powerhouse, hard to take down",
+            "bonus_attrs": {
+                "Strength": 8,
+                "Pin Escape": 5
+            }
+        },
 
-    "Grappler": {
-        "description": "Clinch-focused, control-oriented",
-        "bonus_attrs": {
-            "Grapple Offense": 7,
-            "Grapple Reversal": 5
-        }
-    },
+        "Grappler": {
+            "description": "Clinch-focused, control-oriented",
+            "bonus_attrs": {
+                "Grapple Offense": 7,
+                "Grapple Reversal": 5
+            }
+        },
 
-    "Ground": {
-        "description": "Submission specialist, mat-based wrestling",
-        "bonus_attrs": {
-            "Power Submission": 7,
-            "Technical Submission": 7
-        }
-    },
+        "Ground": {
+            "description": "Submission specialist, mat-based wrestling",
+            "bonus_attrs": {
+                "Power Submission": 7,
+                "Technical Submission": 7
+            }
+        },
 
-    "Heel": {
-        "description": "Cunning, rule-breaking, opportunistic",
-        "bonus_attrs": {
-            "Pin Escape": 5,
-            "Recovery": 5
-        }
-    },
+        "Heel": {
+            "description": "Cunning, rule-breaking, opportunistic",
+            "bonus_attrs": {
+                "Pin Escape": 5,
+                "Recovery": 5
+            }
+        },
 
-    "Junior": {
-        "description": "Lightweight, quick, energetic",
-        "bonus_attrs": {
-            "Agility": 7,
-            "Movement Speed": 5
-        }
-    },
+        "Junior": {
+            "description": "Lightweight, quick, energetic",
+            "bonus_attrs": {
+                "Agility": 7,
+                "Movement Speed": 5
+            }
+        },
 
-    "Luchador": {
-        "description": "High-flying masked wrestler",
-        "bonus_attrs": {
-            "Aerial Offense": 10,
-            "Aerial Range": 5
-        }
-    },
+        "Luchador": {
+            "description": "High-flying masked wrestler",
+            "bonus_attrs": {
+                "Aerial Offense": 10,
+                "Aerial Range": 5
+            }
+        },
 
-    "Mysterious": {
-        "description": "Unpredictable, mystical, enigmatic",
-        "bonus_attrs": {
-            "Agility": 5,
-            "Special": 5
-        }
-    },
+        "Mysterious": {
+            "description": "Unpredictable, mystical, enigmatic",
+            "bonus_attrs": {
+                "Agility": 5,
+                "Special": 5
+            }
+        },
 
-    "Orthodox": {
-        "description": "Classic, traditional wrestling style",
-        "bonus_attrs": {
-            "Grapple Offense": 5,
-            "Stamina": 5
-        }
-    },
+        "Orthodox": {
+            "description": "Classic, traditional wrestling style",
+            "bonus_attrs": {
+                "Grapple Offense": 5,
+                "Stamina": 5
+            }
+        },
 
-    "Panther": {
-        "description": "Agile, predatory instincts",
-        "bonus_attrs": {
-            "Agility": 7,
-            "Movement Speed": 5
-        }
-    },
+        "Panther": {
+            "description": "Agile, predatory instincts",
+            "bonus_attrs": {
+                "Agility": 7,
+                "Movement Speed": 5
+            }
+        },
 
-    "Power": {
-        "description": "Explosive strength-based offense",
-        "bonus_attrs": {
-            "Arm Power": 5,
-            "Leg Power": 5
-        }
-    },
+        "Power": {
+            "description": "Explosive strength-based offense",
+            "bonus_attrs": {
+                "Arm Power": 5,
+                "Leg Power": 5
+            }
+        },
 
-    "Shooter": {
-        "description": "MMA-influenced, strike-focused",
-        "bonus_attrs": {
-            "Running Offense": 5,
-            "Strength": 5
-        }
-    },
+        "Shooter": {
+            "description": "MMA-influenced, strike-focused",
+            "bonus_attrs": {
+                "Running Offense": 5,
+                "Strength": 5
+            }
+        },
 
-    "Technician": {
-        "description": "Precise, methodical, technical mastery",
-        "bonus_attrs": {
-            "Technical Submission": 8,
-            "Grapple Reversal": 5
-        }
-    },
+        "Technician": {
+            "description": "Precise, methodical, technical mastery",
+            "bonus_attrs": {
+                "Technical Submission": 8,
+                "Grapple Reversal": 5
+            }
+        },
 
-    "Vicious": {
-        "description": "Brutal, relentless, merciless",
-        "bonus_attrs": {
-            "Strike Reversal": 5,
-            "Head Durability": 5
-        }
-    },
+        "Vicious": {
+            "description": "Brutal, relentless, merciless",
+            "bonus_attrs": {
+                "Strike Reversal": 5,
+                "Head Durability": 5
+            }
+        },
 
-    "Wrestling": {
-        "description": "Well-rounded professional wrestler",
-        "bonus_attrs": {
-            "Stamina": 5,
-            "Recovery": 5
+        "Wrestling": {
+            "description": "Well-rounded professional wrestler",
+            "bonus_attrs": {
+                "Stamina": 5,
+                "Recovery": 5
+            }
         }
     }
-}
+
+PERSONAS = LazyTable(_build_personas)
 
 # Personality Traits (Range: -100 to +100)
 PERSONALITY_TRAITS = {
@@ -392,303 +421,307 @@ ATTRIBUTES = [
 ]
 
 # Finisher/Signature Move Categories with complete move lists
-MOVE_CATEGORIES = {
-    "Grapples & Power Moves": {
-        "emoji": "💪",
-        "moves": {
-            "Finishers": [
-                "Powerbomb",
-                "Sit-Out Powerbomb",
-                "Pop-Up Powerbomb",
-                "Running Powerslam",
-                "Spinebuster",
-                "Gorilla Press Slam",
-                "Military Press Drop",
-                "Uranage",
-                "Sidewalk Slam",
-                "Chokeslam",
-                "Inverted Powerslam",
-                "Scoop Slam",
-                "Michinoku Driver",
-                "Fireman's Carry Slam",
-                "Death Valley Driver",
-                "Release German Suplex",
-                "Belly-to-Belly Suplex",
-                "Exploder Suplex",
-                "Back Body Drop",
-                "Falcon Arrow",
-                "Sit-Out Spinebuster",
-                "High-Angle Slam",
-                "Pumphandle Slam",
-                "Overhead Belly-to-Belly",
-                "Spinning Side Slam"
-            ],
-            "Signatures": [
-                "Powerbomb",
-                "Sit-Out Powerbomb",
-                "Pop-Up Powerbomb",
-                "Running Powerslam",
-                "Spinebuster",
-                "Gorilla Press Slam",
-                "Military Press Drop",
-                "Uranage",
-                "Sidewalk Slam",
-                "Chokeslam",
-                "Inverted Powerslam",
-                "Scoop Slam",
-                "Michinoku Driver",
-                "Fireman's Carry Slam",
-                "Death Valley Driver",
-                "Release German Suplex",
-                "Belly-to-Belly Suplex",
-                "Exploder Suplex",
-                "Back Body Drop",
-                "Falcon Arrow",
-                "Sit-Out Spinebuster",
-                "High-Angle Slam",
-                "Pumphandle Slam",
-                "Overhead Belly-to-Belly",
-                "Spinning Side Slam"
-            ]
-        }
-    },
-    "Strikes": {
-        "emoji": "👊",
-        "moves": {
-            "Finishers": [
-                "Superkick",
-                "Spinning Back Kick",
-                "Running Knee Strike",
-                "Jumping Knee Strike",
-                "Roundhouse Kick",
-                "Spinning Heel Kick",
-                "Bicycle Kick",
-                "Forearm Smash",
-                "Discus Forearm",
-                "European Uppercut",
-                "Palm Strike",
-                "Elbow Smash",
-                "Spinning Elbow",
-                "Short-Arm Headbutt",
-                "Running Big Boot",
-                "Jumping High Kick",
-                "Leg Kick Combination",
-                "Backfist Strike",
-                "Rolling Elbow Strike",
-                "Thrust Kick",
-                "Snap Kick",
-                "Knee Lift",
-                "Corner High Kick",
-                "Hammerfist Strike",
-                "Double Palm Strike"
-            ],
-            "Signatures": [
-                "Superkick",
-                "Spinning Back Kick",
-                "Running Knee Strike",
-                "Jumping Knee Strike",
-                "Roundhouse Kick",
-                "Spinning Heel Kick",
-                "Bicycle Kick",
-                "Forearm Smash",
-                "Discus Forearm",
-                "European Uppercut",
-                "Palm Strike",
-                "Elbow Smash",
-                "Spinning Elbow",
-                "Short-Arm Headbutt",
-                "Running Big Boot",
-                "Jumping High Kick",
-                "Leg Kick Combination",
-                "Backfist Strike",
-                "Rolling Elbow Strike",
-                "Thrust Kick",
-                "Snap Kick",
-                "Knee Lift",
-                "Corner High Kick",
-                "Hammerfist Strike",
-                "Double Palm Strike"
-            ]
-        }
-    },
-    "Submissions": {
-        "emoji": "🔒",
-        "moves": {
-            "Finishers": [
-                "Sleeper Hold",
-                "Rear Naked Choke",
-                "Crossface",
-                "Armbar",
-                "Triangle Choke",
-                "Guillotine Choke",
-                "Kimura Lock",
-                "Ankle Lock",
-                "Heel Hook",
-                "Boston Crab",
-                "Single-Leg Crab",
-                "Sharpshooter-Style Leg Lock",
-                "Cloverleaf",
-                "STF",
-                "Dragon Sleeper",
-                "Camel Clutch",
-                "Octopus Hold",
-                "Fujiwara Armbar",
-                "Knee Bar",
-                "Stretch Muffler",
-                "Abdominal Stretch",
-                "Surfboard Stretch",
-                "Leg Trap Choke",
-                "Standing Arm Lock",
-                "Modified Figure-Four Leg Lock"
-            ],
-            "Signatures": [
-                "Sleeper Hold",
-                "Rear Naked Choke",
-                "Crossface",
-                "Armbar",
-                "Triangle Choke",
-                "Guillotine Choke",
-                "Kimura Lock",
-                "Ankle Lock",
-                "Heel Hook",
-                "Boston Crab",
-                "Single-Leg Crab",
-                "Sharpshooter-Style Leg Lock",
-                "Cloverleaf",
-                "STF",
-                "Dragon Sleeper",
-                "Camel Clutch",
-                "Octopus Hold",
-                "Fujiwara Armbar",
-                "Knee Bar",
-                "Stretch Muffler",
-                "Abdominal Stretch",
-                "Surfboard Stretch",
-                "Leg Trap Choke",
-                "Standing Arm Lock",
-                "Modified Figure-Four Leg Lock"
-            ]
-        }
-    },
-    "Aerial/High-Flying": {
-        "emoji": "🦅",
-        "moves": {
-            "Finishers": [
-                "Frog Splash",
-                "Diving Splash",
-                "Diving Elbow Drop",
-                "Diving Leg Drop",
-                "Moonsault",
-                "Standing Moonsault",
-                "Shooting Star Press",
-                "Split-Legged Moonsault",
-                "Springboard Splash",
-                "Springboard Cutter",
-                "Diving Crossbody",
-                "Flying Body Press",
-                "Corkscrew Splash",
-                "Rolling Thunder",
-                "Swanton-Style Dive",
-                "Top Rope Senton",
-                "Springboard Moonsault",
-                "Diving Double Foot Stomp",
-                "Top Rope Knee Drop",
-                "Springboard Back Elbow",
-                "Flying Forearm",
-                "Tornado Splash",
-                "Top Rope Splash Press",
-                "Running Shooting Star",
-                "Diving Back Splash"
-            ],
-            "Signatures": [
-                "Frog Splash",
-                "Diving Splash",
-                "Diving Elbow Drop",
-                "Diving Leg Drop",
-                "Moonsault",
-                "Standing Moonsault",
-                "Shooting Star Press",
-                "Split-Legged Moonsault",
-                "Springboard Splash",
-                "Springboard Cutter",
-                "Diving Crossbody",
-                "Flying Body Press",
-                "Corkscrew Splash",
-                "Rolling Thunder",
-                "Swanton-Style Dive",
-                "Top Rope Senton",
-                "Springboard Moonsault",
-                "Diving Double Foot Stomp",
-                "Top Rope Knee Drop",
-                "Springboard Back Elbow",
-                "Flying Forearm",
-                "Tornado Splash",
-                "Top Rope Splash Press",
-                "Running Shooting Star",
-                "Diving Back Splash"
-            ]
-        }
-    },
-    "Lariats/Clotheslines": {
-        "emoji": "🥋",
-        "moves": {
-            "Finishers": [
-                "Running Lariat",
-                "Short-Arm Lariat",
-                "Spinning Lariat",
-                "Ripcord Lariat",
-                "Discus Lariat",
-                "Jumping Lariat",
-                "Rolling Lariat",
-                "Corner Lariat",
-                "Clothesline from Behind",
-                "Pop-Up Lariat",
-                "Swinging Lariat",
-                "High-Impact Clothesline",
-                "Rebound Lariat",
-                "Avalanche Lariat",
-                "Turning Clothesline",
-                "Double-Handed Lariat",
-                "Leaping Clothesline",
-                "Snap Lariat",
-                "Charging Clothesline",
-                "Spinning Clothesline",
-                "Running Arm Lariat",
-                "Clothesline Takedown",
-                "Short-Range Lariat",
-                "Corner-to-Corner Lariat",
-                "Explosive Lariat"
-            ],
-            "Signatures": [
-                "Running Lariat",
-                "Short-Arm Lariat",
-                "Spinning Lariat",
-                "Ripcord Lariat",
-                "Discus Lariat",
-                "Jumping Lariat",
-                "Rolling Lariat",
-                "Corner Lariat",
-                "Clothesline from Behind",
-                "Pop-Up Lariat",
-                "Swinging Lariat",
-                "High-Impact Clothesline",
-                "Rebound Lariat",
-                "Avalanche Lariat",
-                "Turning Clothesline",
-                "Double-Handed Lariat",
-                "Leaping Clothesline",
-                "Snap Lariat",
-                "Charging Clothesline",
-                "Spinning Clothesline",
-                "Running Arm Lariat",
-                "Clothesline Takedown",
-                "Short-Range Lariat",
-                "Corner-to-Corner Lariat",
-                "Explosive Lariat"
-            ]
+def _build_move_categories() -> Dict[str, Dict]:
+    """Finisher/signature move lists by category"""
+    return {
+        "Grapples & Power Moves": {
+            "emoji": "💪",
+            "moves": {
+                "Finishers": [
+                    "Powerbomb",
+                    "Sit-Out Powerbomb",
+                    "Pop-Up Powerbomb",
+                    "Running Powerslam",
+                    "Spinebuster",
+                    "Gorilla Press Slam",
+                    "Military Press Drop",
+                    "Uranage",
+                    "Sidewalk Slam",
+                    "Chokeslam",
+                    "Inverted Powerslam",
+                    "Scoop Slam",
+                    "Michinoku Driver",
+                    "Fireman's Carry Slam",
+                    "Death Valley Driver",
+                    "Release German Suplex",
+                    "Belly-to-Belly Suplex",
+                    "Exploder Suplex",
+                    "Back Body Drop",
+                    "Falcon Arrow",
+                    "Sit-Out Spinebuster",
+                    "High-Angle Slam",
+                    "Pumphandle Slam",
+                    "Overhead Belly-to-Belly",
+                    "Spinning Side Slam"
+                ],
+                "Signatures": [
+                    "Powerbomb",
+                    "Sit-Out Powerbomb",
+                    "Pop-Up Powerbomb",
+                    "Running Powerslam",
+                    "Spinebuster",
+                    "Gorilla Press Slam",
+                    "Military Press Drop",
+                    "Uranage",
+                    "Sidewalk Slam",
+                    "Chokeslam",
+                    "Inverted Powerslam",
+                    "Scoop Slam",
+                    "Michinoku Driver",
+                    "Fireman's Carry Slam",
+                    "Death Valley Driver",
+                    "Release German Suplex",
+                    "Belly-to-Belly Suplex",
+                    "Exploder Suplex",
+                    "Back Body Drop",
+                    "Falcon Arrow",
+                    "Sit-Out Spinebuster",
+                    "High-Angle Slam",
+                    "Pumphandle Slam",
+                    "Overhead Belly-to-Belly",
+                    "Spinning Side Slam"
+                ]
+            }
+        },
+        "Strikes": {
+            "emoji": "👊",
+            "moves": {
+                "Finishers": [
+                    "Superkick",
+                    "Spinning Back Kick",
+                    "Running Knee Strike",
+                    "Jumping Knee Strike",
+                    "Roundhouse Kick",
+                    "Spinning Heel Kick",
+                    "Bicycle Kick",
+                    "Forearm Smash",
+                    "Discus Forearm",
+                    "European Uppercut",
+                    "Palm Strike",
+                    "Elbow Smash",
+                    "Spinning Elbow",
+                    "Short-Arm Headbutt",
+                    "Running Big Boot",
+                    "Jumping High Kick",
+                    "Leg Kick Combination",
+                    "Backfist Strike",
+                    "Rolling Elbow Strike",
+                    "Thrust Kick",
+                    "Snap Kick",
+                    "Knee Lift",
+                    "Corner High Kick",
+                    "Hammerfist Strike",
+                    "Double Palm Strike"
+                ],
+                "Signatures": [
+                    "Superkick",
+                    "Spinning Back Kick",
+                    "Running Knee Strike",
+                    "Jumping Knee Strike",
+                    "Roundhouse Kick",
+                    "Spinning Heel Kick",
+                    "Bicycle Kick",
+                    "Forearm Smash",
+                    "Discus Forearm",
+                    "European Uppercut",
+                    "Palm Strike",
+                    "Elbow Smash",
+                    "Spinning Elbow",
+                    "Short-Arm Headbutt",
+                    "Running Big Boot",
+                    "Jumping High Kick",
+                    "Leg Kick Combination",
+                    "Backfist Strike",
+                    "Rolling Elbow Strike",
+                    "Thrust Kick",
+                    "Snap Kick",
+                    "Knee Lift",
+                    "Corner High Kick",
+                    "Hammerfist Strike",
+                    "Double Palm Strike"
+                ]
+            }
+        },
+        "Submissions": {
+            "emoji": "🔒",
+            "moves": {
+                "Finishers": [
+                    "Sleeper Hold",
+                    "Rear Naked Choke",
+                    "Crossface",
+                    "Armbar",
+                    "Triangle Choke",
+                    "Guillotine Choke",
+                    "Kimura Lock",
+                    "Ankle Lock",
+                    "Heel Hook",
+                    "Boston Crab",
+                    "Single-Leg Crab",
+                    "Sharpshooter-Style Leg Lock",
+                    "Cloverleaf",
+                    "STF",
+                    "Dragon Sleeper",
+                    "Camel Clutch",
+                    "Octopus Hold",
+                    "Fujiwara Armbar",
+                    "Knee Bar",
+                    "Stretch Muffler",
+                    "Abdominal Stretch",
+                    "Surfboard Stretch",
+                    "Leg Trap Choke",
+                    "Standing Arm Lock",
+                    "Modified Figure-Four Leg Lock"
+                ],
+                "Signatures": [
+                    "Sleeper Hold",
+                    "Rear Naked Choke",
+                    "Crossface",
+                    "Armbar",
+                    "Triangle Choke",
+                    "Guillotine Choke",
+                    "Kimura Lock",
+                    "Ankle Lock",
+                    "Heel Hook",
+                    "Boston Crab",
+                    "Single-Leg Crab",
+                    "Sharpshooter-Style Leg Lock",
+                    "Cloverleaf",
+                    "STF",
+                    "Dragon Sleeper",
+                    "Camel Clutch",
+                    "Octopus Hold",
+                    "Fujiwara Armbar",
+                    "Knee Bar",
+                    "Stretch Muffler",
+                    "Abdominal Stretch",
+                    "Surfboard Stretch",
+                    "Leg Trap Choke",
+                    "Standing Arm Lock",
+                    "Modified Figure-Four Leg Lock"
+                ]
+            }
+        },
+        "Aerial/High-Flying": {
+            "emoji": "🦅",
+            "moves": {
+                "Finishers": [
+                    "Frog Splash",
+                    "Diving Splash",
+                    "Diving Elbow Drop",
+                    "Diving Leg Drop",
+                    "Moonsault",
+                    "Standing Moonsault",
+                    "Shooting Star Press",
+                    "Split-Legged Moonsault",
+                    "Springboard Splash",
+                    "Springboard Cutter",
+                    "Diving Crossbody",
+                    "Flying Body Press",
+                    "Corkscrew Splash",
+                    "Rolling Thunder",
+                    "Swanton-Style Dive",
+                    "Top Rope Senton",
+                    "Springboard Moonsault",
+                    "Diving Double Foot Stomp",
+                    "Top Rope Knee Drop",
+                    "Springboard Back Elbow",
+                    "Flying Forearm",
+                    "Tornado Splash",
+                    "Top Rope Splash Press",
+                    "Running Shooting Star",
+                    "Diving Back Splash"
+                ],
+                "Signatures": [
+                    "Frog Splash",
+                    "Diving Splash",
+                    "Diving Elbow Drop",
+                    "Diving Leg Drop",
+                    "Moonsault",
+                    "Standing Moonsault",
+                    "Shooting Star Press",
+                    "Split-Legged Moonsault",
+                    "Springboard Splash",
+                    "Springboard Cutter",
+                    "Diving Crossbody",
+                    "Flying Body Press",
+                    "Corkscrew Splash",
+                    "Rolling Thunder",
+                    "Swanton-Style Dive",
+                    "Top Rope Senton",
+                    "Springboard Moonsault",
+                    "Diving Double Foot Stomp",
+                    "Top Rope Knee Drop",
+                    "Springboard Back Elbow",
+                    "Flying Forearm",
+                    "Tornado Splash",
+                    "Top Rope Splash Press",
+                    "Running Shooting Star",
+                    "Diving Back Splash"
+                ]
+            }
+        },
+        "Lariats/Clotheslines": {
+            "emoji": "🥋",
+            "moves": {
+                "Finishers": [
+                    "Running Lariat",
+                    "Short-Arm Lariat",
+                    "Spinning Lariat",
+                    "Ripcord Lariat",
+                    "Discus Lariat",
+                    "Jumping Lariat",
+                    "Rolling Lariat",
+                    "Corner Lariat",
+                    "Clothesline from Behind",
+                    "Pop-Up Lariat",
+                    "Swinging Lariat",
+                    "High-Impact Clothesline",
+                    "Rebound Lariat",
+                    "Avalanche Lariat",
+                    "Turning Clothesline",
+                    "Double-Handed Lariat",
+                    "Leaping Clothesline",
+                    "Snap Lariat",
+                    "Charging Clothesline",
+                    "Spinning Clothesline",
+                    "Running Arm Lariat",
+                    "Clothesline Takedown",
+                    "Short-Range Lariat",
+                    "Corner-to-Corner Lariat",
+                    "Explosive Lariat"
+                ],
+                "Signatures": [
+                    "Running Lariat",
+                    "Short-Arm Lariat",
+                    "Spinning Lariat",
+                    "Ripcord Lariat",
+                    "Discus Lariat",
+                    "Jumping Lariat",
+                    "Rolling Lariat",
+                    "Corner Lariat",
+                    "Clothesline from Behind",
+                    "Pop-Up Lariat",
+                    "Swinging Lariat",
+                    "High-Impact Clothesline",
+                    "Rebound Lariat",
+                    "Avalanche Lariat",
+                    "Turning Clothesline",
+                    "Double-Handed Lariat",
+                    "Leaping Clothesline",
+                    "Snap Lariat",
+                    "Charging Clothesline",
+                    "Spinning Clothesline",
+                    "Running Arm Lariat",
+                    "Clothesline Takedown",
+                    "Short-Range Lariat",
+                    "Corner-to-Corner Lariat",
+                    "Explosive Lariat"
+                ]
+            }
         }
     }
-}
+
+MOVE_CATEGORIES = LazyTable(_build_move_categories)
 
 # Default attribute values
 DEFAULT_ATTRIBUTE_VALUE = 50
@@ -0,0 +1,105 @@
+"""
+Write-behind buffer for chat currency.
+
+Chat messages only touch memory: the buffer keeps each user's last-earned
+time, the active wrestler IDs they own, and the currency each wrestler has
+earned but not yet saved. Database flushes the pending amounts (and the
+cooldowns) to SQLite in one batch every few seconds and on shutdown, and
+merges unflushed amounts into any balance it reads back.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple, Optional, Iterable, Any
+
+# (guild_id, user_id)
+UserKey = Tuple[int, int]
+
+
+class CurrencyBuffer:
+    """Cooldowns and unsaved currency for chat accrual"""
+
+    def __init__(self):
+        self.last_earned: Dict[UserKey, datetime] = {}
+        self.pending: Dict[int, int] = {}  # wrestler_id -> unsaved currency
+        self._dirty_cooldowns: Dict[UserKey, datetime] = {}
+        self._user_wrestlers: Dict[UserKey, List[int]] = {}
+
+    def load_cooldowns(self, rows: Iterable[Tuple[int, int, str]]):
+        """Seed cooldowns from (guild_id, user_id, last_earned) rows"""
+        for guild_id, user_id, last_earned in rows:
+            self.last_earned[(guild_id, user_id)] = datetime.fromisoformat(last_earned)
+
+    # ---------- roster of earners ----------
+
+    def knows_user(self, guild_id: int, user_id: int) -> bool:
+        return (guild_id, user_id) in self._user_wrestlers
+
+    def set_user_wrestlers(self, guild_id: int, user_id: int, wrestler_ids: List[int]):
+        self._user_wrestlers[(guild_id, user_id)] = list(wrestler_ids)
+
+    def add_wrestler(self, guild_id: int, user_id: int, wrestler_id: int):
+        roster = self._user_wrestlers.get((guild_id, user_id))
+        if roster is not None and wrestler_id not in roster:
+            roster.append(wrestler_id)
+
+    def remove_wrestler(self, wrestler_id: int):
+        for roster in self._user_wrestlers.values():
+            if wrestler_id in roster:
+                roster.remove(wrestler_id)
+                return
+
+    # ---------- accrual ----------
+
+    def on_cooldown(self, guild_id: int, user_id: int, cooldown_seconds: int, now: Optional[datetime] = None) -> bool:
+        last = self.last_earned.get((guild_id, user_id))
+        now = now or datetime.utcnow()
+        return last is not None and now - last < timedelta(seconds=cooldown_seconds)
+
+    def accrue(self, guild_id: int, user_id: int, amount: int, now: Optional[datetime] = None) -> List[int]:
+        """Credit every active wrestler the user owns and start their cooldown.
+
+        Returns the wrestler IDs credited (empty if the user has none, in
+        which case the cooldown is left alone).
+        """
+        wrestler_ids = self._user_wrestlers.get((guild_id, user_id)) or []
+        if not wrestler_ids:
+            return []
+        for wrestler_id in wrestler_ids:
+            self.pending[wrestler_id] = self.pending.get(wrestler_id, 0) + amount
+        now = now or datetime.utcnow()
+        self.last_earned[(guild_id, user_id)] = now
+        self._dirty_cooldowns[(guild_id, user_id)] = now
+        return list(wrestler_ids)
+
+    # ---------- reads ----------
+
+    def pending_for(self, wrestler_id: int) -> int:
+        return self.pending.get(wrestler_id, 0)
+
+    def merge(self, wrestler: Dict[str, Any]) -> Dict[str, Any]:
+        """Add unsaved currency to a wrestler row dict (in place)"""
+        amount = self.pending.get(wrestler['id'])
+        if amount and 'currency' in wrestler:
+            wrestler['currency'] = (wrestler['currency'] or 0) + amount
+        return wrestler
+
+    # ---------- flushing ----------
+
+    def has_changes(self) -> bool:
+        return bool(self.pending or self._dirty_cooldowns)
+
+    def snapshot(self) -> Tuple[Dict[int, int], Dict[UserKey, datetime]]:
+        """Copy what needs saving; pass it to mark_flushed once it has committed"""
+        return dict(self.pending), dict(self._dirty_cooldowns)
+
+    def mark_flushed(self, currency: Dict[int, int], cooldowns: Dict[UserKey, datetime]):
+        """Forget saved amounts, keeping anything earned while the flush ran"""
+        for wrestler_id, amount in currency.items():
+            remaining = self.pending.get(wrestler_id, 0) - amount
+            if remaining:
+                self.pending[wrestler_id] = remaining
+            else:
+                self.pending.pop(wrestler_id, None)
+        for key, when in cooldowns.items():
+            if self._dirty_cooldowns.get(key) == when:
+                del self._dirty_cooldowns[key]
@@ -0,0 +1,179 @@
+"""
+In-memory per-guild leaderboards.
+
+Each loaded guild keeps a compact stat row per active wrestler (name, wins,
+losses, currency) plus a cached top-N list per stat. Database methods that
+change those stats call into the engine after committing, so the cached
+lists stay current without re-reading the roster.
+"""
+
+import heapq
+from typing import Dict, List, Any, Optional, Iterable
+
+# Minimum matches before a wrestler is ranked by win rate
+WINRATE_MIN_MATCHES = 3
+LEADERBOARD_SIZE = 10
+
+
+def _win_rate(wins: int, losses: int) -> float:
+    total = wins + losses
+    return (wins / total * 100) if total > 0 else 0
+
+
+class GuildLeaderboard:
+    """Stat rows and cached top lists for one guild"""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+        # wrestler_id -> [name, wins, losses, currency]
+        self.stats: Dict[int, List[Any]] = {
+            row['id']: [row['name'], row['wins'] or 0, row['losses'] or 0, row['currency'] or 0]
+            for row in rows
+        }
+        self._top: Dict[str, List[Dict[str, Any]]] = {}
+
+    def invalidate(self, *stats: str):
+        """Drop cached top lists (all of them if no stat is given)"""
+        if not stats:
+            self._top.clear()
+        for stat in stats:
+            self._top.pop(stat, None)
+
+    def _entry(self, wrestler_id: int) -> Dict[str, Any]:
+        name, wins, losses, currency = self.stats[wrestler_id]
+        return {
+            'id': wrestler_id,
+            'name': name,
+            'wins': wins,
+            'losses': losses,
+            'currency': currency,
+            'winrate': _win_rate(wins, losses)
+        }
+
+    def _rank(self, stat: str) -> List[Dict[str, Any]]:
+        stats = self.stats
+        if stat == "wins":
+            candidates = [w_id for w_id, s in stats.items() if s[1] + s[2] > 0]
+            key = lambda w_id: stats[w_id][1]
+        elif stat == "winrate":
+            candidates = [w_id for w_id, s in stats.items() if s[1] + s[2] >= WINRATE_MIN_MATCHES]
+            key = lambda w_id: _win_rate(stats[w_id][1], stats[w_id][2])
+        elif stat == "currency":
+            candidates = list(stats)
+            key = lambda w_id: stats[w_id][3]
+        else:
+            raise ValueError(f"Unknown leaderboard stat '{stat}'")
+        return [self._entry(w_id) for w_id in heapq.nlargest(LEADERBOARD_SIZE, candidates, key=key)]
+
+    def promote(self, stat: str, wrestler_id: int):
+        """Apply a score increase (or a display-only change) to a cached top list in place.
+        
+        Scores that only go up can't push anyone else out except by overtaking
+        them, so the list is patched instead of re-ranked.
+        """
+        top = self._top.get(stat)
+        if top is None:
+            return
+        key = {
+            "wins": lambda entry: entry['wins'],
+            "currency": lambda entry: entry['currency']
+        }[stat]
+        
+        entry = self._entry(wrestler_id)
+        positions = [e['id'] for e in top]
+        if wrestler_id in positions:
+            top[positions.index(wrestler_id)] = entry
+        elif len(top) < LEADERBOARD_SIZE or key(entry) > key(top[-1]):
+            top.append(entry)
+        else:
+            return
+        top.sort(key=key, reverse=True)
+        del top[LEADERBOARD_SIZE:]
+
+    def contains(self, stat: str, wrestler_id: int) -> bool:
+        top = self._top.get(stat)
+        return top is not None and any(e['id'] == wrestler_id for e in top)
+
+    def top(self, stat: str, limit: int = LEADERBOARD_SIZE) -> List[Dict[str, Any]]:
+        """Top wrestlers for a stat ('wins', 'winrate' or 'currency')"""
+        if stat not in self._top:
+            self._top[stat] = self._rank(stat)
+        # Hand out copies so callers can't corrupt the cache
+        return [dict(entry) for entry in self._top[stat][:limit]]
+
+    def counts(self) -> Dict[str, int]:
+        """How many wrestlers are eligible for each board"""
+        return {
+            'wrestlers': len(self.stats),
+            'with_matches': sum(1 for s in self.stats.values() if s[1] + s[2] > 0),
+            'winrate_qualified': sum(1 for s in self.stats.values() if s[1] + s[2] >= WINRATE_MIN_MATCHES)
+        }
+
+
+class LeaderboardEngine:
+    """Leaderboards for every guild that has been viewed since startup"""
+
+    def __init__(self):
+        self.guilds: Dict[int, GuildLeaderboard] = {}
+        self._wrestler_guild: Dict[int, int] = {}
+
+    def is_loaded(self, guild_id: int) -> bool:
+        return guild_id in self.guilds
+
+    def load(self, guild_id: int, rows: Iterable[Dict[str, Any]]):
+        """Seed a guild's leaderboard from (id, name, wins, losses, currency) rows"""
+        board = GuildLeaderboard(rows)
+        self.guilds[guild_id] = board
+        for wrestler_id in board.stats:
+            self._wrestler_guild[wrestler_id] = guild_id
+
+    def _board_for(self, wrestler_id: int) -> Optional[GuildLeaderboard]:
+        guild_id = self._wrestler_guild.get(wrestler_id)
+        return self.guilds.get(guild_id) if guild_id is not None else None
+
+    def top(self, guild_id: int, stat: str, limit: int = LEADERBOARD_SIZE) -> List[Dict[str, Any]]:
+        return self.guilds[guild_id].top(stat, limit)
+
+    def counts(self, guild_id: int) -> Dict[str, int]:
+        return self.guilds[guild_id].counts()
+
+    # ---------- incremental updates (called after the DB write commits) ----------
+
+    def add_wrestler(self, guild_id: int, wrestler_id: int, name: str, currency: int = 0):
+        board = self.guilds.get(guild_id)
+        if board is None:
+            return
+        board.stats[wrestler_id] = [name, 0, 0, currency]
+        self._wrestler_guild[wrestler_id] = guild_id
+        board.promote("currency", wrestler_id)
+
+    def remove_wrestler(self, wrestler_id: int):
+        board = self._board_for(wrestler_id)
+        self._wrestler_guild.pop(wrestler_id, None)
+        if board is not None and board.stats.pop(wrestler_id, None) is not None:
+            board.invalidate()
+
+    def rename_wrestler(self, wrestler_id: int, name: str):
+        board = self._board_for(wrestler_id)
+        if board is not None and wrestler_id in board.stats:
+            board.stats[wrestler_id][0] = name
+            board.invalidate()
+
+    def record_result(self, wrestler_id: int, won: bool):
+        board = self._board_for(wrestler_id)
+        if board is None or wrestler_id not in board.stats:
+            return
+        board.stats[wrestler_id][1 if won else 2] += 1
+        # Wins only go up (a loss just changes the displayed record); win rate can move either way
+        board.promote("wins", wrestler_id)
+        board.invalidate("winrate")
+
+    def add_currency(self, wrestler_id: int, amount: int):
+        board = self._board_for(wrestler_id)
+        if board is None or wrestler_id not in board.stats or not amount:
+            return
+        board.stats[wrestler_id][3] += amount
+        if amount > 0:
+            board.promote("currency", wrestler_id)
+        elif board.contains("currency", wrestler_id):
+            # A spender may drop below someone outside the cached list
+            board.invalidate("currency")
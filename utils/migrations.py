@@ -0,0 +1,163 @@
+"""
+Versioned schema migrations.
+
+The schema version lives in SQLite's `PRAGMA user_version`. Each Migration
+brings the database from version N-1 to N inside one transaction that also
+bumps user_version, so a failed step leaves the database untouched. When the
+database is already current, migrate() costs a single PRAGMA read.
+
+Big data rewrites don't belong in a migration (they would hold the write
+lock for the whole run). A migration enqueues a Backfill instead; backfills
+then run in small batches, one short transaction each, recording their
+progress in `schema_backfills` so an interrupted run resumes where it
+stopped.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set
+
+import aiosqlite
+
+# A backfill batch: (connection, last key done, batch size) -> last key of this batch, or None when finished
+BatchFunc = Callable[[aiosqlite.Connection, int, int], Awaitable[Optional[int]]]
+
+
+class Migration:
+    """One schema version: `apply(db)` runs in the transaction that sets user_version"""
+
+    __slots__ = ("version", "description", "apply")
+
+    def __init__(self, version: int, description: str, apply: Callable[[aiosqlite.Connection], Awaitable[None]]):
+        self.version = version
+        self.description = description
+        self.apply = apply
+
+
+class Backfill:
+    """A chunked data rewrite, enqueued by a migration and run batch by batch"""
+
+    __slots__ = ("name", "description", "batch")
+
+    def __init__(self, name: str, description: str, batch: BatchFunc):
+        self.name = name
+        self.description = description
+        self.batch = batch
+
+
+# ---------- helpers for migration steps ----------
+
+async def table_columns(db: aiosqlite.Connection, table: str) -> Set[str]:
+    async with db.execute(f"PRAGMA table_info({table})") as cursor:
+        return {row[1] for row in await cursor.fetchall()}
+
+
+async def add_column(db: aiosqlite.Connection, table: str, column: str, declaration: str) -> bool:
+    """ALTER TABLE ... ADD COLUMN unless it exists already; True if it was added"""
+    if column in await table_columns(db, table):
+        return False
+    print(f"➕ Adding {table}.{column} column...")
+    await db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+    return True
+
+
+async def enqueue_backfill(db: aiosqlite.Connection, name: str):
+    """Schedule a backfill (from inside a migration) - restarts it if it already ran"""
+    await db.execute(
+        "INSERT OR REPLACE INTO schema_backfills (name, last_key, completed_at) VALUES (?, 0, NULL)",
+        (name,)
+    )
+
+
+class MigrationEngine:
+    """Applies Migrations in version order and runs the Backfills they enqueue"""
+
+    def __init__(self, migrations: Sequence[Migration], backfills: Sequence[Backfill] = ()):
+        self.migrations = sorted(migrations, key=lambda m: m.version)
+        self.backfills: Dict[str, Backfill] = {b.name: b for b in backfills}
+        versions = [m.version for m in self.migrations]
+        if versions != list(range(1, len(versions) + 1)):
+            raise ValueError(f"Migration versions must run 1..N without gaps, got {versions}")
+
+    @property
+    def latest_version(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+
+    async def current_version(self, db: aiosqlite.Connection) -> int:
+        async with db.execute("PRAGMA user_version") as cursor:
+            return (await cursor.fetchone())[0]
+
+    async def migrate(self, db: aiosqlite.Connection) -> int:
+        """Apply every migration newer than the database; returns how many ran"""
+        version = await self.current_version(db)
+        if version >= self.latest_version:
+            return 0
+
+        # Don't fold a caller's pending writes into the first migration
+        await db.commit()
+        applied = 0
+        for migration in self.migrations:
+            if migration.version <= version:
+                continue
+            print(f"🔄 Migration {migration.version}: {migration.description}...")
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                await db.execute("""
+                    CREATE TABLE IF NOT EXISTS schema_backfills (
+                        name TEXT PRIMARY KEY,
+                        last_key INTEGER NOT NULL DEFAULT 0,
+                        completed_at TEXT
+                    )
+                """)
+                await migration.apply(db)
+                await db.execute(f"PRAGMA user_version = {migration.version}")
+                await db.commit()
+            except BaseException:
+                await db.rollback()
+                raise
+            applied += 1
+        print(f"✅ Database schema at version {self.latest_version}")
+        return applied
+
+    async def pending_backfills(self, db: aiosqlite.Connection) -> List[str]:
+        """Names of enqueued backfills that haven't finished"""
+        try:
+            async with db.execute(
+                "SELECT name FROM schema_backfills WHERE completed_at IS NULL ORDER BY rowid"
+            ) as cursor:
+                return [row[0] for row in await cursor.fetchall() if row[0] in self.backfills]
+        except aiosqlite.OperationalError:
+            return []  # No migrations have run yet
+
+    async def run_backfill_batch(self, db: aiosqlite.Connection, name: str, batch_size: int) -> bool:
+        """Run one batch of a backfill in its own transaction; True once the backfill is finished"""
+        backfill = self.backfills[name]
+        await db.commit()
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            async with db.execute("SELECT last_key FROM schema_backfills WHERE name = ?", (name,)) as cursor:
+                row = await cursor.fetchone()
+            last_key = await backfill.batch(db, row[0] if row else 0, batch_size)
+            if last_key is None:
+                await db.execute(
+                    "UPDATE schema_backfills SET completed_at = ? WHERE name = ?",
+                    (datetime.utcnow().isoformat(), name)
+                )
+            else:
+                await db.execute("UPDATE schema_backfills SET last_key = ? WHERE name = ?", (last_key, name))
+            await db.commit()
+        except BaseException:
+            await db.rollback()
+            raise
+        return last_key is None
+
+    async def run_backfills(self, db: aiosqlite.Connection, batch_size: int = 500, pause: float = 0):
+        """Run every pending backfill to completion on one connection (for offline use)"""
+        for name in await self.pending_backfills(db):
+            print(f"📦 Backfill {name}: {self.backfills[name].description}...")
+            batches = 0
+            while not await self.run_backfill_batch(db, name, batch_size):
+                batches += 1
+                if pause:
+                    await asyncio.sleep(pause)
+            print(f"  ✓ {name} finished ({batches} batches)")
@@ -0,0 +1,194 @@
+"""
+Row models for the most-read tables.
+
+Each model keeps its columns in __slots__ instead of a per-row dict, which
+matters for the rosters, championships and events kept in memory. Models
+still behave like the dicts Database used to return (`row['name']`,
+`row.get('level', 1)`, `row['winrate'] = ...`, `dict(row)`), so cogs don't
+need to change. Columns a model doesn't know about (joined or computed
+columns, or ones added by a newer migration) and keys callers add later are
+kept in a small overflow dict that is only created when needed.
+
+Columns listed in a model's _decoders (JSON blobs) keep the raw stored
+value until they are first read; the decoded value then replaces it.
+"""
+
+import json
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from utils.packed_attributes import decode_attributes
+
+
+def _decode_json(raw: Any) -> Any:
+    return json.loads(raw) if raw else raw
+
+
+class Model:
+    """Dict-compatible base for __slots__ row models"""
+
+    __slots__ = ("_extra", "_undecoded")
+    # column -> function turning the stored value into what callers get (run on first read)
+    _decoders: Dict[str, Callable[[Any], Any]] = {}
+    # Filled in for each subclass from its __slots__ and _decoders
+    _fields: Tuple[str, ...] = ()
+    _field_set: frozenset = frozenset()
+    _lazy_bits: Dict[str, int] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(cls.__dict__.get("__slots__", ()))
+        cls._field_set = frozenset(cls._fields)
+        cls._lazy_bits = {name: 1 << i for i, name in enumerate(cls._decoders)}
+
+    def __init__(self, values: Optional[Dict[str, Any]] = None, **kwargs):
+        self._extra = None
+        self._undecoded = 0  # bitmask of _decoders columns still holding their raw value
+        for key, value in (values or {}).items():
+            self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    @classmethod
+    def from_row(cls, row) -> "Model":
+        """Build a model from an aiosqlite.Row (or any mapping)"""
+        model = cls.__new__(cls)
+        model._extra = None
+        model._undecoded = 0
+        field_set, lazy_bits = cls._field_set, cls._lazy_bits
+        for key in row.keys():
+            if key in field_set:
+                object.__setattr__(model, key, row[key])
+                model._undecoded |= lazy_bits.get(key, 0)
+            else:
+                model[key] = row[key]
+        return model
+
+    # ---------- dict compatibility ----------
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            try:
+                value = getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+            if self._undecoded:
+                bit = self._lazy_bits.get(key, 0)
+                if self._undecoded & bit:
+                    value = self._decoders[key](value)
+                    object.__setattr__(self, key, value)
+                    self._undecoded &= ~bit
+            return value
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._field_set:
+            object.__setattr__(self, key, value)
+            if self._undecoded:
+                self._undecoded &= ~self._lazy_bits.get(key, 0)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def is_decoded(self, key: str) -> bool:
+        """False while a lazily decoded column still holds its raw value"""
+        return not self._undecoded & self._lazy_bits.get(key, 0)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> Iterator[str]:
+        for field in self._fields:
+            if hasattr(self, field):
+                yield field
+        if self._extra:
+            yield from self._extra
+
+    __iter__ = keys
+
+    def values(self) -> Iterator[Any]:
+        return (self[key] for key in self.keys())
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return ((key, self[key]) for key in self.keys())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.keys())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Model, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def copy(self) -> "Model":
+        """Shallow copy (like dict.copy())"""
+        model = type(self).__new__(type(self))
+        for field in self._fields:
+            if hasattr(self, field):
+                object.__setattr__(model, field, getattr(self, field))
+        model._extra = dict(self._extra) if self._extra else None
+        model._undecoded = self._undecoded
+        return model
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+
+class Wrestler(Model):
+    __slots__ = (
+        "id", "guild_id", "user_id", "name", "archetype", "weight_class", "persona",
+        "finisher", "signature", "attributes", "personality", "gender", "alignment",
+        "body_type", "height_feet", "height_cm", "appearance", "outfit", "currency",
+        "level", "xp", "wins", "losses", "current_streak", "streak_type",
+        "longest_win_streak", "created_at", "is_retired", "last_daily_claim",
+        "daily_streak", "longest_streak", "last_active", "is_inactive",
+        "last_turn_date", "last_rename_date", "former_names", "personality_traits",
+    )
+    _decoders = {"attributes": decode_attributes, "personality": _decode_json}
+
+
+class Match(Model):
+    __slots__ = (
+        "id", "guild_id", "event_id", "winner_ids", "winner_names", "loser_ids",
+        "loser_names", "match_type", "finish_type", "rating", "championship_id",
+        "match_date", "notes", "event_instance_id",
+    )
+
+
+class Championship(Model):
+    __slots__ = (
+        "id", "guild_id", "name", "description", "gender_requirement",
+        "weight_class_requirement", "is_tag_team", "current_champion_id",
+        "created_at", "is_active", "current_champion_ids",
+    )
+
+
+class TitleReign(Model):
+    __slots__ = (
+        "id", "championship_id", "wrestler_id", "wrestler_name", "reign_number",
+        "won_date", "lost_date", "days_held", "successful_defenses", "is_current",
+    )
+
+
+class EventInstance(Model):
+    __slots__ = (
+        "id", "guild_id", "template_id", "base_name", "full_name", "type",
+        "instance_number", "date", "time", "description", "banner_url", "status",
+        "announcement_message_id", "announcement_channel_id", "created_at",
+        "completed_at",
+    )
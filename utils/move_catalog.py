@@ -0,0 +1,164 @@
+"""
+Move catalog for the wrestler creation and turn flows.
+
+Built once from MOVE_CATEGORIES on first use: the moves of each type and
+category, every move's keyword flags, and its suggestion score for each
+alignment/archetype pair. Filtering moves is then a dict lookup per move
+instead of substring scans, and the suggestions for a whole move type are
+cached, so the turn wizard's move step doesn't recompute anything.
+"""
+
+from functools import lru_cache
+from typing import AbstractSet, Dict, Iterable, List, Tuple
+
+from utils.constants import ARCHETYPES, MOVE_CATEGORIES
+
+MOVE_TYPES = ("Finishers", "Signatures")
+ALIGNMENTS = ("Face", "Heel", "Tweener")
+
+# Move keywords
+HEEL_KEYWORDS = ('choke', 'sleeper', 'guillotine', 'rear naked', 'trap', 'heel', 'behind')
+FACE_KEYWORDS = ('splash', 'press', 'crossbody', 'moonsault', 'elbow drop')
+TECHNICAL_KEYWORDS = ('lock', 'bar', 'crab', 'stretch', 'figure')
+POWER_KEYWORDS = ('slam', 'bomb', 'press', 'gorilla', 'military')
+AERIAL_KEYWORDS = ('diving', 'springboard', 'moonsault', 'splash', 'shooting star', 'top rope')
+
+# Keyword flags (bitmask per move)
+HEEL, FACE, TECHNICAL, POWER, AERIAL = 1, 2, 4, 8, 16
+_FLAG_KEYWORDS = (
+    (HEEL, HEEL_KEYWORDS),
+    (FACE, FACE_KEYWORDS),
+    (TECHNICAL, TECHNICAL_KEYWORDS),
+    (POWER, POWER_KEYWORDS),
+    (AERIAL, AERIAL_KEYWORDS),
+)
+# Archetypes whose style adds to a move's score
+_ARCHETYPE_FLAGS = {"Technical": TECHNICAL, "Powerhouse": POWER, "High Flyer": AERIAL}
+
+# How many moves filter_moves_by_alignment() suggests (at most / at least, if there are enough)
+MAX_SUGGESTIONS = 6
+MIN_SUGGESTIONS = 5
+
+
+def move_flags(move: str) -> int:
+    """Keyword flags for a move name"""
+    move_lower = move.lower()
+    return sum(flag for flag, keywords in _FLAG_KEYWORDS if any(kw in move_lower for kw in keywords))
+
+
+def score_flags(flags: int, alignment: str, archetype: str) -> int:
+    """How well a move with these flags fits a wrestler (higher is better)"""
+    score = 0
+    
+    # Alignment scoring
+    if alignment == "Heel":
+        if flags & HEEL:
+            score += 3
+    elif alignment == "Face":
+        if flags & FACE:
+            score += 3
+        if flags & HEEL:
+            score -= 2
+    
+    # Archetype scoring
+    if flags & _ARCHETYPE_FLAGS.get(archetype, 0):
+        score += 2
+    
+    return score
+
+
+class MoveCatalog:
+    """Read-only indexes over MOVE_CATEGORIES"""
+    
+    def __init__(self, categories):
+        by_type = {move_type: [] for move_type in MOVE_TYPES}
+        self.by_category: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        for category, data in categories.items():
+            for move_type in MOVE_TYPES:
+                moves = tuple(data['moves'].get(move_type, ()))
+                self.by_category[(category, move_type)] = moves
+                by_type[move_type].extend(moves)
+        self.by_type: Dict[str, Tuple[str, ...]] = {t: tuple(moves) for t, moves in by_type.items()}
+        
+        self.flags: Dict[str, int] = {}
+        for moves in self.by_type.values():
+            for move in moves:
+                if move not in self.flags:
+                    self.flags[move] = move_flags(move)
+        
+        # (alignment, archetype) -> {move: score}
+        self.scores: Dict[Tuple[str, str], Dict[str, int]] = {
+            (alignment, archetype): {
+                move: score_flags(flags, alignment, archetype) for move, flags in self.flags.items()
+            }
+            for alignment in ALIGNMENTS
+            for archetype in (*ARCHETYPES, "Balanced")
+        }
+        self._suggestions: Dict[Tuple[str, str, str, bool], Tuple[str, ...]] = {}
+    
+    def is_heel(self, move: str) -> bool:
+        flags = self.flags.get(move)
+        if flags is None:
+            flags = move_flags(move)  # Not a catalog move (e.g. an old custom finisher)
+        return bool(flags & HEEL)
+    
+    def top_moves(self, moves: Iterable[str], alignment: str, archetype: str) -> List[str]:
+        """The best-scoring moves out of `moves` (ties keep their order)"""
+        moves = list(moves)
+        scores = self.scores.get((alignment, archetype)) or self.scores.get((alignment, "Balanced"), {})
+        
+        def score(move: str) -> int:
+            value = scores.get(move)
+            return score_flags(move_flags(move), alignment, archetype) if value is None else value
+        
+        result = sorted(moves, key=score, reverse=True)[:MAX_SUGGESTIONS]
+        if len(result) < MIN_SUGGESTIONS and len(moves) > len(result):
+            remaining = [m for m in moves if m not in result]
+            result.extend(remaining[:MIN_SUGGESTIONS - len(result)])
+        return result
+    
+    def suggestions(
+        self,
+        move_type: str,
+        alignment: str,
+        archetype: str,
+        exclude_heel: bool = False,
+        exclude: AbstractSet[str] = frozenset()
+    ) -> Tuple[str, ...]:
+        """top_moves() over every move of a type, optionally without Heel moves or the moves in `exclude`"""
+        key = (move_type, alignment, archetype, exclude_heel)
+        cached = self._suggestions.get(key)
+        if cached is None:
+            moves = self.by_type[move_type]
+            if exclude_heel:
+                moves = [m for m in moves if not self.flags[m] & HEEL]
+            cached = self._suggestions[key] = tuple(self.top_moves(moves, alignment, archetype))
+        if exclude and not exclude.isdisjoint(cached):
+            # Some suggestions are taken - rank what's left (not cached, `exclude` changes)
+            moves = [
+                m for m in self.by_type[move_type]
+                if m not in exclude and not (exclude_heel and self.flags[m] & HEEL)
+            ]
+            return tuple(self.top_moves(moves, alignment, archetype))
+        return cached
+
+
+@lru_cache(maxsize=1)
+def move_catalog() -> MoveCatalog:
+    """The shared catalog (built on first use)"""
+    return MoveCatalog(MOVE_CATEGORIES)
+
+
+def get_all_moves(move_type: str) -> List[str]:
+    """Get all moves of a type (Finishers or Signatures)"""
+    return list(move_catalog().by_type[move_type])
+
+
+def is_heel_move(move_name: str) -> bool:
+    """Check if a move is a Heel move"""
+    return move_catalog().is_heel(move_name)
+
+
+def filter_moves_by_alignment(available_moves: List[str], alignment: str, archetype: str = "Balanced") -> List[str]:
+    """Filter moves based on alignment and archetype"""
+    return move_catalog().top_moves(available_moves, alignment, archetype)
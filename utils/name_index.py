@@ -0,0 +1,168 @@
+"""
+In-memory name search for autocomplete.
+
+A NameIndex holds the names of one kind of thing (wrestlers, championships,
+event templates, planned events) in one guild. Prefix matches come from a
+trie and are ranked first; other substring matches come from a trigram
+index. Database keeps one index per (guild, kind), loads it on first use
+and updates it when names are created, renamed or removed.
+"""
+
+from typing import Dict, List, Any, Optional, Set, Iterable, Tuple
+
+# Discord shows at most 25 autocomplete choices
+MAX_RESULTS = 25
+
+# Kinds of names that can be indexed
+WRESTLERS = "wrestlers"
+CHAMPIONSHIPS = "championships"
+TEMPLATES = "templates"
+EVENTS = "events"
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.ids: Set[int] = set()  # every entry whose name starts with this node's prefix
+
+
+class NameIndex:
+    """Prefix trie + trigram index over one guild's names of one kind"""
+
+    def __init__(self, entries: Iterable[Dict[str, Any]] = ()):
+        # id -> entry dict ('id', 'name' and any extra fields callers need)
+        self.entries: Dict[int, Dict[str, Any]] = {}
+        self._root = _TrieNode()
+        self._grams: Dict[str, Set[int]] = {}
+        for entry in entries:
+            self.add(entry)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, entry: Dict[str, Any]):
+        """Add an entry, or replace the one with the same id"""
+        if entry['id'] in self.entries:
+            self.remove(entry['id'])
+        entry_id = entry['id']
+        key = entry['name'].lower()
+        self.entries[entry_id] = entry
+
+        node = self._root
+        node.ids.add(entry_id)
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+            node.ids.add(entry_id)
+
+        for gram in _trigrams(key):
+            self._grams.setdefault(gram, set()).add(entry_id)
+
+    def remove(self, entry_id: int):
+        entry = self.entries.pop(entry_id, None)
+        if entry is None:
+            return
+        key = entry['name'].lower()
+
+        node = self._root
+        node.ids.discard(entry_id)
+        path = []
+        for char in key:
+            child = node.children[char]
+            child.ids.discard(entry_id)
+            path.append((node, char, child))
+            node = child
+        # Prune branches nobody uses any more
+        for parent, char, child in reversed(path):
+            if child.ids:
+                break
+            del parent.children[char]
+
+        for gram in _trigrams(key):
+            ids = self._grams.get(gram)
+            if ids is not None:
+                ids.discard(entry_id)
+                if not ids:
+                    del self._grams[gram]
+
+    def rename(self, entry_id: int, name: str):
+        entry = self.entries.get(entry_id)
+        if entry is not None:
+            self.add(dict(entry, name=name))
+
+    def _prefix_ids(self, query: str) -> Set[int]:
+        node = self._root
+        for char in query:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        return node.ids
+
+    def _substring_ids(self, query: str) -> Set[int]:
+        if len(query) < 3:
+            # Too short for trigrams - the names themselves are the index
+            return {e_id for e_id, e in self.entries.items() if query in e['name'].lower()}
+        grams = sorted((self._grams.get(g, set()) for g in _trigrams(query)), key=len)
+        if not grams or not grams[0]:
+            return set()
+        candidates = set.intersection(*grams)
+        # Trigrams can all match without being contiguous - confirm
+        return {e_id for e_id in candidates if query in self.entries[e_id]['name'].lower()}
+
+    def search(self, query: str, limit: int = MAX_RESULTS, where=None) -> List[Dict[str, Any]]:
+        """Names containing `query` (case-insensitive), prefix matches first, then A-Z.
+
+        `where` optionally filters entries (e.g. to one user's wrestlers).
+        """
+        query = query.lower()
+
+        def ranked(ids: Iterable[int]) -> List[Dict[str, Any]]:
+            entries = (self.entries[e_id] for e_id in ids)
+            if where is not None:
+                entries = (e for e in entries if where(e))
+            return sorted(entries, key=lambda e: e['name'].lower())
+
+        prefix_ids = self._prefix_ids(query)
+        results = ranked(prefix_ids)
+        if len(results) < limit and query:
+            results += ranked(self._substring_ids(query) - prefix_ids)
+        return [dict(e) for e in results[:limit]]
+
+
+class NameIndexes:
+    """Every loaded (guild, kind) NameIndex"""
+
+    def __init__(self):
+        self._indexes: Dict[Tuple[int, str], NameIndex] = {}
+
+    def get(self, guild_id: int, kind: str) -> Optional[NameIndex]:
+        return self._indexes.get((guild_id, kind))
+
+    def load(self, guild_id: int, kind: str, entries: Iterable[Dict[str, Any]]) -> NameIndex:
+        index = NameIndex(entries)
+        self._indexes[(guild_id, kind)] = index
+        return index
+
+    # ---------- incremental updates (called after the DB write commits) ----------
+
+    def add(self, guild_id: int, kind: str, entry: Dict[str, Any]):
+        index = self.get(guild_id, kind)
+        if index is not None:
+            index.add(entry)
+
+    def remove(self, kind: str, entry_id: int):
+        for (_, index_kind), index in self._indexes.items():
+            if index_kind == kind and entry_id in index.entries:
+                index.remove(entry_id)
+                return
+
+    def rename(self, kind: str, entry_id: int, name: str):
+        for (_, index_kind), index in self._indexes.items():
+            if index_kind == kind and entry_id in index.entries:
+                index.rename(entry_id, name)
+                return
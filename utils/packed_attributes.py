@@ -0,0 +1,101 @@
+"""
+Packed wrestler attributes.
+
+`wrestlers.attributes` is stored as one unsigned byte per attribute, in
+ATTRIBUTES order (array('B') bytes, ~24 bytes instead of ~600 of JSON).
+PackedAttributes reads a row's bytes through a memoryview without copying
+and behaves like the old {attribute name: value} dict, so cogs keep using
+`wrestler['attributes'].get("Strength", 50)`. Rows still holding JSON text
+(databases not yet migrated) decode to the same view.
+
+SQL_FUNCTIONS are registered on every pooled connection so single attributes
+can be read and changed inside one UPDATE (attr_get/attr_set, by index).
+"""
+
+import json
+from array import array
+from typing import Dict, Iterator, Union, Mapping, MutableMapping
+
+from utils.constants import ATTRIBUTES, DEFAULT_ATTRIBUTE_VALUE
+
+# Attribute name -> byte offset in the packed value
+ATTRIBUTE_INDEX: Dict[str, int] = {name: i for i, name in enumerate(ATTRIBUTES)}
+
+
+def pack_attributes(attributes: Mapping[str, int]) -> bytes:
+    """Pack an {attribute: value} mapping (missing attributes get the default)"""
+    if isinstance(attributes, PackedAttributes):
+        return attributes.to_bytes()
+    return array('B', (attributes.get(name, DEFAULT_ATTRIBUTE_VALUE) for name in ATTRIBUTES)).tobytes()
+
+
+def decode_attributes(raw: Union[bytes, str, None]) -> "PackedAttributes":
+    """View a stored attributes value, packed or legacy JSON text"""
+    if isinstance(raw, str):
+        raw = pack_attributes(json.loads(raw))
+    return PackedAttributes(raw or b"")
+
+
+class PackedAttributes(MutableMapping):
+    """Dict-like view over packed attribute bytes (copied only on first write)"""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview] = b""):
+        self._data = memoryview(data)
+
+    def __getitem__(self, name: str) -> int:
+        index = ATTRIBUTE_INDEX[name]
+        # Values packed before an attribute was added are shorter
+        return self._data[index] if index < len(self._data) else DEFAULT_ATTRIBUTE_VALUE
+
+    def __setitem__(self, name: str, value: int):
+        index = ATTRIBUTE_INDEX[name]
+        if self._data.readonly or index >= len(self._data):
+            data = bytearray(self._data)
+            data.extend([DEFAULT_ATTRIBUTE_VALUE] * (len(ATTRIBUTES) - len(data)))
+            self._data = memoryview(data)
+        self._data[index] = value
+
+    def __delitem__(self, name: str):
+        raise TypeError("attributes can't be removed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(ATTRIBUTES)
+
+    def __len__(self) -> int:
+        return len(ATTRIBUTES)
+
+    def __repr__(self):
+        return f"PackedAttributes({dict(self)!r})"
+
+    def copy(self) -> "PackedAttributes":
+        # Read-only bytes can be shared - whoever writes first makes their own copy
+        return PackedAttributes(self._data if self._data.readonly else self._data.tobytes())
+
+    def to_bytes(self) -> bytes:
+        data = self._data.tobytes()
+        if len(data) < len(ATTRIBUTES):
+            data += bytes([DEFAULT_ATTRIBUTE_VALUE]) * (len(ATTRIBUTES) - len(data))
+        return data
+
+
+# ---------- SQL functions ----------
+
+def attribute_at(raw: Union[bytes, str, None], index: int) -> int:
+    """attr_get(attributes, index): one attribute's value"""
+    return decode_attributes(raw)[ATTRIBUTES[index]]
+
+
+def with_attribute(raw: Union[bytes, str, None], index: int, value: int) -> bytes:
+    """attr_set(attributes, index, value): the packed value with one attribute replaced"""
+    attributes = decode_attributes(raw)
+    attributes[ATTRIBUTES[index]] = value
+    return attributes.to_bytes()
+
+
+# (name, number of arguments, implementation)
+SQL_FUNCTIONS = (
+    ("attr_get", 2, attribute_at),
+    ("attr_set", 3, with_attribute),
+)
@@ -0,0 +1,92 @@
+"""
+In-memory roster cache.
+
+Keeps the active roster (as Wrestler models) of recently used guilds,
+evicting the least recently used guild once the cache holds more than
+`max_wrestlers` rows. Database pushes every changed wrestler
+row into the cache after its write commits, so cached rosters never need a
+re-read.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Iterable
+
+
+class RosterCache:
+    """Decoded active wrestlers per guild, LRU-evicted by total row count"""
+
+    def __init__(self, max_wrestlers: int = 5000):
+        self.max_wrestlers = max_wrestlers
+        # guild_id -> {wrestler_id: decoded row}, least recently used first
+        self._guilds: "OrderedDict[int, Dict[int, Dict[str, Any]]]" = OrderedDict()
+        self._wrestler_guild: Dict[int, int] = {}
+        self.size = 0
+        # Bumped on every wrestler write so a roster read that raced one isn't cached
+        self.generation = 0
+
+    def is_cached(self, guild_id: int) -> bool:
+        return guild_id in self._guilds
+
+    def guild_of(self, wrestler_id: int) -> Optional[int]:
+        """Guild of a cached wrestler (None if its guild isn't cached)"""
+        return self._wrestler_guild.get(wrestler_id)
+
+    def get(self, guild_id: int) -> Optional[Dict[int, Dict[str, Any]]]:
+        roster = self._guilds.get(guild_id)
+        if roster is not None:
+            self._guilds.move_to_end(guild_id)
+        return roster
+
+    def store(self, guild_id: int, rows: Iterable[Dict[str, Any]], generation: int):
+        """Cache a freshly read roster, unless a wrestler write landed since `generation`"""
+        if generation != self.generation:
+            return
+        self.drop(guild_id)
+        roster = {row['id']: row for row in rows}
+        self._guilds[guild_id] = roster
+        for wrestler_id in roster:
+            self._wrestler_guild[wrestler_id] = guild_id
+        self.size += len(roster)
+        self._evict()
+
+    def drop(self, guild_id: int):
+        roster = self._guilds.pop(guild_id, None)
+        if roster is not None:
+            self.size -= len(roster)
+            for wrestler_id in roster:
+                self._wrestler_guild.pop(wrestler_id, None)
+
+    def clear(self):
+        self._guilds.clear()
+        self._wrestler_guild.clear()
+        self.size = 0
+
+    def _evict(self):
+        # Always keep the guild that was just used, even if it alone is over budget
+        while self.size > self.max_wrestlers and len(self._guilds) > 1:
+            guild_id = next(iter(self._guilds))
+            self.drop(guild_id)
+
+    # ---------- write-through ----------
+
+    def touch(self):
+        """Mark that wrestler rows changed (call as soon as the write commits)"""
+        self.generation += 1
+
+    def apply(self, rows: List[Dict[str, Any]]):
+        """Put re-read wrestler rows into their cached guilds (retired rows are removed)"""
+        self.generation += 1
+        for row in rows:
+            roster = self._guilds.get(row['guild_id'])
+            if roster is None:
+                continue
+            if row['is_retired']:
+                if roster.pop(row['id'], None) is not None:
+                    self.size -= 1
+                    self._wrestler_guild.pop(row['id'], None)
+            else:
+                if row['id'] not in roster:
+                    self.size += 1
+                    self._wrestler_guild[row['id']] = row['guild_id']
+                roster[row['id']] = row
+        self._evict()
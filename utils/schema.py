@@ -0,0 +1,621 @@
+"""
+Schema migrations for the bot's database.
+
+Database.initialize() runs SCHEMA.migrate() on startup and then lets the
+enqueued backfills run in the background; `python migrate.py` does both
+offline. To change the schema, append a Migration with the next version
+number (never edit one that has shipped). Steps must tolerate databases that
+were upgraded by the old migrate_*.py scripts, hence add_column() and
+CREATE ... IF NOT EXISTS everywhere.
+"""
+
+import json
+from datetime import datetime
+
+import aiosqlite
+
+from utils.migrations import Migration, Backfill, MigrationEngine, add_column, table_columns, enqueue_backfill
+from utils.packed_attributes import pack_attributes
+
+
+# Secondary indexes for the hot lookups (created by a migration - add a new one when this list changes).
+# (index name, table, indexed columns, partial-index WHERE clause or None)
+INDEXES = [
+    # Roster lookups - almost every roster query filters out retired wrestlers
+    ("idx_wrestlers_active", "wrestlers", "guild_id, user_id", "is_retired = 0"),
+    ("idx_wrestlers_name", "wrestlers", "guild_id, name COLLATE NOCASE", "is_retired = 0"),
+    ("idx_wrestlers_finisher", "wrestlers", "guild_id, finisher", "is_retired = 0"),
+    ("idx_wrestlers_signature", "wrestlers", "guild_id, signature", "is_retired = 0"),
+    ("idx_wrestlers_streak", "wrestlers", "guild_id, streak_type, current_streak DESC", "is_retired = 0"),
+    ("idx_wrestlers_streak_any", "wrestlers", "guild_id, current_streak DESC", "is_retired = 0"),
+    # Match history
+    ("idx_matches_date", "matches", "match_date", None),
+    ("idx_match_participants_wrestler", "match_participants", "wrestler_id, match_date DESC", None),
+    # Championships
+    ("idx_title_reigns_championship", "title_reigns", "championship_id, is_current", None),
+    ("idx_title_reigns_wrestler", "title_reigns", "wrestler_id", None),
+    # Events
+    ("idx_event_instances_template", "event_instances", "guild_id, template_id, instance_number", None),
+    ("idx_event_instances_status", "event_instances", "guild_id, status, date", None),
+    ("idx_event_instance_matches_event", "event_instance_matches", "event_instance_id, match_order", None),
+    # Upgrade queue
+    ("idx_upgrade_queue_pending", "upgrade_queue", "guild_id, timestamp", "processed = 0"),
+    ("idx_upgrade_queue_wrestler", "upgrade_queue", "wrestler_id, timestamp", None),
+    # Phase 4 tables
+    ("idx_rivalries_wrestler1", "rivalries", "guild_id, wrestler1_id, is_active", None),
+    ("idx_rivalries_wrestler2", "rivalries", "guild_id, wrestler2_id, is_active", None),
+    ("idx_turn_history_wrestler", "turn_history", "wrestler_id, turn_date", None),
+]
+
+
+# ---------- version 1 ----------
+
+async def _core_tables(db: aiosqlite.Connection):
+    """Every table up to Phase 3, as Database.initialize() used to create them"""
+    # Server settings table
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS server_settings (
+            guild_id INTEGER PRIMARY KEY,
+            currency_name TEXT DEFAULT 'Dollars',
+            currency_symbol TEXT DEFAULT '$',
+            currency_min INTEGER DEFAULT 5,
+            currency_max INTEGER DEFAULT 15,
+            currency_cooldown INTEGER DEFAULT 60,
+            announcement_channel_id INTEGER,
+            shop_channel_id INTEGER,
+            currency_channels TEXT,
+            max_wrestlers_per_user INTEGER DEFAULT 3,
+            booker_role_id INTEGER,
+            setup_completed INTEGER DEFAULT 0
+        )
+    """)
+    
+    # Wrestlers table
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS wrestlers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            archetype TEXT NOT NULL,
+            weight_class TEXT NOT NULL,
+            persona TEXT NOT NULL,
+            finisher TEXT NOT NULL,
+            signature TEXT NOT NULL,
+            attributes BLOB NOT NULL,
+            personality TEXT,
+            gender TEXT,
+            alignment TEXT,
+            body_type TEXT,
+            height_feet TEXT,
+            height_cm INTEGER,
+            appearance TEXT,
+            outfit TEXT,
+            currency INTEGER DEFAULT 0,
+            level INTEGER DEFAULT 1,
+            xp INTEGER DEFAULT 0,
+            wins INTEGER DEFAULT 0,
+            losses INTEGER DEFAULT 0,
+            current_streak INTEGER DEFAULT 0,
+            streak_type TEXT,
+            longest_win_streak INTEGER DEFAULT 0,
+            created_at TEXT NOT NULL,
+            is_retired INTEGER DEFAULT 0,
+            UNIQUE(guild_id, user_id, name)
+        )
+    """)
+    
+    # Currency tracking for cooldowns
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS currency_cooldowns (
+            guild_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            last_earned TEXT NOT NULL,
+            PRIMARY KEY (guild_id, user_id)
+        )
+    """)
+    
+    # Upgrade queue for admins
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS upgrade_queue (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            wrestler_id INTEGER NOT NULL,
+            wrestler_name TEXT NOT NULL,
+            attribute TEXT NOT NULL,
+            amount INTEGER NOT NULL,
+            old_value INTEGER,
+            new_value INTEGER,
+            timestamp TEXT NOT NULL,
+            processed INTEGER DEFAULT 0
+        )
+    """)
+    
+    # User wrestler limits (overrides)
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS user_wrestler_limits (
+            guild_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            max_wrestlers INTEGER NOT NULL,
+            PRIMARY KEY (guild_id, user_id)
+        )
+    """)
+    
+    # ========== PHASE 2 TABLES ==========
+    
+    # Matches table - stores all match results
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS matches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            event_id INTEGER,
+            winner_ids TEXT NOT NULL,
+            winner_names TEXT NOT NULL,
+            loser_ids TEXT NOT NULL,
+            loser_names TEXT NOT NULL,
+            match_type TEXT NOT NULL,
+            finish_type TEXT NOT NULL,
+            rating REAL,
+            championship_id INTEGER,
+            match_date TEXT NOT NULL,
+            notes TEXT,
+            FOREIGN KEY (championship_id) REFERENCES championships(id),
+            FOREIGN KEY (event_id) REFERENCES events(id)
+        )
+    """)
+    
+    # Match participants - one row per wrestler per match, so history is an index lookup
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS match_participants (
+            match_id INTEGER NOT NULL,
+            wrestler_id INTEGER NOT NULL,
+            guild_id INTEGER NOT NULL,
+            is_winner INTEGER NOT NULL,
+            match_date TEXT NOT NULL,
+            PRIMARY KEY (match_id, wrestler_id),
+            FOREIGN KEY (match_id) REFERENCES matches(id),
+            FOREIGN KEY (wrestler_id) REFERENCES wrestlers(id)
+        )
+    """)
+    
+    # Championships table - defines all titles
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS championships (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT,
+            gender_requirement TEXT,
+            weight_class_requirement TEXT,
+            is_tag_team INTEGER DEFAULT 0,
+            current_champion_id INTEGER,
+            created_at TEXT NOT NULL,
+            is_active INTEGER DEFAULT 1,
+            UNIQUE(guild_id, name)
+        )
+    """)
+    
+    # Title reigns table - tracks championship history
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS title_reigns (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            championship_id INTEGER NOT NULL,
+            wrestler_id INTEGER NOT NULL,
+            wrestler_name TEXT NOT NULL,
+            reign_number INTEGER NOT NULL,
+            won_date TEXT NOT NULL,
+            lost_date TEXT,
+            days_held INTEGER DEFAULT 0,
+            successful_defenses INTEGER DEFAULT 0,
+            is_current INTEGER DEFAULT 1,
+            FOREIGN KEY (championship_id) REFERENCES championships(id),
+            FOREIGN KEY (wrestler_id) REFERENCES wrestlers(id)
+        )
+    """)
+    
+    # Title divisions - assigns wrestlers to title divisions
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS title_divisions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            championship_id INTEGER NOT NULL,
+            wrestler_id INTEGER NOT NULL,
+            wrestler_name TEXT NOT NULL,
+            assigned_date TEXT NOT NULL,
+            is_active INTEGER DEFAULT 1,
+            FOREIGN KEY (championship_id) REFERENCES championships(id),
+            FOREIGN KEY (wrestler_id) REFERENCES wrestlers(id),
+            UNIQUE(championship_id, wrestler_id)
+        )
+    """)
+    
+    # Division rankings - point-based contender system
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS division_rankings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            championship_id INTEGER NOT NULL,
+            wrestler_id INTEGER NOT NULL,
+            wrestler_name TEXT NOT NULL,
+            points INTEGER DEFAULT 0,
+            wins INTEGER DEFAULT 0,
+            losses INTEGER DEFAULT 0,
+            last_updated TEXT NOT NULL,
+            FOREIGN KEY (championship_id) REFERENCES championships(id),
+            FOREIGN KEY (wrestler_id) REFERENCES wrestlers(id),
+            UNIQUE(championship_id, wrestler_id)
+        )
+    """)
+    
+    # Events table - stores shows/PPVs
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            event_date TEXT NOT NULL,
+            description TEXT,
+            announcement_message_id INTEGER,
+            is_completed INTEGER DEFAULT 0,
+            created_at TEXT NOT NULL,
+            UNIQUE(guild_id, name, event_date)
+        )
+    """)
+    
+    # Event matches - planned match card
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS event_matches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id INTEGER NOT NULL,
+            match_order INTEGER,
+            wrestler1_id INTEGER,
+            wrestler1_name TEXT,
+            wrestler2_id INTEGER,
+            wrestler2_name TEXT,
+            match_type TEXT NOT NULL,
+            championship_id INTEGER,
+            stipulation TEXT,
+            is_open_spot INTEGER DEFAULT 0,
+            open_spots_count INTEGER DEFAULT 0,
+            open_spot_description TEXT,
+            match_result_id INTEGER,
+            FOREIGN KEY (event_id) REFERENCES events(id),
+            FOREIGN KEY (wrestler1_id) REFERENCES wrestlers(id),
+            FOREIGN KEY (wrestler2_id) REFERENCES wrestlers(id),
+            FOREIGN KEY (championship_id) REFERENCES championships(id),
+            FOREIGN KEY (match_result_id) REFERENCES matches(id)
+        )
+    """)
+    
+    # Event applications - users apply for open spots
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS event_applications (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_match_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            wrestler_id INTEGER NOT NULL,
+            wrestler_name TEXT NOT NULL,
+            application_date TEXT NOT NULL,
+            is_accepted INTEGER DEFAULT 0,
+            FOREIGN KEY (event_match_id) REFERENCES event_matches(id),
+            FOREIGN KEY (wrestler_id) REFERENCES wrestlers(id),
+            UNIQUE(event_match_id, wrestler_id)
+        )
+    """)
+    
+    # ==================== PHASE 3 TABLES ====================
+    
+    # Event Templates - reusable show/event templates
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS event_templates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            type TEXT NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT,
+            default_time TEXT,
+            announcement_channel_id INTEGER,
+            banner_url TEXT,
+            created_at TEXT NOT NULL,
+            UNIQUE(guild_id, name)
+        )
+    """)
+    
+    # Event Instances - specific occurrences with auto-numbering  
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS event_instances (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            template_id INTEGER,
+            base_name TEXT NOT NULL,
+            full_name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            instance_number INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            time TEXT,
+            description TEXT,
+            banner_url TEXT,
+            status TEXT DEFAULT 'planned',
+            announcement_message_id INTEGER,
+            announcement_channel_id INTEGER,
+            created_at TEXT NOT NULL,
+            completed_at TEXT,
+            FOREIGN KEY (template_id) REFERENCES event_templates(id)
+        )
+    """)
+    
+    # Event Instance Matches - match card
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS event_instance_matches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_instance_id INTEGER NOT NULL,
+            match_order INTEGER NOT NULL,
+            match_type TEXT NOT NULL,
+            championship_id INTEGER,
+            participants TEXT NOT NULL,
+            is_open_spot INTEGER DEFAULT 0,
+            spots_available INTEGER,
+            spots_filled INTEGER DEFAULT 0,
+            open_spot_description TEXT,
+            is_main_event INTEGER DEFAULT 0,
+            status TEXT DEFAULT 'pending',
+            match_id INTEGER,
+            FOREIGN KEY (event_instance_id) REFERENCES event_instances(id),
+            FOREIGN KEY (championship_id) REFERENCES championships(id),
+            FOREIGN KEY (match_id) REFERENCES matches(id)
+        )
+    """)
+    
+    # Event Instance Applications - user applications
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS event_instance_applications (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_instance_match_id INTEGER NOT NULL,
+            wrestler_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            applied_at TEXT NOT NULL,
+            status TEXT DEFAULT 'accepted',
+            FOREIGN KEY (event_instance_match_id) REFERENCES event_instance_matches(id),
+            FOREIGN KEY (wrestler_id) REFERENCES wrestlers(id),
+            UNIQUE(event_instance_match_id, wrestler_id)
+        )
+    """)
+
+
+# ---------- version 2 ----------
+
+async def _phase_four(db: aiosqlite.Connection):
+    """Level/daily/inactivity/turn columns, rivalries and turn history (the old migrate_*.py scripts)"""
+    # Level system and daily rewards
+    await add_column(db, "wrestlers", "level", "INTEGER DEFAULT 1")
+    await add_column(db, "wrestlers", "xp", "INTEGER DEFAULT 0")
+    await add_column(db, "wrestlers", "last_daily_claim", "TEXT")
+    await add_column(db, "wrestlers", "daily_streak", "INTEGER DEFAULT 0")
+    await add_column(db, "wrestlers", "longest_streak", "INTEGER DEFAULT 0")
+    
+    # Per-user wrestler limits: the table's limit column used to be called max_wrestlers
+    limit_columns = await table_columns(db, "user_wrestler_limits")
+    if "wrestler_limit" not in limit_columns:
+        print("➕ Renaming user_wrestler_limits.max_wrestlers to wrestler_limit...")
+        await db.execute("DROP TABLE IF EXISTS user_wrestler_limits_new")
+        await db.execute("""
+            CREATE TABLE user_wrestler_limits_new (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                wrestler_limit INTEGER NOT NULL,
+                UNIQUE(guild_id, user_id)
+            )
+        """)
+        await db.execute("""
+            INSERT INTO user_wrestler_limits_new (guild_id, user_id, wrestler_limit)
+            SELECT guild_id, user_id, max_wrestlers FROM user_wrestler_limits
+        """)
+        await db.execute("DROP TABLE user_wrestler_limits")
+        await db.execute("ALTER TABLE user_wrestler_limits_new RENAME TO user_wrestler_limits")
+    await add_column(db, "server_settings", "default_wrestler_limit", "INTEGER DEFAULT 1")
+    
+    # Tag team champions: current_champion_ids is a JSON array
+    if await add_column(db, "championships", "current_champion_ids", "TEXT"):
+        async with db.execute(
+            "SELECT id, current_champion_id FROM championships WHERE current_champion_id IS NOT NULL"
+        ) as cursor:
+            champs = await cursor.fetchall()
+        await db.executemany(
+            "UPDATE championships SET current_champion_ids = ? WHERE id = ?",
+            [(json.dumps([champion_id]), champ_id) for champ_id, champion_id in champs]
+        )
+    await add_column(db, "matches", "event_instance_id", "INTEGER")
+    
+    # Inactivity system
+    if await add_column(db, "wrestlers", "last_active", "TEXT"):
+        await db.execute(
+            "UPDATE wrestlers SET last_active = ? WHERE last_active IS NULL",
+            (datetime.utcnow().isoformat(),)
+        )
+    await add_column(db, "wrestlers", "is_inactive", "INTEGER DEFAULT 0")
+    await add_column(db, "server_settings", "inactivity_days", "INTEGER DEFAULT 30")
+    await add_column(db, "server_settings", "warning_days", "INTEGER DEFAULT 25")
+    await add_column(db, "server_settings", "inactivity_log_channel_id", "INTEGER")
+    
+    # Wrestler changes (turns and renames)
+    await add_column(db, "wrestlers", "last_turn_date", "TEXT")
+    await add_column(db, "wrestlers", "last_rename_date", "TEXT")
+    await add_column(db, "wrestlers", "former_names", "TEXT DEFAULT '[]'")
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS turn_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            wrestler_id INTEGER NOT NULL,
+            old_alignment TEXT NOT NULL,
+            new_alignment TEXT NOT NULL,
+            old_persona TEXT NOT NULL,
+            new_persona TEXT NOT NULL,
+            turn_date TEXT NOT NULL,
+            FOREIGN KEY (wrestler_id) REFERENCES wrestlers(id)
+        )
+    """)
+    await add_column(db, "server_settings", "turn_cooldown_days", "INTEGER DEFAULT 30")
+    await add_column(db, "server_settings", "wrestler_changes_channel_id", "INTEGER")
+    if await add_column(db, "wrestlers", "personality_traits", "TEXT"):
+        await db.execute("UPDATE wrestlers SET personality_traits = personality WHERE personality_traits IS NULL")
+    
+    # Rivalries
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS rivalries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            wrestler1_id INTEGER NOT NULL,
+            wrestler2_id INTEGER NOT NULL,
+            matches_fought INTEGER DEFAULT 0,
+            wrestler1_wins INTEGER DEFAULT 0,
+            wrestler2_wins INTEGER DEFAULT 0,
+            created_date TEXT NOT NULL,
+            last_match_date TEXT,
+            is_active INTEGER DEFAULT 1,
+            FOREIGN KEY (wrestler1_id) REFERENCES wrestlers(id),
+            FOREIGN KEY (wrestler2_id) REFERENCES wrestlers(id)
+        )
+    """)
+
+
+# ---------- version 3 ----------
+
+async def _win_streaks(db: aiosqlite.Connection):
+    """Streak columns, computed by replaying match history (the old migrate_streaks.py)"""
+    added = False
+    added |= await add_column(db, "wrestlers", "current_streak", "INTEGER DEFAULT 0")
+    added |= await add_column(db, "wrestlers", "streak_type", "TEXT")
+    added |= await add_column(db, "wrestlers", "longest_win_streak", "INTEGER DEFAULT 0")
+    if not added:
+        return
+    
+    streaks = {}  # wrestler_id -> [current_streak, streak_type, longest_win_streak]
+    async with db.execute(
+        "SELECT winner_ids, loser_ids FROM matches ORDER BY match_date ASC, id ASC"
+    ) as cursor:
+        async for winner_ids, loser_ids in cursor:
+            for w_id in json.loads(winner_ids or '[]'):
+                current, kind, longest = streaks.get(w_id, [0, None, 0])
+                current = current + 1 if kind == 'W' else 1
+                streaks[w_id] = [current, 'W', max(longest, current)]
+            for l_id in json.loads(loser_ids or '[]'):
+                current, kind, longest = streaks.get(l_id, [0, None, 0])
+                current = current + 1 if kind == 'L' else 1
+                streaks[l_id] = [current, 'L', longest]
+    await db.executemany(
+        "UPDATE wrestlers SET current_streak = ?, streak_type = ?, longest_win_streak = ? WHERE id = ?",
+        [(current, kind, longest, w_id) for w_id, (current, kind, longest) in streaks.items()]
+    )
+
+
+# ---------- version 4 ----------
+
+async def _match_participants(db: aiosqlite.Connection):
+    """Relational match participants, filled in from the JSON winner/loser lists"""
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS match_participants (
+            match_id INTEGER NOT NULL,
+            wrestler_id INTEGER NOT NULL,
+            guild_id INTEGER NOT NULL,
+            is_winner INTEGER NOT NULL,
+            match_date TEXT NOT NULL,
+            PRIMARY KEY (match_id, wrestler_id),
+            FOREIGN KEY (match_id) REFERENCES matches(id),
+            FOREIGN KEY (wrestler_id) REFERENCES wrestlers(id)
+        )
+    """)
+    await enqueue_backfill(db, "match_participants")
+
+
+async def _backfill_match_participants(db: aiosqlite.Connection, last_id: int, batch_size: int):
+    async with db.execute("""
+        SELECT id, guild_id, winner_ids, loser_ids, match_date
+        FROM matches
+        WHERE id > ?
+        ORDER BY id
+        LIMIT ?
+    """, (last_id, batch_size)) as cursor:
+        matches = await cursor.fetchall()
+    if not matches:
+        return None
+    
+    rows = []
+    for match_id, guild_id, winner_ids, loser_ids, match_date in matches:
+        for w_id in json.loads(winner_ids or '[]'):
+            rows.append((match_id, w_id, guild_id, 1, match_date))
+        for l_id in json.loads(loser_ids or '[]'):
+            rows.append((match_id, l_id, guild_id, 0, match_date))
+    await db.executemany("""
+        INSERT OR IGNORE INTO match_participants
+        (match_id, wrestler_id, guild_id, is_winner, match_date)
+        VALUES (?, ?, ?, ?, ?)
+    """, rows)
+    return matches[-1][0]
+
+
+# ---------- version 5 ----------
+
+async def _packed_attributes(db: aiosqlite.Connection):
+    """Wrestler attributes as packed bytes instead of JSON text (rows are converted by a backfill)"""
+    await enqueue_backfill(db, "packed_attributes")
+
+
+async def _backfill_packed_attributes(db: aiosqlite.Connection, last_id: int, batch_size: int):
+    async with db.execute(
+        "SELECT id, attributes FROM wrestlers WHERE id > ? AND typeof(attributes) = 'text' ORDER BY id LIMIT ?",
+        (last_id, batch_size)
+    ) as cursor:
+        rows = await cursor.fetchall()
+    if not rows:
+        return None
+    await db.executemany(
+        "UPDATE wrestlers SET attributes = ? WHERE id = ?",
+        [(pack_attributes(json.loads(attributes)), wrestler_id) for wrestler_id, attributes in rows]
+    )
+    return rows[-1][0]
+
+
+# ---------- version 6 ----------
+
+async def create_indexes(db: aiosqlite.Connection):
+    """Create every index in INDEXES whose table exists (safe to run repeatedly)"""
+    async with db.execute("SELECT name FROM sqlite_master WHERE type = 'table'") as cursor:
+        tables = {row[0] for row in await cursor.fetchall()}
+    
+    for name, table, columns, where in INDEXES:
+        if table not in tables:
+            continue
+        sql = f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns})"
+        if where:
+            sql += f" WHERE {where}"
+        await db.execute(sql)
+
+
+# ---------- version 7 ----------
+
+async def _bot_state(db: aiosqlite.Connection):
+    """Key/value store for bot-wide state (e.g. the synced command tree fingerprint)"""
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS bot_state (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
+
+
+SCHEMA = MigrationEngine(
+    migrations=[
+        Migration(1, "core tables", _core_tables),
+        Migration(2, "phase 4 columns and tables", _phase_four),
+        Migration(3, "win/loss streaks", _win_streaks),
+        Migration(4, "match participants", _match_participants),
+        Migration(5, "packed wrestler attributes", _packed_attributes),
+        Migration(6, "secondary indexes", create_indexes),
+        Migration(7, "bot state", _bot_state),
+    ],
+    backfills=[
+        Backfill("match_participants", "copy JSON match participants into match_participants", _backfill_match_participants),
+        Backfill("packed_attributes", "convert JSON attributes to packed bytes", _backfill_packed_attributes),
+    ]
+)
@@ -0,0 +1,57 @@
+"""
+Request coalescing ("singleflight") for identical concurrent reads.
+
+While a read is in flight, every other caller asking for the same key waits
+for it instead of running its own query. Results handed to those waiters are
+shallow copies, so one caller changing its rows can't affect another.
+"""
+
+import asyncio
+from typing import Dict, Any, Awaitable, Callable, Hashable
+
+from utils.models import Model
+
+
+def _share(result: Any) -> Any:
+    """Copy a query result for a caller that didn't run the query"""
+    if isinstance(result, list):
+        return [_share(item) if isinstance(item, (dict, Model)) else item for item in result]
+    if isinstance(result, dict):
+        return dict(result)
+    if isinstance(result, Model):
+        return result.copy()
+    if isinstance(result, tuple):
+        return tuple(_share(item) for item in result)
+    return result
+
+
+class SingleFlight:
+    """Runs one query per key at a time and shares its result"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0       # every do() call
+        self.executed = 0    # calls that ran the query
+        self.coalesced = 0   # calls that waited on someone else's query
+
+    async def do(self, key: Hashable, query: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            # shield: a waiter giving up must not cancel everyone else's query
+            return _share(await asyncio.shield(task))
+
+        self.executed += 1
+        task = asyncio.ensure_future(query())
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'calls': self.calls,
+            'executed': self.executed,
+            'coalesced': self.coalesced,
+            'in_flight': len(self._inflight)
+        }
@@ -0,0 +1,57 @@
+"""
+Import-time breakdown for `python bot.py --profile-startup`.
+
+Imports the given modules in a fresh interpreter with `-X importtime`, so
+the numbers are a real cold start (nothing already in sys.modules), and
+turns its report into per-module self/cumulative times.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Sequence
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def measure_imports(modules: Sequence[str]) -> List[ImportTiming]:
+    """Import `modules` in a child interpreter and return the time spent on every module it imported"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "; ".join(f"import {name}" for name in modules)],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {', '.join(modules)} failed:\n{result.stderr[-2000:]}")
+    
+    timings = []
+    for line in result.stderr.splitlines():
+        # "import time:       412 |       1893 |   discord.ext.commands"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings.append(ImportTiming(name.strip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+def print_import_breakdown(timings: List[ImportTiming], modules: Sequence[str], limit: int = 20):
+    """Print the requested modules' cumulative times and the slowest modules overall"""
+    by_name: Dict[str, ImportTiming] = {t.module: t for t in timings}
+    total_us = sum(t.self_us for t in timings)
+    
+    print(f"📦 Imported {len(timings)} modules in {total_us / 1000:.0f} ms")
+    for name in modules:
+        timing = by_name.get(name)
+        if timing is None:
+            print(f"  {name:<28} (already imported by an earlier module)")
+        else:
+            print(f"  {name:<28} {timing.cumulative_us / 1000:>8.1f} ms")
+    
+    print(f"\n🐢 Slowest {limit} modules (own time):")
+    for timing in sorted(timings, key=lambda t: t.self_us, reverse=True)[:limit]:
+        print(f"  {timing.module:<40} {timing.self_us / 1000:>8.1f} ms")
@@ -0,0 +1,84 @@
+"""
+In-memory registry of the finishers and signatures already used in a guild.
+
+Finishers and signatures are unique per guild among active wrestlers, and
+the move pickers need to hide every taken move out of the whole catalog.
+Database loads a guild's taken moves with one query on first use and then
+keeps them current as wrestlers are created, retired or change moves, so
+checking a move is a set lookup instead of a COUNT(*) over wrestlers.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, Set, Tuple
+
+FINISHER = "finisher"
+SIGNATURE = "signature"
+
+
+class TakenMoves:
+    """Every loaded guild's taken finishers and signatures"""
+
+    def __init__(self):
+        # guild_id -> move type -> move -> number of active wrestlers using it
+        self._guilds: Dict[int, Dict[str, Counter]] = {}
+        # wrestler_id -> (guild_id, finisher, signature), for loaded guilds only
+        self._wrestlers: Dict[int, Tuple[int, str, str]] = {}
+
+    def is_loaded(self, guild_id: int) -> bool:
+        return guild_id in self._guilds
+
+    def load(self, guild_id: int, rows: Iterable[Tuple[int, str, str]]):
+        """Replace a guild's moves with (wrestler_id, finisher, signature) rows of its active wrestlers"""
+        self.forget(guild_id)
+        self._guilds[guild_id] = {FINISHER: Counter(), SIGNATURE: Counter()}
+        for wrestler_id, finisher, signature in rows:
+            self.add(guild_id, wrestler_id, finisher, signature)
+
+    def forget(self, guild_id: int):
+        self._guilds.pop(guild_id, None)
+        for wrestler_id in [w_id for w_id, entry in self._wrestlers.items() if entry[0] == guild_id]:
+            del self._wrestlers[wrestler_id]
+
+    def is_taken(self, guild_id: int, move: str, move_type: str) -> bool:
+        """Whether an active wrestler uses the move (the guild must be loaded)"""
+        return self._guilds[guild_id][move_type][move] > 0
+
+    def moves(self, guild_id: int, move_type: str) -> Set[str]:
+        """A copy of the guild's taken moves of one type (the guild must be loaded)"""
+        return set(self._guilds[guild_id][move_type])
+
+    # ---------- incremental updates (called after the DB write commits) ----------
+
+    def add(self, guild_id: int, wrestler_id: int, finisher: str, signature: str):
+        guild = self._guilds.get(guild_id)
+        if guild is None:
+            return
+        self.remove(wrestler_id)
+        guild[FINISHER][finisher] += 1
+        guild[SIGNATURE][signature] += 1
+        self._wrestlers[wrestler_id] = (guild_id, finisher, signature)
+
+    def remove(self, wrestler_id: int):
+        entry = self._wrestlers.pop(wrestler_id, None)
+        if entry is None:
+            return
+        guild_id, finisher, signature = entry
+        self._release(guild_id, FINISHER, finisher)
+        self._release(guild_id, SIGNATURE, signature)
+
+    def set_move(self, wrestler_id: int, move_type: str, move: str):
+        """A wrestler changed their finisher or signature"""
+        entry = self._wrestlers.get(wrestler_id)
+        if entry is None:
+            return
+        guild_id, finisher, signature = entry
+        if move_type == FINISHER:
+            self.add(guild_id, wrestler_id, move, signature)
+        else:
+            self.add(guild_id, wrestler_id, finisher, move)
+
+    def _release(self, guild_id: int, move_type: str, move: str):
+        counts = self._guilds[guild_id][move_type]
+        counts[move] -= 1
+        if counts[move] <= 0:
+            del counts[move]  # keep the keys equal to the taken set